@@ -24,3 +24,6 @@ def me():
 # include documents router at the very bottom
 from app.api.admin_documents import router as admin_docs_router
 admin_router.include_router(admin_docs_router)
+
+from app.api.admin_metrics import router as admin_metrics_router
+admin_router.include_router(admin_metrics_router)
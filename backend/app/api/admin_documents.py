@@ -4,9 +4,13 @@ from datetime import datetime, timezone
 
 import boto3
 from bson import ObjectId
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile
 
 from app.core.db import db
+from app.core.counters import document_counts
+from app.core.pagination import MAX_PAGE_SIZE, fetch_page, set_page_headers
 from app.api.admin_auth import require_admin
 
 router = APIRouter()
@@ -67,16 +71,23 @@ async def upload_document(
     }
 
     res = await db.documents.insert_one(doc)
+    await document_counts.adjust(None, 1)
     doc["_id"] = str(res.inserted_id)
     return doc
 
 
 @router.get("/documents")
-async def list_documents(_: str = Depends(require_admin)):
-    items = []
-    async for d in db.documents.find({}).sort("created_at", -1):
+async def list_documents(
+    response: Response,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    _: str = Depends(require_admin),
+):
+    # Newest first; _id order matches created_at order
+    items, next_cursor = await fetch_page(db.documents, {}, limit, after, newest_first=True, keep_id=True)
+    for d in items:
         d["_id"] = str(d["_id"])
-        items.append(d)
+    set_page_headers(response, next_cursor, await document_counts.get())
     return items
 
 
@@ -112,4 +123,5 @@ async def delete_document(doc_id: str, _: str = Depends(require_admin)):
 
     s3.delete_object(Bucket=S3_BUCKET, Key=doc["key"])
     await db.documents.delete_one({"_id": oid})
+    await document_counts.adjust(None, -1)
     return {"ok": True}
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+
+from app.api.admin_auth import require_admin
+from app.core.db import command_counter
+from app.core.passwords import password_hasher
+from app.core.work_queue import score_recalculation_queue
+from app.dependencies.auth import user_cache
+from app.dependencies.business import business_cache
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics(_: str = Depends(require_admin)):
+    return {
+        "user_cache": user_cache.stats(),
+        "business_cache": business_cache.stats(),
+        "password_hashing": password_hasher.stats(),
+        "mongo_commands": command_counter.stats(),
+        "score_recalculation": score_recalculation_queue.stats(),
+    }
@@ -0,0 +1,248 @@
+# backend/app/core/catalog.py
+
+import json
+import os
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+BUNDLED_CATALOG_PATH = DATA_DIR / "compliance_catalog.json"
+# Point at another file to ship catalog changes without a code deploy
+CATALOG_PATH = Path(os.environ.get("COMPLIANCE_CATALOG_PATH", BUNDLED_CATALOG_PATH))
+SCHEMA_PATH = DATA_DIR / "compliance_catalog.schema.json"
+
+DEFAULT_KEY = "_default"
+REFERENCE_LISTS = ("nations", "business_sizes", "document_categories", "compliance_item_types")
+
+# Required fields and their types, checked on every load. The JSON Schema in SCHEMA_PATH is
+# the full contract; see validate_catalog_data.
+SECTOR_FIELDS = {"id": str, "name": str, "industry": str, "regulator": str}
+DOCUMENT_FIELDS = {"id": str, "title": str, "category": str, "description": str, "is_mandatory": bool, "version": str}
+REQUIREMENT_FIELDS = {"type": str, "title": str, "description": str, "renewal_months": (int, type(None)), "mandatory": bool}
+ITEM_FIELDS = {"key": str, "title": str, "type": str, "category": str, "required": bool}
+
+
+class CatalogError(ValueError):
+    """Raised at startup when the reference data is malformed."""
+
+
+def _freeze_rows(rows: Iterable[dict], fields: Mapping[str, type], id_field: str, source: str) -> Tuple[Mapping, ...]:
+    """Check rows and return them as read-only mappings, rejecting missing or mistyped fields and duplicate ids"""
+    frozen = []
+    seen = set()
+    for n, row in enumerate(rows):
+        missing = [field for field in fields if field not in row]
+        if missing:
+            raise CatalogError(f"{source}[{n}] is missing {', '.join(missing)}")
+        mistyped = [field for field, types in fields.items() if not isinstance(row[field], types)]
+        if mistyped:
+            raise CatalogError(f"{source}[{n}] has the wrong type for {', '.join(mistyped)}")
+        if row[id_field] in seen:
+            raise CatalogError(f"{source} has duplicate {id_field} {row[id_field]!r}")
+        seen.add(row[id_field])
+        frozen.append(MappingProxyType(dict(row)))
+    return tuple(frozen)
+
+
+def _timestamp(value: str, source: str) -> str:
+    """Normalise an ISO 8601 timestamp to UTC, the form the API renders dates in"""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise CatalogError(f"{source} is not an ISO 8601 timestamp: {value!r}")
+    if parsed.tzinfo is None:
+        raise CatalogError(f"{source} has no timezone: {value!r}")
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _index(rows: Tuple[Mapping, ...], id_field: str) -> Mapping[str, Mapping]:
+    return MappingProxyType({row[id_field]: row for row in rows})
+
+
+@dataclass(frozen=True)
+class SectorCatalog:
+    """Document library and staff requirements for one business sector"""
+    sector_id: str
+    documents: Tuple[Mapping, ...]
+    documents_by_id: Mapping[str, Mapping]
+    document_categories: Tuple[str, ...]
+    mandatory_document_count: int
+    employee_requirements: Tuple[Mapping, ...]
+    requirements_by_type: Mapping[str, Mapping]
+    requirement_types: Tuple[Mapping, ...]  # the public {type, title, description} rows
+
+
+@dataclass(frozen=True)
+class IndustryCatalog:
+    """Compliance items generated for businesses of one industry"""
+    industry_id: str
+    name: str
+    items: Tuple[Mapping, ...]
+    items_by_key: Mapping[str, Mapping]
+    categories: Tuple[str, ...]
+    required_count: int
+
+
+class ComplianceCatalog:
+    """Immutable, pre-indexed view of the compliance reference data.
+
+    Built once per process by load_catalog(); every lookup is a dict access. Unknown
+    sectors and industries resolve to the defaults, as the raw tables always did.
+    """
+
+    def __init__(self, version: str, released_at: str, sectors: Mapping[str, SectorCatalog],
+                 industries: Mapping[str, IndustryCatalog], uk_sectors: Tuple[Mapping, ...], reference: Mapping[str, Tuple]):
+        self.version = version
+        self.released_at = released_at
+        self._sectors = sectors
+        self._industries = industries
+        self.uk_sectors = uk_sectors
+        self.uk_sectors_by_id = _index(uk_sectors, "id")
+        self.reference = reference
+
+    def sector(self, sector_id: str) -> SectorCatalog:
+        return self._sectors.get(sector_id) or self._sectors[DEFAULT_KEY]
+
+    def industry(self, industry_id: str) -> IndustryCatalog:
+        return self._industries.get(industry_id) or self._industries[DEFAULT_KEY]
+
+    @property
+    def sector_ids(self) -> Tuple[str, ...]:
+        return tuple(key for key in self._sectors if key != DEFAULT_KEY)
+
+    @property
+    def industry_ids(self) -> Tuple[str, ...]:
+        return tuple(key for key in self._industries if key != DEFAULT_KEY)
+
+
+def _build_sector(sector_id: str, documents: List[dict], requirements: List[dict], released_at: str) -> SectorCatalog:
+    # A document without its own last_updated was last changed in this catalog release
+    documents = _freeze_rows((
+        {**doc, "last_updated": _timestamp(doc.get("last_updated", released_at), f"documents[{sector_id}].{doc.get('id')}")}
+        for doc in documents
+    ), DOCUMENT_FIELDS, "id", f"documents[{sector_id}]")
+    # A business changing sector keeps checklist progress on documents matched by category and title
+    titles = [(doc["category"], doc["title"]) for doc in documents]
+    if len(set(titles)) != len(titles):
+        raise CatalogError(f"documents[{sector_id}] has two documents with the same category and title")
+    requirements = _freeze_rows(requirements, REQUIREMENT_FIELDS, "type", f"employee_requirements[{sector_id}]")
+    return SectorCatalog(
+        sector_id=sector_id,
+        documents=documents,
+        documents_by_id=_index(documents, "id"),
+        document_categories=tuple(sorted({doc["category"] for doc in documents})),
+        mandatory_document_count=sum(1 for doc in documents if doc["is_mandatory"]),
+        employee_requirements=requirements,
+        requirements_by_type=_index(requirements, "type"),
+        requirement_types=tuple(
+            MappingProxyType({"type": req["type"], "title": req["title"], "description": req["description"]})
+            for req in requirements
+        ),
+    )
+
+
+def _build_industry(industry_id: str, industry: dict) -> IndustryCatalog:
+    items = _freeze_rows(industry["items"], ITEM_FIELDS, "key", f"industry_compliance_model[{industry_id}]")
+    return IndustryCatalog(
+        industry_id=industry_id,
+        name=industry.get("name", industry_id),
+        items=items,
+        items_by_key=_index(items, "key"),
+        categories=tuple(sorted({item["category"] for item in items})),
+        required_count=sum(1 for item in items if item["required"]),
+    )
+
+
+def build_catalog(data: dict) -> ComplianceCatalog:
+    """Index a catalog document (already schema-validated) into a ComplianceCatalog.
+
+    The per-sector tables and the industry model each carry a ``_default`` entry used
+    for any sector or industry they do not list.
+    """
+    released_at = _timestamp(data["released_at"], "released_at")
+    documents = data["compliance_documents"]
+    requirements = data["employee_requirements"]
+    sector_ids = [sector["id"] for sector in data["uk_sectors"]]
+    sector_ids += [key for key in (*documents, *requirements) if key not in sector_ids]
+    sectors = {
+        sector_id: _build_sector(
+            sector_id,
+            documents.get(sector_id, documents[DEFAULT_KEY]),
+            requirements.get(sector_id, requirements[DEFAULT_KEY]),
+            released_at,
+        )
+        for sector_id in sector_ids
+    }
+
+    industries = {
+        industry_id: _build_industry(industry_id, industry)
+        for industry_id, industry in data["industry_compliance_model"].items()
+    }
+
+    return ComplianceCatalog(
+        version=data["version"],
+        released_at=released_at,
+        sectors=MappingProxyType(sectors),
+        industries=MappingProxyType(industries),
+        uk_sectors=_freeze_rows(data["uk_sectors"], SECTOR_FIELDS, "id", "uk_sectors"),
+        reference=MappingProxyType({
+            name: tuple(MappingProxyType(dict(row)) if isinstance(row, dict) else row for row in data[name])
+            for name in REFERENCE_LISTS
+        }),
+    )
+
+
+def validate_catalog_data(data: dict) -> None:
+    """Raise CatalogError listing every place the document breaks the catalog schema"""
+    # Imported here: importing jsonschema costs more than loading the catalog itself
+    from jsonschema import Draft202012Validator
+
+    schema = json.loads(SCHEMA_PATH.read_bytes())
+    errors = sorted(Draft202012Validator(schema).iter_errors(data), key=lambda e: list(e.absolute_path))
+    if errors:
+        raise CatalogError("; ".join(
+            f"{'/'.join(str(part) for part in error.absolute_path) or '<root>'}: {error.message}" for error in errors[:20]
+        ))
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path: Path = CATALOG_PATH) -> ComplianceCatalog:
+    """Read, check and index a catalog file; memoized, so each file is parsed once per process.
+
+    The bundled file is schema-checked before release (``python -m app.core.catalog``), so
+    workers only run the cheap per-row checks on it. Any other file gets the full schema
+    validation as it loads.
+    """
+    data = json.loads(Path(path).read_bytes())
+    if Path(path).resolve() != BUNDLED_CATALOG_PATH:
+        validate_catalog_data(data)
+    return build_catalog(data)
+
+
+def get_catalog() -> ComplianceCatalog:
+    """The catalog the app serves, loaded on first use"""
+    return load_catalog(CATALOG_PATH)
+
+
+def main(argv: List[str]) -> int:
+    """Validate catalog files against the schema: python -m app.core.catalog [path ...]"""
+    for path in argv or [BUNDLED_CATALOG_PATH]:
+        try:
+            data = json.loads(Path(path).read_bytes())
+            validate_catalog_data(data)
+            catalog = build_catalog(data)
+        except (CatalogError, ValueError) as e:
+            print(f"{path}: {e}")
+            return 1
+        print(f"{path}: version {catalog.version}, {len(catalog.sector_ids)} sectors, "
+              f"{len(catalog.industry_ids)} industries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
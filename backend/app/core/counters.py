@@ -0,0 +1,72 @@
+# backend/app/core/counters.py
+
+import re
+from typing import Optional
+
+from app.core.db import db
+
+
+class CollectionCounter:
+    """Document count of one collection per owner (e.g. per business), kept in db.collection_counts.
+
+    Writers call ``adjust`` alongside their inserts and deletes so list endpoints can report
+    totals with one _id lookup instead of ``count_documents``. A missing counter is seeded
+    from ``count_documents`` on first read; ``reset`` drops it after bulk deletes. An ``adjust``
+    that lands while a counter is being seeded is lost, so ``reconcile`` recounts periodically.
+    """
+
+    def __init__(self, collection: str, scope_field: Optional[str] = None):
+        self.collection = collection
+        self.scope_field = scope_field
+
+    def _key(self, scope: Optional[str]) -> str:
+        return f"{self.collection}:{scope or '*'}"
+
+    async def get(self, scope: Optional[str] = None) -> int:
+        counter = await db.collection_counts.find_one({"_id": self._key(scope)})
+        if counter:
+            return counter["count"]
+        query = {self.scope_field: scope} if self.scope_field else {}
+        count = await db[self.collection].count_documents(query)
+        await db.collection_counts.update_one(
+            {"_id": self._key(scope)}, {"$setOnInsert": {"count": count}}, upsert=True
+        )
+        return count
+
+    async def adjust(self, scope: Optional[str], delta: int) -> None:
+        # No upsert: an unseeded counter is counted from scratch on first read
+        if delta:
+            await db.collection_counts.update_one({"_id": self._key(scope)}, {"$inc": {"count": delta}})
+
+    async def reset(self, scope: Optional[str] = None) -> None:
+        await db.collection_counts.delete_one({"_id": self._key(scope)})
+
+    async def reconcile(self) -> int:
+        """Set each of this collection's counters to a real count; returns how many were wrong.
+
+        Compare-and-set on the value read, so a counter adjusted meanwhile is left for the next run.
+        """
+        corrected = 0
+        async for counter in db.collection_counts.find({"_id": {"$regex": f"^{re.escape(self.collection)}:"}}):
+            scope = counter["_id"].split(":", 1)[1]
+            query = {self.scope_field: scope} if self.scope_field else {}
+            count = await db[self.collection].count_documents(query)
+            if count != counter["count"]:
+                result = await db.collection_counts.update_one(
+                    {"_id": counter["_id"], "count": counter["count"]}, {"$set": {"count": count}}
+                )
+                corrected += result.modified_count
+        return corrected
+
+
+employee_counts = CollectionCounter("employees", "business_id")
+checklist_counts = CollectionCounter("checklists", "business_id")
+compliance_item_counts = CollectionCounter("compliance_items", "business_id")
+notification_counts = CollectionCounter("notifications", "user_id")
+document_counts = CollectionCounter("documents")
+ALL_COUNTERS = (employee_counts, checklist_counts, compliance_item_counts, notification_counts, document_counts)
+
+
+async def reconcile_collection_counts() -> dict:
+    """Recount every counter; returns how many were corrected per collection"""
+    return {counter.collection: await counter.reconcile() for counter in ALL_COUNTERS}
@@ -0,0 +1,47 @@
+# backend/app/core/dates.py
+
+from datetime import datetime, timezone
+from typing import Annotated, Any, Optional
+
+from pydantic import BeforeValidator, PlainSerializer
+
+# Fields stored as BSON datetimes, by collection. Documents written before this change hold
+# ISO strings; migrate_dates.py rewrites them in place.
+DATE_FIELDS = {
+    "checklists": ("created_at", "last_reviewed", "next_review_due"),
+    "compliance_items": (
+        "created_at", "updated_at", "acknowledged_at", "last_reviewed", "next_review_due", "archived_at",
+    ),
+    "compliance_items_archive": (
+        "created_at", "updated_at", "acknowledged_at", "last_reviewed", "next_review_due", "archived_at",
+    ),
+    "employee_requirements": ("created_at", "issue_date", "expiry_date"),
+    "compliance_scores": ("last_calculated_at", "next_review_due_at", "next_boundary_at"),
+    "job_state": ("last_run_at",),
+}
+
+
+def as_utc(value: Any) -> Optional[datetime]:
+    """Normalise a stored or submitted date to an aware UTC datetime.
+
+    Accepts BSON datetimes and ISO strings. Naive values and date-only strings are taken
+    as UTC; empty values give None. Raises ValueError if a string cannot be parsed.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def to_iso(value: Any) -> Optional[str]:
+    """ISO 8601 string for the API, in the same form the old string fields used"""
+    value = as_utc(value)
+    return value.isoformat() if value else None
+
+
+# Response model type for stored dates: validates from a datetime (or a not-yet-migrated ISO
+# string) and always serialises back to an ISO string, so API payloads are unchanged.
+ApiDatetime = Annotated[Optional[datetime], BeforeValidator(as_utc), PlainSerializer(to_iso, return_type=Optional[str])]
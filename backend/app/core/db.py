@@ -1,9 +1,72 @@
 # backend/app/core/db.py
 
+import logging
 import os
-from motor.motor_asyncio import AsyncIOMotorClient
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorClientSession
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
 
 MONGO_URI = os.environ["MONGO_URI"]
 
-client = AsyncIOMotorClient(MONGO_URI)
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts Mongo commands sent by this process, for query-count metrics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = Counter()
+
+    def started(self, event):
+        with self._lock:
+            self._counts[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        return {"total": sum(counts.values()), "by_command": counts}
+
+
+command_counter = CommandCounter()
+
+# tz_aware so stored dates come back as UTC-aware datetimes (see app/core/dates.py)
+client = AsyncIOMotorClient(MONGO_URI, tz_aware=True, event_listeners=[command_counter])
 db = client.get_default_database()
+
+_transactions_supported: Optional[bool] = None
+
+
+async def transactions_supported() -> bool:
+    """Whether the server is a replica set member or mongos, so can run transactions; asked once"""
+    global _transactions_supported
+    if _transactions_supported is None:
+        try:
+            hello = await client.admin.command("hello")
+        except Exception as e:
+            logger.warning(f"Could not ask the server whether it supports transactions: {e}")
+            hello = {}
+        _transactions_supported = bool(hello.get("setName") or hello.get("msg") == "isdbgrid")
+    return _transactions_supported
+
+
+async def run_in_transaction(fn: Callable[[Optional[AsyncIOMotorClientSession]], Awaitable[Any]]) -> Any:
+    """Await ``fn(session)`` inside one transaction and return its result.
+
+    The driver retries the whole of ``fn`` on transient errors such as write conflicts, so it
+    must do its reads through the session too. A standalone server (local development) cannot
+    run transactions; there ``fn`` gets ``None`` and its writes apply one at a time.
+    """
+    if not await transactions_supported():
+        return await fn(None)
+    async with await client.start_session() as session:
+        return await session.with_transaction(fn)
@@ -0,0 +1,35 @@
+# backend/app/core/http_cache.py
+
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match already names this ETag (weak comparison, as for GET)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+class PrerenderedJSON:
+    """A JSON body rendered to bytes once, with a strong ETag over those bytes.
+
+    Rendered the way FastAPI's JSONResponse renders, so clients see the same payload.
+    """
+
+    def __init__(self, content: Any):
+        self.body = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    def response(self, request: Request, cache_control: str) -> Response:
+        """200 with the stored bytes, or an empty 304 if the client's copy is current"""
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        if if_none_match(request, self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
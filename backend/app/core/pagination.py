@@ -0,0 +1,55 @@
+# backend/app/core/pagination.py
+
+import base64
+import binascii
+from typing import Optional
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, Response
+
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(last_id: ObjectId) -> str:
+    return base64.urlsafe_b64encode(last_id.binary).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> ObjectId:
+    try:
+        # validate=True: urlsafe_b64decode would silently drop stray characters
+        return ObjectId(base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True))
+    except (binascii.Error, InvalidId, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def fetch_page(
+    collection,
+    query: dict,
+    limit: int,
+    after: Optional[str] = None,
+    newest_first: bool = False,
+    keep_id: bool = False,
+) -> tuple:
+    """One page of ``query`` in ``_id`` (insertion) order, and the cursor for the next page.
+
+    Keyset pagination: the cursor is the last ``_id`` returned, so each page is an index range
+    scan however deep the client pages. The cursor is None on the last page.
+    """
+    if after:
+        query = {**query, "_id": {"$lt" if newest_first else "$gt": decode_cursor(after)}}
+    docs = await collection.find(query).sort("_id", -1 if newest_first else 1).to_list(limit + 1)
+    next_cursor = encode_cursor(docs[limit - 1]["_id"]) if len(docs) > limit else None
+    docs = docs[:limit]
+    if not keep_id:
+        for doc in docs:
+            doc.pop("_id")
+    return docs, next_cursor
+
+
+def set_page_headers(response: Response, next_cursor: Optional[str], total: Optional[int] = None) -> None:
+    """List bodies stay plain arrays; paging metadata travels in headers"""
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
@@ -0,0 +1,114 @@
+# backend/app/core/work_queue.py
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Set
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingQueue:
+    """In-process async work queue that runs at most one pending job per key.
+
+    Submitting a key that is already waiting returns the waiting job's future instead of
+    queueing another, so a burst of requests for the same key costs one run. A key
+    submitted while its job is running is queued again, so the new run sees every
+    change that came before it. Jobs run on ``max_workers`` worker tasks; until
+    ``start()`` is called (scripts, tests) each job runs as its own task.
+    """
+
+    def __init__(self, name: str, max_workers: int = 2):
+        self.name = name
+        self.max_workers = max_workers
+        self._queue: "asyncio.Queue[Hashable]" = asyncio.Queue()
+        self._pending: Dict[Hashable, tuple] = {}
+        self._running: Set[Hashable] = set()
+        self._workers: list = []
+        self.submitted = 0
+        self.coalesced = 0
+        self.completed = 0
+        self.failed = 0
+        self.last_lag = None
+        self.max_lag = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def submit(self, key: Hashable, fn: Callable[..., Awaitable], *args) -> "asyncio.Future":
+        """Queue ``fn(*args)`` for ``key`` unless a job for it is already waiting"""
+        self.submitted += 1
+        entry = self._pending.get(key)
+        if entry:
+            self.coalesced += 1
+            return entry[0]
+
+        future = asyncio.get_running_loop().create_future()
+        # Nobody has to await a job; mark failures as retrieved so they are only logged once
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._pending[key] = (future, time.monotonic(), fn, args)
+        if key not in self._running:
+            self._dispatch(key)
+        return future
+
+    def _dispatch(self, key: Hashable) -> None:
+        if self._workers:
+            self._queue.put_nowait(key)
+        else:
+            asyncio.ensure_future(self._run(key))
+
+    async def _run(self, key: Hashable) -> None:
+        future, enqueued_at, fn, args = self._pending.pop(key)
+        self.last_lag = time.monotonic() - enqueued_at
+        self.max_lag = max(self.max_lag, self.last_lag)
+        self._running.add(key)
+        try:
+            future.set_result(await fn(*args))
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"{self.name} job for {key} failed: {e}")
+            future.set_exception(e)
+        finally:
+            self._running.discard(key)
+            self.completed += 1
+            # Resubmitted while running: the waiting job can go now
+            if key in self._pending:
+                self._dispatch(key)
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                if key in self._pending and key not in self._running:
+                    await self._run(key)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_workers)]
+
+    def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue_depth,
+            "running": len(self._running),
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "completed": self.completed,
+            "failed": self.failed,
+            "last_lag_ms": round(self.last_lag * 1000, 2) if self.last_lag is not None else None,
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+        }
+
+
+score_recalculation_queue = CoalescingQueue(
+    "score_recalculation", max_workers=int(os.environ.get("SCORE_RECALCULATION_WORKERS", "2"))
+)
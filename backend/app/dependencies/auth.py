@@ -5,10 +5,18 @@ import jwt
 
 # ✅ Import db from server (this is safe because server will NOT import this file at top-level anymore)
 from app.core.db import db
+from app.core.cache import TTLCache
 
 JWT_SECRET = os.environ.get("JWT_SECRET_KEY", "simplycomply_secret")
 JWT_ALGORITHM = "HS256"
 
+# Authenticated users keyed by id, so a valid token doesn't cost a Mongo round trip per request.
+# Set USER_CACHE_TTL_SECONDS=0 to disable.
+user_cache = TTLCache(
+    maxsize=int(os.environ.get("USER_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.environ.get("USER_CACHE_TTL_SECONDS", "60")),
+)
+
 
 async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     if not authorization or not authorization.startswith("Bearer "):
@@ -17,11 +25,16 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     token = authorization.split(" ")[1]
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0})
-        if not user:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+
+    user_id = payload["sub"]
+    user = user_cache.get(user_id)
+    if user is None:
+        user = await db.users.find_one({"id": user_id}, {"_id": 0, "password_hash": 0})
+        if not user:
+            raise HTTPException(status_code=401, detail="User not found")
+        user_cache.set(user_id, user)
+    return dict(user)
@@ -0,0 +1,40 @@
+from typing import Optional
+from fastapi import Depends, HTTPException
+import os
+
+from app.core.db import db
+from app.core.cache import TTLCache
+from app.dependencies.auth import get_current_user
+
+# Businesses keyed by owning user id. Kept short-lived because subscription changes can
+# arrive on another worker (Stripe webhook); set BUSINESS_CACHE_TTL_SECONDS=0 to disable.
+business_cache = TTLCache(
+    maxsize=int(os.environ.get("BUSINESS_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.environ.get("BUSINESS_CACHE_TTL_SECONDS", "10")),
+)
+
+
+def invalidate_business(user_id: str) -> None:
+    """Drop a cached business. Call after any write to ``db.businesses``."""
+    business_cache.invalidate(user_id)
+
+
+async def get_optional_business(current_user: dict = Depends(get_current_user)) -> Optional[dict]:
+    """The current user's business, or None before onboarding.
+
+    FastAPI resolves this once per request, so nested dependencies share the same lookup.
+    """
+    user_id = current_user["id"]
+    business = business_cache.get(user_id)
+    if business is None:
+        business = await db.businesses.find_one({"user_id": user_id}, {"_id": 0})
+        if not business:
+            return None
+        business_cache.set(user_id, business)
+    return dict(business)
+
+
+async def get_current_business(business: Optional[dict] = Depends(get_optional_business)) -> dict:
+    if not business:
+        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
+    return business
@@ -0,0 +1,47 @@
+"""Move compliance items archived in place by older releases into compliance_items_archive.
+
+Sector changes used to flag the old items archived: True and leave them in compliance_items,
+where every item read and score recount still saw them. This copies them to the archive
+collection, deletes them from the live one, and recounts the affected businesses' item
+counters and scores. Safe to re-run.
+
+    cd backend && python archive_compliance_items.py [--dry-run]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from server import archive_compliance_items, calculate_compliance_score, client, compliance_item_counts, db
+
+
+async def archive_business(business_id: str) -> int:
+    items = await db.compliance_items.find({"business_id": business_id, "archived": True}, {"_id": 0}).to_list(None)
+    # The same move the sector change makes, so archived items have one shape (archived_at included)
+    moved = await archive_compliance_items(items, datetime.now(timezone.utc))
+    await compliance_item_counts.reset(business_id)
+    await calculate_compliance_score(business_id)
+    return moved
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report what would move without writing")
+    args = parser.parse_args()
+
+    try:
+        business_ids = await db.compliance_items.distinct("business_id", {"archived": True})
+        moved = 0
+        for business_id in business_ids:
+            if args.dry_run:
+                moved += await db.compliance_items.count_documents({"business_id": business_id, "archived": True})
+            else:
+                moved += await archive_business(business_id)
+    finally:
+        client.close()
+    verb = "would move" if args.dry_run else "moved"
+    print(f"{verb} {moved} archived items from {len(business_ids)} businesses")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""Rewrite legacy ISO-string date fields as native BSON datetimes.
+
+Covers the fields listed in app.core.dates.DATE_FIELDS. Only string values are touched,
+so the migration is safe to re-run or to run while the API is serving traffic.
+
+    cd backend && python migrate_dates.py [--dry-run] [--batch-size N]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(Path(__file__).parent / ".env")
+
+from pymongo import UpdateOne  # noqa: E402
+
+from app.core.dates import DATE_FIELDS, as_utc  # noqa: E402
+from app.core.db import client, db  # noqa: E402
+
+
+async def migrate_collection(name: str, fields: tuple, batch_size: int, dry_run: bool) -> dict:
+    collection = db[name]
+    query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+    projection = {field: 1 for field in fields}
+    converted = 0
+    unparseable = 0
+    batch = []
+
+    async def flush():
+        if batch and not dry_run:
+            await collection.bulk_write(batch, ordered=False)
+        batch.clear()
+
+    async for doc in collection.find(query, projection):
+        updates = {}
+        for field in fields:
+            value = doc.get(field)
+            if not isinstance(value, str):
+                continue
+            try:
+                # Empty strings were the old way of clearing a date
+                updates[field] = as_utc(value)
+            except ValueError:
+                unparseable += 1
+                print(f"  {name} {doc['_id']}: cannot parse {field}={value!r}, left as is")
+        if updates:
+            converted += 1
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": updates}))
+        if len(batch) >= batch_size:
+            await flush()
+    await flush()
+    return {"converted": converted, "unparseable": unparseable}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    try:
+        for name, fields in DATE_FIELDS.items():
+            result = await migrate_collection(name, fields, args.batch_size, args.dry_run)
+            verb = "would convert" if args.dry_run else "converted"
+            print(f"{name}: {verb} {result['converted']} documents, {result['unparseable']} unparseable values")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+"""Recount every business's compliance score once, correcting any drift in the maintained counters.
+
+For deployments that schedule it externally (cron) rather than in-process:
+
+    cd backend && COMPLIANCE_SCORE_RECONCILE_INTERVAL_SECONDS=0 python reconcile_scores.py
+"""
+
+import asyncio
+
+from server import client, reconcile_compliance_scores
+
+
+async def main():
+    try:
+        result = await reconcile_compliance_scores()
+    finally:
+        client.close()
+    print(f"Checked {result['checked']} businesses, corrected {result['drifted']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
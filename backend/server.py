@@ -1,20 +1,35 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Header
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, UploadFile, File, Query, Response
 from app.api.admin import admin_router
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import StreamingResponse
 import os
+import asyncio
+import csv
+import io
+import json
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from pymongo import DeleteMany, InsertOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, ValidationError
+from typing import List, Optional, Dict, Any, Mapping, Tuple
 from enum import Enum
 import uuid
 from datetime import datetime, timezone, timedelta
-import bcrypt
 import jwt
 from emergentintegrations.payments.stripe.checkout import StripeCheckout, CheckoutSessionResponse, CheckoutStatusResponse, CheckoutSessionRequest
 from app.dependencies.auth import get_current_user
-from app.core.db import db, client
+from app.dependencies.business import get_current_business, get_optional_business, invalidate_business
+from app.core.db import db, client, run_in_transaction
+from app.core.passwords import password_hasher, HashingQueueFull
+from app.core.dates import ApiDatetime, as_utc, to_iso
+from app.core.pagination import MAX_PAGE_SIZE, fetch_page, set_page_headers
+from app.core.counters import employee_counts, checklist_counts, compliance_item_counts, notification_counts, reconcile_collection_counts
+from app.core.work_queue import score_recalculation_queue
+from app.core.catalog import get_catalog
+from app.core.http_cache import PrerenderedJSON, if_none_match
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -108,8 +123,8 @@ class ChecklistItemResponse(BaseModel):
     title: str
     category: str
     status: str
-    last_reviewed: Optional[str]
-    next_review_due: Optional[str]
+    last_reviewed: ApiDatetime
+    next_review_due: ApiDatetime
 
 class NotificationResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -153,6 +168,12 @@ class ComplianceItemUpdate(BaseModel):
     file_name: Optional[str] = None
     notes: Optional[str] = None
 
+class ComplianceItemBatchEntry(ComplianceItemUpdate):
+    id: str
+
+class ComplianceItemBatchUpdate(BaseModel):
+    items: List[ComplianceItemBatchEntry] = Field(min_length=1, max_length=500)
+
 class ComplianceItemResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str
@@ -165,19 +186,23 @@ class ComplianceItemResponse(BaseModel):
     is_required: bool
     status: str
     is_acknowledged: bool
-    acknowledged_at: Optional[str]
+    acknowledged_at: ApiDatetime
     is_customised: bool
     custom_content: Optional[str]
     file_url: Optional[str]
     file_name: Optional[str]
     version: Optional[str]
-    last_reviewed: Optional[str]
-    next_review_due: Optional[str]
+    last_reviewed: ApiDatetime
+    next_review_due: ApiDatetime
     notes: Optional[str]
-    created_at: str
-    updated_at: Optional[str]
+    created_at: ApiDatetime
+    updated_at: ApiDatetime
     contributes_to_score: bool
 
+class ComplianceItemBatchResponse(BaseModel):
+    updated: List[ComplianceItemResponse]
+    not_found: List[str]
+
 class ComplianceScoreResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
     business_id: str
@@ -189,10 +214,25 @@ class ComplianceScoreResponse(BaseModel):
     overdue_count: int
     needs_review_count: int
     status_label: str  # "on_track", "needs_attention", "overdue"
-    last_calculated_at: str
-    next_review_due_at: Optional[str]
+    last_calculated_at: ApiDatetime
+    next_review_due_at: ApiDatetime = None
+    version: int
     breakdown: Dict
 
+class ComplianceScoreHistoryPoint(BaseModel):
+    date: str  # YYYY-MM-DD the score was recorded; the last score of that day, week or month
+    score_percent: int
+    required_total: int
+    completed_total: int
+    missing_count: int
+    overdue_count: int
+    needs_review_count: int
+
+class ComplianceScoreHistoryResponse(BaseModel):
+    business_id: str
+    resolution: str  # "day", "week" or "month"
+    points: List[ComplianceScoreHistoryPoint]
+
 # ======================= EMPLOYEE MODELS =======================
 
 class EmployeeCreate(BaseModel):
@@ -248,6 +288,12 @@ class EmployeeRequirementUpdate(BaseModel):
     reference_number: Optional[str] = None
     status: Optional[str] = None
 
+class EmployeeRequirementBulkUpdate(BaseModel):
+    requirement_type: str
+    employee_ids: List[str] = Field(min_length=1, max_length=500)
+    issue_date: Optional[str] = None
+    expiry_date: Optional[str] = None
+
 class EmployeeRequirementResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str
@@ -255,20 +301,26 @@ class EmployeeRequirementResponse(BaseModel):
     requirement_type: str
     title: str
     description: Optional[str]
-    issue_date: Optional[str]
-    expiry_date: Optional[str]
+    issue_date: ApiDatetime
+    expiry_date: ApiDatetime
     reference_number: Optional[str]
     status: str
     days_until_expiry: Optional[int]
-    created_at: str
+    created_at: ApiDatetime
 
 # ======================= HELPER FUNCTIONS =======================
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+async def hash_password(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except HashingQueueFull:
+        raise HTTPException(status_code=503, detail="Server busy, please try again shortly", headers={"Retry-After": "1"})
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+async def verify_password(password: str, hashed: str) -> bool:
+    try:
+        return await password_hasher.verify(password, hashed)
+    except HashingQueueFull:
+        raise HTTPException(status_code=503, detail="Server busy, please try again shortly", headers={"Retry-After": "1"})
 
 def create_token(user_id: str, email: str, role: str) -> str:
     expiration = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
@@ -280,29 +332,48 @@ def create_token(user_id: str, email: str, role: str) -> str:
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Not authenticated")
+def summarise_requirement_statuses(status_counts: Dict[str, int]) -> dict:
+    """Build an employee compliance_summary from requirement counts keyed by stored status"""
+    total = sum(status_counts.values())
+    valid = status_counts.get("valid", 0)
+    return {
+        "total": total,
+        "valid": valid,
+        "expired": status_counts.get("expired", 0),
+        "expiring_soon": status_counts.get("expiring_soon", 0),
+        "pending": status_counts.get("pending", 0),
+        "compliance_rate": round((valid / total * 100) if total > 0 else 0)
+    }
+
+async def get_requirement_status_counts(employee_ids: List[str]) -> Dict[str, Dict[str, int]]:
+    """Count requirements per employee and stored status in one aggregation"""
+    counts = {employee_id: {} for employee_id in employee_ids}
+    if not employee_ids:
+        return counts
     
-    token = authorization.split(" ")[1]
+    pipeline = [
+        {"$match": {"employee_id": {"$in": employee_ids}}},
+        {"$group": {"_id": {"employee_id": "$employee_id", "status": "$status"}, "count": {"$sum": 1}}}
+    ]
+    async for row in db.employee_requirements.aggregate(pipeline):
+        counts[row["_id"]["employee_id"]][row["_id"]["status"]] = row["count"]
+    return counts
+
+def parse_date_input(value: Optional[str], field: str) -> Optional[datetime]:
+    """Parse a submitted ISO date for storage; empty clears the field"""
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0})
-        if not user:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid token")
-
-def calculate_requirement_status(expiry_date_str: Optional[str]) -> tuple:
+        return as_utc(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {field}: expected an ISO 8601 date")
+
+def calculate_requirement_status(expiry_date: Optional[Any]) -> tuple:
     """Calculate status and days until expiry"""
-    if not expiry_date_str:
+    if not expiry_date:
         return "pending", None
     
     try:
-        expiry_date = datetime.fromisoformat(expiry_date_str.replace('Z', '+00:00'))
+        # Date-only values from the frontend are midnight UTC
+        expiry_date = as_utc(expiry_date)
         now = datetime.now(timezone.utc)
         days_until = (expiry_date - now).days
         
@@ -322,407 +393,6 @@ SUBSCRIPTION_PLANS = {
     "annual": {"name": "Annual Plan", "price": 290.00, "currency": "gbp", "interval": "year"}
 }
 
-# ======================= EXPANDED UK SECTORS =======================
-
-UK_SECTORS = [
-    # Healthcare & Medical
-    {"id": "dental", "name": "Dental Practice", "industry": "Healthcare", "regulator": "CQC"},
-    {"id": "healthcare", "name": "Healthcare Provider", "industry": "Healthcare", "regulator": "CQC"},
-    {"id": "care_home", "name": "Care Home", "industry": "Healthcare", "regulator": "CQC"},
-    {"id": "veterinary", "name": "Veterinary Practice", "industry": "Healthcare", "regulator": "RCVS"},
-    {"id": "pharmacy", "name": "Pharmacy", "industry": "Healthcare", "regulator": "GPhC"},
-    {"id": "optician", "name": "Optician / Optometrist", "industry": "Healthcare", "regulator": "GOC"},
-    {"id": "physiotherapy", "name": "Physiotherapy / Sports Therapy", "industry": "Healthcare", "regulator": "HCPC"},
-    {"id": "mental_health", "name": "Mental Health Services", "industry": "Healthcare", "regulator": "CQC"},
-    
-    # Construction & Trades
-    {"id": "construction", "name": "Construction", "industry": "Construction", "regulator": "HSE"},
-    {"id": "electrical", "name": "Electrical Contractor", "industry": "Construction", "regulator": "HSE/NICEIC"},
-    {"id": "plumbing", "name": "Plumbing & Heating", "industry": "Construction", "regulator": "HSE/Gas Safe"},
-    {"id": "roofing", "name": "Roofing Contractor", "industry": "Construction", "regulator": "HSE"},
-    
-    # Hospitality & Food
-    {"id": "hospitality", "name": "Hotel / B&B", "industry": "Hospitality", "regulator": "EHO"},
-    {"id": "restaurant", "name": "Restaurant / Cafe", "industry": "Hospitality", "regulator": "EHO/FSA"},
-    {"id": "pub", "name": "Pub / Bar", "industry": "Hospitality", "regulator": "EHO/Licensing"},
-    {"id": "catering", "name": "Catering Services", "industry": "Hospitality", "regulator": "EHO/FSA"},
-    {"id": "takeaway", "name": "Takeaway / Fast Food", "industry": "Hospitality", "regulator": "EHO/FSA"},
-    
-    # Retail & Services
-    {"id": "retail", "name": "Retail Shop", "industry": "Retail", "regulator": "Trading Standards"},
-    {"id": "salon", "name": "Hair / Beauty Salon", "industry": "Personal Services", "regulator": "EHO"},
-    {"id": "tattoo", "name": "Tattoo / Piercing Studio", "industry": "Personal Services", "regulator": "EHO"},
-    {"id": "gym", "name": "Gym / Fitness Centre", "industry": "Leisure", "regulator": "HSE"},
-    
-    # Education & Childcare
-    {"id": "education", "name": "School / College", "industry": "Education", "regulator": "Ofsted"},
-    {"id": "nursery", "name": "Nursery / Childcare", "industry": "Education", "regulator": "Ofsted"},
-    {"id": "tuition", "name": "Tuition Centre", "industry": "Education", "regulator": "Ofsted"},
-    
-    # Professional Services
-    {"id": "office", "name": "Office / Professional Services", "industry": "Professional Services", "regulator": "HSE/ICO"},
-    {"id": "accountancy", "name": "Accountancy Practice", "industry": "Professional Services", "regulator": "ICAEW/ACCA"},
-    {"id": "legal", "name": "Legal Practice", "industry": "Professional Services", "regulator": "SRA"},
-    {"id": "estate_agent", "name": "Estate Agency", "industry": "Professional Services", "regulator": "Trading Standards"},
-    {"id": "recruitment", "name": "Recruitment Agency", "industry": "Professional Services", "regulator": "ICO/HMRC"},
-    
-    # Other Small Businesses
-    {"id": "cleaning", "name": "Cleaning Services", "industry": "Services", "regulator": "HSE"},
-    {"id": "security", "name": "Security Services", "industry": "Services", "regulator": "SIA"},
-    {"id": "transport", "name": "Transport / Logistics", "industry": "Transport", "regulator": "DVSA"},
-    {"id": "motor_trade", "name": "Motor Trade / Garage", "industry": "Automotive", "regulator": "Trading Standards"},
-    {"id": "agriculture", "name": "Farm / Agriculture", "industry": "Agriculture", "regulator": "HSE"},
-    {"id": "manufacturing", "name": "Manufacturing", "industry": "Manufacturing", "regulator": "HSE"},
-    {"id": "warehouse", "name": "Warehouse / Distribution", "industry": "Logistics", "regulator": "HSE"},
-    {"id": "charity", "name": "Charity / Non-Profit", "industry": "Third Sector", "regulator": "Charity Commission"},
-]
-
-UK_NATIONS = ["England", "Scotland", "Wales", "Northern Ireland"]
-
-BUSINESS_SIZES = [
-    {"id": "micro", "name": "Micro (1-9 employees)"},
-    {"id": "small", "name": "Small (10-49 employees)"},
-    {"id": "medium", "name": "Medium (50-249 employees)"},
-    {"id": "large", "name": "Large (250+ employees)"}
-]
-
-COMPLIANCE_CATEGORIES = [
-    "Health & Safety",
-    "GDPR & Data Protection",
-    "Equality & Diversity",
-    "Safeguarding",
-    "Complaints Procedures",
-    "Risk Assessments",
-    "Staff Handbook",
-    "Mandatory Posters",
-    "Regulatory Guidance",
-    "Fire Safety",
-    "Food Safety",
-    "Infection Control",
-    "Environmental"
-]
-
-# ======================= EMPLOYEE REQUIREMENT TYPES BY SECTOR =======================
-
-EMPLOYEE_REQUIREMENTS = {
-    # Healthcare sectors - comprehensive requirements
-    "dental": [
-        {"type": "dbs", "title": "Enhanced DBS Check", "description": "Enhanced Disclosure and Barring Service check required for patient-facing roles", "renewal_months": 36, "mandatory": True},
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "gdc_registration", "title": "GDC Registration", "description": "General Dental Council registration for dentists and dental nurses", "renewal_months": 12, "mandatory": True},
-        {"type": "indemnity", "title": "Professional Indemnity", "description": "Valid professional indemnity insurance", "renewal_months": 12, "mandatory": True},
-        {"type": "cpd", "title": "CPD Record", "description": "Continuing Professional Development hours", "renewal_months": 12, "mandatory": True},
-        {"type": "hep_b", "title": "Hepatitis B Vaccination", "description": "Hepatitis B vaccination and immunity check", "renewal_months": 60, "mandatory": True},
-        {"type": "basic_life_support", "title": "Basic Life Support Training", "description": "BLS/CPR certification", "renewal_months": 12, "mandatory": True},
-        {"type": "safeguarding", "title": "Safeguarding Training", "description": "Adult and child safeguarding awareness", "renewal_months": 36, "mandatory": True},
-        {"type": "infection_control", "title": "Infection Control Training", "description": "HTM 01-05 compliant training", "renewal_months": 12, "mandatory": True},
-        {"type": "radiation_protection", "title": "Radiation Protection Training", "description": "IR(ME)R training for radiography", "renewal_months": 36, "mandatory": False},
-    ],
-    "healthcare": [
-        {"type": "dbs", "title": "Enhanced DBS Check", "description": "Enhanced DBS with barred lists check", "renewal_months": 36, "mandatory": True},
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "nmc_registration", "title": "NMC Registration", "description": "Nursing and Midwifery Council registration", "renewal_months": 12, "mandatory": True},
-        {"type": "indemnity", "title": "Professional Indemnity", "description": "Valid professional indemnity insurance", "renewal_months": 12, "mandatory": True},
-        {"type": "revalidation", "title": "Professional Revalidation", "description": "NMC/GMC revalidation completed", "renewal_months": 36, "mandatory": True},
-        {"type": "hep_b", "title": "Hepatitis B Vaccination", "description": "Hepatitis B vaccination status", "renewal_months": 60, "mandatory": True},
-        {"type": "basic_life_support", "title": "Basic Life Support Training", "description": "BLS/ILS certification", "renewal_months": 12, "mandatory": True},
-        {"type": "safeguarding", "title": "Safeguarding Training", "description": "Level 3 safeguarding training", "renewal_months": 36, "mandatory": True},
-        {"type": "manual_handling", "title": "Manual Handling Training", "description": "Moving and handling certification", "renewal_months": 12, "mandatory": True},
-        {"type": "infection_control", "title": "Infection Control Training", "description": "Infection prevention and control", "renewal_months": 12, "mandatory": True},
-        {"type": "information_governance", "title": "Information Governance", "description": "Data Security & Protection Toolkit", "renewal_months": 12, "mandatory": True},
-    ],
-    "care_home": [
-        {"type": "dbs", "title": "Enhanced DBS Check", "description": "Enhanced DBS with adults barred list", "renewal_months": 36, "mandatory": True},
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "care_certificate", "title": "Care Certificate", "description": "15 standards care certificate completion", "renewal_months": None, "mandatory": True},
-        {"type": "safeguarding", "title": "Safeguarding Adults Training", "description": "Adult safeguarding level 2", "renewal_months": 36, "mandatory": True},
-        {"type": "manual_handling", "title": "Manual Handling Training", "description": "Moving and handling of residents", "renewal_months": 12, "mandatory": True},
-        {"type": "medication", "title": "Medication Administration", "description": "Safe handling of medication", "renewal_months": 12, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "First aid at work certificate", "renewal_months": 36, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire awareness and evacuation", "renewal_months": 12, "mandatory": True},
-        {"type": "food_hygiene", "title": "Food Hygiene Certificate", "description": "Level 2 food hygiene", "renewal_months": 36, "mandatory": False},
-        {"type": "dementia", "title": "Dementia Awareness", "description": "Dementia care training", "renewal_months": 24, "mandatory": False},
-    ],
-    "veterinary": [
-        {"type": "dbs", "title": "Basic DBS Check", "description": "Basic criminal record check", "renewal_months": 36, "mandatory": True},
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "rcvs_registration", "title": "RCVS Registration", "description": "Royal College of Veterinary Surgeons registration", "renewal_months": 12, "mandatory": True},
-        {"type": "cpd", "title": "CPD Record", "description": "35 hours CPD annually", "renewal_months": 12, "mandatory": True},
-        {"type": "indemnity", "title": "Professional Indemnity", "description": "Veterinary defence insurance", "renewal_months": 12, "mandatory": True},
-        {"type": "controlled_drugs", "title": "Controlled Drugs Training", "description": "Handling of veterinary medicines", "renewal_months": 24, "mandatory": True},
-        {"type": "radiation_protection", "title": "Radiation Protection", "description": "X-ray safety training", "renewal_months": 36, "mandatory": False},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Workplace first aid", "renewal_months": 36, "mandatory": True},
-    ],
-    "nursery": [
-        {"type": "dbs", "title": "Enhanced DBS Check", "description": "Enhanced DBS with children's barred list", "renewal_months": 36, "mandatory": True},
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "childcare_qualification", "title": "Childcare Qualification", "description": "Level 2/3 childcare qualification", "renewal_months": None, "mandatory": True},
-        {"type": "safeguarding", "title": "Child Safeguarding Training", "description": "Keeping Children Safe training", "renewal_months": 36, "mandatory": True},
-        {"type": "paediatric_first_aid", "title": "Paediatric First Aid", "description": "12-hour paediatric first aid certificate", "renewal_months": 36, "mandatory": True},
-        {"type": "food_hygiene", "title": "Food Hygiene Certificate", "description": "Level 2 food safety", "renewal_months": 36, "mandatory": True},
-        {"type": "prevent", "title": "Prevent Training", "description": "Counter-terrorism awareness", "renewal_months": 36, "mandatory": True},
-        {"type": "health_safety", "title": "Health & Safety Training", "description": "Workplace H&S awareness", "renewal_months": 24, "mandatory": True},
-    ],
-    "education": [
-        {"type": "dbs", "title": "Enhanced DBS Check", "description": "Enhanced DBS with children's barred list", "renewal_months": 36, "mandatory": True},
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "qts", "title": "Qualified Teacher Status", "description": "QTS or equivalent qualification", "renewal_months": None, "mandatory": True},
-        {"type": "safeguarding", "title": "Safeguarding Training", "description": "KCSIE compliant training", "renewal_months": 12, "mandatory": True},
-        {"type": "prevent", "title": "Prevent Training", "description": "Counter-terrorism duty training", "renewal_months": 36, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "First aid at work", "renewal_months": 36, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire warden training", "renewal_months": 12, "mandatory": True},
-    ],
-    "construction": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "cscs", "title": "CSCS Card", "description": "Construction Skills Certification Scheme card", "renewal_months": 60, "mandatory": True},
-        {"type": "health_safety", "title": "Site Safety (SMSTS/SSSTS)", "description": "Site management safety training scheme", "renewal_months": 60, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid at work", "renewal_months": 36, "mandatory": True},
-        {"type": "asbestos", "title": "Asbestos Awareness", "description": "CAT A asbestos awareness", "renewal_months": 12, "mandatory": True},
-        {"type": "working_at_height", "title": "Working at Height", "description": "Ladder and scaffold safety", "renewal_months": 36, "mandatory": True},
-        {"type": "manual_handling", "title": "Manual Handling", "description": "Safe lifting techniques", "renewal_months": 36, "mandatory": True},
-        {"type": "coshh", "title": "COSHH Training", "description": "Control of substances hazardous to health", "renewal_months": 36, "mandatory": True},
-    ],
-    "hospitality": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "food_hygiene", "title": "Food Hygiene Certificate", "description": "Level 2 food safety in catering", "renewal_months": 36, "mandatory": True},
-        {"type": "allergen_training", "title": "Allergen Awareness", "description": "Food allergen training (Natasha's Law)", "renewal_months": 36, "mandatory": True},
-        {"type": "personal_licence", "title": "Personal Licence", "description": "Alcohol licensing qualification", "renewal_months": None, "mandatory": False},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid", "renewal_months": 36, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire awareness and evacuation", "renewal_months": 12, "mandatory": True},
-        {"type": "health_safety", "title": "Health & Safety", "description": "General H&S awareness", "renewal_months": 36, "mandatory": True},
-    ],
-    "restaurant": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "food_hygiene", "title": "Food Hygiene Certificate", "description": "Level 2 food safety", "renewal_months": 36, "mandatory": True},
-        {"type": "allergen_training", "title": "Allergen Awareness", "description": "14 allergens training", "renewal_months": 36, "mandatory": True},
-        {"type": "haccp", "title": "HACCP Training", "description": "Food safety management", "renewal_months": 36, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid", "renewal_months": 36, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire safety awareness", "renewal_months": 12, "mandatory": True},
-    ],
-    "salon": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "nvq_qualification", "title": "NVQ Qualification", "description": "Level 2/3 hairdressing or beauty", "renewal_months": None, "mandatory": True},
-        {"type": "insurance", "title": "Public Liability Insurance", "description": "Treatment liability cover", "renewal_months": 12, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid", "renewal_months": 36, "mandatory": True},
-        {"type": "infection_control", "title": "Infection Control", "description": "Hygiene and sterilisation", "renewal_months": 24, "mandatory": True},
-        {"type": "coshh", "title": "COSHH Training", "description": "Chemical handling safety", "renewal_months": 36, "mandatory": True},
-    ],
-    "security": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "sia_licence", "title": "SIA Licence", "description": "Security Industry Authority licence", "renewal_months": 36, "mandatory": True},
-        {"type": "dbs", "title": "Enhanced DBS Check", "description": "Criminal record check", "renewal_months": 36, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid", "renewal_months": 36, "mandatory": True},
-        {"type": "conflict_management", "title": "Conflict Management", "description": "De-escalation training", "renewal_months": 24, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire warden duties", "renewal_months": 12, "mandatory": True},
-    ],
-    "cleaning": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "dbs", "title": "Basic DBS Check", "description": "Criminal record check", "renewal_months": 36, "mandatory": True},
-        {"type": "coshh", "title": "COSHH Training", "description": "Safe use of cleaning chemicals", "renewal_months": 36, "mandatory": True},
-        {"type": "manual_handling", "title": "Manual Handling", "description": "Safe lifting and carrying", "renewal_months": 36, "mandatory": True},
-        {"type": "health_safety", "title": "Health & Safety", "description": "General H&S awareness", "renewal_months": 36, "mandatory": True},
-    ],
-    "retail": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid", "renewal_months": 36, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire awareness", "renewal_months": 12, "mandatory": True},
-        {"type": "manual_handling", "title": "Manual Handling", "description": "Safe lifting", "renewal_months": 36, "mandatory": True},
-        {"type": "health_safety", "title": "Health & Safety", "description": "General H&S awareness", "renewal_months": 36, "mandatory": True},
-    ],
-    "office": [
-        {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-        {"type": "dse", "title": "DSE Assessment", "description": "Display screen equipment assessment", "renewal_months": 24, "mandatory": True},
-        {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid", "renewal_months": 36, "mandatory": True},
-        {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire warden training", "renewal_months": 12, "mandatory": True},
-        {"type": "gdpr", "title": "GDPR Training", "description": "Data protection awareness", "renewal_months": 12, "mandatory": True},
-        {"type": "health_safety", "title": "Health & Safety", "description": "Office H&S awareness", "renewal_months": 36, "mandatory": True},
-    ],
-}
-
-# Default requirements for sectors not specifically defined
-DEFAULT_EMPLOYEE_REQUIREMENTS = [
-    {"type": "right_to_work", "title": "Right to Work", "description": "Proof of eligibility to work in the UK", "renewal_months": None, "mandatory": True},
-    {"type": "first_aid", "title": "First Aid Certificate", "description": "Emergency first aid at work", "renewal_months": 36, "mandatory": True},
-    {"type": "fire_safety", "title": "Fire Safety Training", "description": "Fire awareness and evacuation", "renewal_months": 12, "mandatory": True},
-    {"type": "health_safety", "title": "Health & Safety", "description": "General H&S induction", "renewal_months": 36, "mandatory": True},
-]
-
-# ======================= COMPREHENSIVE COMPLIANCE DOCUMENTS =======================
-
-COMPLIANCE_DOCUMENTS = {
-    "dental": [
-        {"id": "dental_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Comprehensive health and safety policy for dental practices compliant with Health and Safety at Work Act 1974", "is_mandatory": True, "version": "2.1"},
-        {"id": "dental_gdpr_001", "title": "GDPR Patient Data Policy", "category": "GDPR & Data Protection", "description": "Data protection policy compliant with UK GDPR for patient records, including SAR procedures", "is_mandatory": True, "version": "3.0"},
-        {"id": "dental_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Equal opportunities policy compliant with Equality Act 2010", "is_mandatory": True, "version": "1.5"},
-        {"id": "dental_sg_001", "title": "Safeguarding Policy", "category": "Safeguarding", "description": "Child and vulnerable adult safeguarding procedures per CQC requirements", "is_mandatory": True, "version": "2.0"},
-        {"id": "dental_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "NHS complaints procedure (Local Authority Social Services and NHS Complaints Regulations 2009)", "is_mandatory": True, "version": "1.8"},
-        {"id": "dental_ra_001", "title": "Clinical Risk Assessment", "category": "Risk Assessments", "description": "Risk assessment template for dental procedures", "is_mandatory": True, "version": "2.2"},
-        {"id": "dental_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Employee handbook covering contracts, policies, and GDC standards", "is_mandatory": True, "version": "4.0"},
-        {"id": "dental_mp_001", "title": "CQC Registration Certificate", "category": "Mandatory Posters", "description": "CQC registration display requirements", "is_mandatory": True, "version": "1.0"},
-        {"id": "dental_rg_001", "title": "CQC Fundamental Standards Guide", "category": "Regulatory Guidance", "description": "Guide to CQC's 5 key questions: Safe, Effective, Caring, Responsive, Well-led", "is_mandatory": True, "version": "2.5"},
-        {"id": "dental_ic_001", "title": "Infection Control Policy (HTM 01-05)", "category": "Infection Control", "description": "Decontamination in primary care dental practices per HTM 01-05", "is_mandatory": True, "version": "3.1"},
-        {"id": "dental_ra_002", "title": "Sharps & Needlestick Injury Protocol", "category": "Risk Assessments", "description": "Sharps injury prevention and post-exposure management", "is_mandatory": True, "version": "2.0"},
-        {"id": "dental_rg_002", "title": "GDC Standards Guidance", "category": "Regulatory Guidance", "description": "General Dental Council Standards for the Dental Team", "is_mandatory": True, "version": "1.5"},
-        {"id": "dental_fire_001", "title": "Fire Safety Policy", "category": "Fire Safety", "description": "Fire risk assessment and evacuation procedures", "is_mandatory": True, "version": "2.0"},
-    ],
-    "healthcare": [
-        {"id": "health_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "NHS compliant health and safety policy", "is_mandatory": True, "version": "3.0"},
-        {"id": "health_gdpr_001", "title": "Data Protection Policy", "category": "GDPR & Data Protection", "description": "UK GDPR and Caldicott principles compliant policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "health_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "NHS equality framework compliant policy with EDS2 alignment", "is_mandatory": True, "version": "2.0"},
-        {"id": "health_sg_001", "title": "Safeguarding Policy", "category": "Safeguarding", "description": "Adult and child safeguarding per Care Act 2014 and Children Act 2004", "is_mandatory": True, "version": "3.0"},
-        {"id": "health_cp_001", "title": "Complaints Policy", "category": "Complaints Procedures", "description": "NHS complaints procedure with PALS guidance", "is_mandatory": True, "version": "2.2"},
-        {"id": "health_ra_001", "title": "Clinical Risk Assessment Framework", "category": "Risk Assessments", "description": "NHS clinical risk management framework", "is_mandatory": True, "version": "2.8"},
-        {"id": "health_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Healthcare worker handbook including NHS employment standards", "is_mandatory": True, "version": "4.5"},
-        {"id": "health_mp_001", "title": "Health & Safety Law Poster", "category": "Mandatory Posters", "description": "HSE approved poster", "is_mandatory": True, "version": "1.0"},
-        {"id": "health_rg_001", "title": "CQC Key Lines of Enquiry", "category": "Regulatory Guidance", "description": "Complete CQC KLOEs and quality statements", "is_mandatory": True, "version": "3.0"},
-        {"id": "health_ic_001", "title": "Infection Prevention & Control Policy", "category": "Infection Control", "description": "IPC policy aligned with NHS England guidance", "is_mandatory": True, "version": "3.5"},
-        {"id": "health_dols_001", "title": "Mental Capacity & DoLS Policy", "category": "Regulatory Guidance", "description": "Mental Capacity Act 2005 and Deprivation of Liberty Safeguards", "is_mandatory": True, "version": "2.0"},
-    ],
-    "care_home": [
-        {"id": "care_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Care home health and safety policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "care_gdpr_001", "title": "Resident Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR policy for resident personal and medical information", "is_mandatory": True, "version": "2.0"},
-        {"id": "care_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Care sector equality and human rights policy", "is_mandatory": True, "version": "1.8"},
-        {"id": "care_sg_001", "title": "Safeguarding Adults Policy", "category": "Safeguarding", "description": "Adult safeguarding per Care Act 2014 s42-46", "is_mandatory": True, "version": "3.5"},
-        {"id": "care_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Resident and family complaints handling", "is_mandatory": True, "version": "2.0"},
-        {"id": "care_ra_001", "title": "Moving & Handling Risk Assessment", "category": "Risk Assessments", "description": "LOLER and manual handling assessment", "is_mandatory": True, "version": "2.2"},
-        {"id": "care_sh_001", "title": "Care Worker Handbook", "category": "Staff Handbook", "description": "Staff handbook including Care Certificate standards", "is_mandatory": True, "version": "3.5"},
-        {"id": "care_mp_001", "title": "CQC Rating Display", "category": "Mandatory Posters", "description": "CQC rating and registration certificate display", "is_mandatory": True, "version": "1.0"},
-        {"id": "care_rg_001", "title": "CQC Single Assessment Framework", "category": "Regulatory Guidance", "description": "CQC inspection framework and quality statements", "is_mandatory": True, "version": "2.8"},
-        {"id": "care_dols_001", "title": "DoLS & Mental Capacity Policy", "category": "Regulatory Guidance", "description": "Deprivation of Liberty Safeguards procedures", "is_mandatory": True, "version": "2.5"},
-        {"id": "care_med_001", "title": "Medication Management Policy", "category": "Regulatory Guidance", "description": "Safe handling, storage, and administration of medicines", "is_mandatory": True, "version": "3.0"},
-        {"id": "care_falls_001", "title": "Falls Prevention Policy", "category": "Risk Assessments", "description": "Falls risk assessment and prevention strategy", "is_mandatory": True, "version": "2.0"},
-    ],
-    "veterinary": [
-        {"id": "vet_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Veterinary practice H&S policy including animal handling risks", "is_mandatory": True, "version": "2.5"},
-        {"id": "vet_gdpr_001", "title": "Client Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR policy for client and animal records", "is_mandatory": True, "version": "2.0"},
-        {"id": "vet_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Equal opportunities policy", "is_mandatory": True, "version": "1.5"},
-        {"id": "vet_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Client complaints handling aligned with RCVS guidance", "is_mandatory": True, "version": "1.8"},
-        {"id": "vet_ra_001", "title": "Clinical Risk Assessment", "category": "Risk Assessments", "description": "Veterinary clinical and zoonotic risk assessment", "is_mandatory": True, "version": "2.2"},
-        {"id": "vet_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Employee handbook including RCVS Code of Conduct", "is_mandatory": True, "version": "3.0"},
-        {"id": "vet_rg_001", "title": "RCVS Practice Standards", "category": "Regulatory Guidance", "description": "RCVS Practice Standards Scheme requirements", "is_mandatory": True, "version": "2.5"},
-        {"id": "vet_cd_001", "title": "Controlled Drugs Policy", "category": "Regulatory Guidance", "description": "Veterinary medicines and controlled drugs handling", "is_mandatory": True, "version": "2.0"},
-        {"id": "vet_ic_001", "title": "Infection Control Policy", "category": "Infection Control", "description": "Biosecurity and infection prevention", "is_mandatory": True, "version": "2.0"},
-        {"id": "vet_rad_001", "title": "Radiation Protection Policy", "category": "Health & Safety", "description": "IR(ME)R and ionising radiation safety", "is_mandatory": True, "version": "1.5"},
-    ],
-    "nursery": [
-        {"id": "nur_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Early years health and safety policy", "is_mandatory": True, "version": "3.0"},
-        {"id": "nur_gdpr_001", "title": "Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR policy for children's records and photographs", "is_mandatory": True, "version": "2.5"},
-        {"id": "nur_eq_001", "title": "Equality & Inclusion Policy", "category": "Equality & Diversity", "description": "SEND and equality policy for early years", "is_mandatory": True, "version": "2.0"},
-        {"id": "nur_sg_001", "title": "Child Safeguarding Policy", "category": "Safeguarding", "description": "Safeguarding children per Working Together 2023 and KCSIE", "is_mandatory": True, "version": "4.0"},
-        {"id": "nur_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Parent complaints handling", "is_mandatory": True, "version": "2.0"},
-        {"id": "nur_ra_001", "title": "Daily Risk Assessments", "category": "Risk Assessments", "description": "Indoor and outdoor activity risk assessments", "is_mandatory": True, "version": "2.5"},
-        {"id": "nur_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "EYFS requirements and staff conduct", "is_mandatory": True, "version": "3.5"},
-        {"id": "nur_rg_001", "title": "Ofsted Requirements Guide", "category": "Regulatory Guidance", "description": "Early Years Inspection Framework guidance", "is_mandatory": True, "version": "3.0"},
-        {"id": "nur_prevent_001", "title": "Prevent Duty Policy", "category": "Safeguarding", "description": "Counter-terrorism and British values", "is_mandatory": True, "version": "2.0"},
-        {"id": "nur_food_001", "title": "Food Safety Policy", "category": "Food Safety", "description": "Food hygiene and allergy management", "is_mandatory": True, "version": "2.5"},
-        {"id": "nur_eyfs_001", "title": "EYFS Curriculum Policy", "category": "Regulatory Guidance", "description": "Early Years Foundation Stage delivery", "is_mandatory": True, "version": "2.0"},
-    ],
-    "education": [
-        {"id": "edu_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "School/college H&S policy", "is_mandatory": True, "version": "3.0"},
-        {"id": "edu_gdpr_001", "title": "Student Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR policy for student records and consent", "is_mandatory": True, "version": "2.5"},
-        {"id": "edu_eq_001", "title": "Equality & Accessibility Plan", "category": "Equality & Diversity", "description": "Public Sector Equality Duty compliance", "is_mandatory": True, "version": "2.0"},
-        {"id": "edu_sg_001", "title": "Child Protection Policy", "category": "Safeguarding", "description": "Keeping Children Safe in Education 2024 compliant", "is_mandatory": True, "version": "4.0"},
-        {"id": "edu_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Parent and student complaints procedure", "is_mandatory": True, "version": "2.2"},
-        {"id": "edu_ra_001", "title": "Educational Visit Risk Assessment", "category": "Risk Assessments", "description": "School trip and activity risk assessments", "is_mandatory": True, "version": "2.8"},
-        {"id": "edu_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Staff code of conduct and professional standards", "is_mandatory": True, "version": "3.5"},
-        {"id": "edu_rg_001", "title": "Ofsted Framework Guide", "category": "Regulatory Guidance", "description": "Education Inspection Framework guidance", "is_mandatory": True, "version": "3.0"},
-        {"id": "edu_prevent_001", "title": "Prevent Duty Policy", "category": "Safeguarding", "description": "Counter-terrorism duty in education", "is_mandatory": True, "version": "2.5"},
-        {"id": "edu_behaviour_001", "title": "Behaviour Policy", "category": "Regulatory Guidance", "description": "Behaviour in schools guidance compliance", "is_mandatory": True, "version": "2.0"},
-    ],
-    "construction": [
-        {"id": "const_hs_001", "title": "Construction H&S Policy", "category": "Health & Safety", "description": "CDM 2015 compliant health and safety policy", "is_mandatory": True, "version": "3.2"},
-        {"id": "const_gdpr_001", "title": "Employee Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR policy for workforce data", "is_mandatory": True, "version": "1.5"},
-        {"id": "const_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Construction industry equality policy", "is_mandatory": True, "version": "1.8"},
-        {"id": "const_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Client and subcontractor complaints", "is_mandatory": True, "version": "1.5"},
-        {"id": "const_ra_001", "title": "Site Risk Assessment", "category": "Risk Assessments", "description": "CDM principal contractor risk assessment", "is_mandatory": True, "version": "4.0"},
-        {"id": "const_ra_002", "title": "COSHH Assessment", "category": "Risk Assessments", "description": "Hazardous substances assessment", "is_mandatory": True, "version": "2.5"},
-        {"id": "const_sh_001", "title": "Site Worker Handbook", "category": "Staff Handbook", "description": "Construction worker safety rules and induction", "is_mandatory": True, "version": "3.0"},
-        {"id": "const_rg_001", "title": "HSE CDM 2015 Guide", "category": "Regulatory Guidance", "description": "Construction Design and Management Regulations guidance", "is_mandatory": True, "version": "2.0"},
-        {"id": "const_asb_001", "title": "Asbestos Management Plan", "category": "Health & Safety", "description": "Control of Asbestos Regulations 2012 compliance", "is_mandatory": True, "version": "2.5"},
-        {"id": "const_method_001", "title": "Method Statement Templates", "category": "Risk Assessments", "description": "Safe system of work templates", "is_mandatory": True, "version": "2.0"},
-        {"id": "const_env_001", "title": "Environmental Policy", "category": "Environmental", "description": "Site waste management and environmental protection", "is_mandatory": True, "version": "2.0"},
-    ],
-    "hospitality": [
-        {"id": "hosp_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Hospitality sector H&S policy", "is_mandatory": True, "version": "2.8"},
-        {"id": "hosp_gdpr_001", "title": "Guest Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR policy for guest data and CCTV", "is_mandatory": True, "version": "2.0"},
-        {"id": "hosp_eq_001", "title": "Equality & Accessibility Policy", "category": "Equality & Diversity", "description": "Accessible premises and services", "is_mandatory": True, "version": "1.5"},
-        {"id": "hosp_cp_001", "title": "Guest Complaints Procedure", "category": "Complaints Procedures", "description": "Guest complaints and feedback handling", "is_mandatory": True, "version": "2.2"},
-        {"id": "hosp_ra_001", "title": "Food Safety Risk Assessment", "category": "Food Safety", "description": "HACCP-based food safety management", "is_mandatory": True, "version": "3.5"},
-        {"id": "hosp_fire_001", "title": "Fire Safety Policy", "category": "Fire Safety", "description": "Fire risk assessment and evacuation per Regulatory Reform Order 2005", "is_mandatory": True, "version": "2.0"},
-        {"id": "hosp_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Hospitality staff handbook", "is_mandatory": True, "version": "3.2"},
-        {"id": "hosp_allergen_001", "title": "Allergen Management Policy", "category": "Food Safety", "description": "14 allergens compliance and Natasha's Law", "is_mandatory": True, "version": "2.5"},
-        {"id": "hosp_lic_001", "title": "Licensing Compliance Guide", "category": "Regulatory Guidance", "description": "Premises licence and licensing objectives", "is_mandatory": True, "version": "2.0"},
-    ],
-    "restaurant": [
-        {"id": "rest_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Restaurant H&S policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "rest_gdpr_001", "title": "Customer Data Policy", "category": "GDPR & Data Protection", "description": "Booking and payment data protection", "is_mandatory": True, "version": "2.0"},
-        {"id": "rest_food_001", "title": "Food Safety Management System", "category": "Food Safety", "description": "HACCP and Safer Food Better Business", "is_mandatory": True, "version": "3.0"},
-        {"id": "rest_allergen_001", "title": "Allergen Policy", "category": "Food Safety", "description": "Allergen information and cross-contamination prevention", "is_mandatory": True, "version": "2.5"},
-        {"id": "rest_fire_001", "title": "Fire Safety Policy", "category": "Fire Safety", "description": "Kitchen fire safety and evacuation", "is_mandatory": True, "version": "2.0"},
-        {"id": "rest_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Restaurant staff policies", "is_mandatory": True, "version": "2.5"},
-        {"id": "rest_rg_001", "title": "Food Hygiene Rating Guide", "category": "Regulatory Guidance", "description": "Achieving and maintaining 5-star rating", "is_mandatory": True, "version": "2.0"},
-    ],
-    "retail": [
-        {"id": "ret_hs_001", "title": "Retail Health & Safety Policy", "category": "Health & Safety", "description": "Retail sector H&S policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "ret_gdpr_001", "title": "Customer Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR for retail customers and loyalty schemes", "is_mandatory": True, "version": "2.2"},
-        {"id": "ret_eq_001", "title": "Equality & Accessibility Policy", "category": "Equality & Diversity", "description": "Accessible retail premises", "is_mandatory": True, "version": "1.8"},
-        {"id": "ret_cp_001", "title": "Customer Complaints Policy", "category": "Complaints Procedures", "description": "Returns, refunds, and complaints", "is_mandatory": True, "version": "2.0"},
-        {"id": "ret_ra_001", "title": "Store Risk Assessment", "category": "Risk Assessments", "description": "Retail premises risk assessment", "is_mandatory": True, "version": "2.5"},
-        {"id": "ret_sh_001", "title": "Retail Staff Handbook", "category": "Staff Handbook", "description": "Employee handbook for retail staff", "is_mandatory": True, "version": "3.0"},
-        {"id": "ret_rg_001", "title": "Trading Standards Guide", "category": "Regulatory Guidance", "description": "Consumer Rights Act 2015 compliance", "is_mandatory": True, "version": "2.0"},
-        {"id": "ret_fire_001", "title": "Fire Safety Policy", "category": "Fire Safety", "description": "Retail fire safety and evacuation", "is_mandatory": True, "version": "2.0"},
-    ],
-    "office": [
-        {"id": "off_hs_001", "title": "Office Health & Safety Policy", "category": "Health & Safety", "description": "Office and professional services H&S policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "off_gdpr_001", "title": "Data Protection Policy", "category": "GDPR & Data Protection", "description": "UK GDPR policy for professional services", "is_mandatory": True, "version": "2.8"},
-        {"id": "off_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Office equality and inclusion policy", "is_mandatory": True, "version": "2.0"},
-        {"id": "off_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Client complaints handling", "is_mandatory": True, "version": "1.8"},
-        {"id": "off_ra_001", "title": "DSE Risk Assessment", "category": "Risk Assessments", "description": "Display screen equipment assessment", "is_mandatory": True, "version": "2.2"},
-        {"id": "off_fire_001", "title": "Fire Safety Policy", "category": "Fire Safety", "description": "Office fire risk assessment and evacuation", "is_mandatory": True, "version": "2.0"},
-        {"id": "off_sh_001", "title": "Employee Handbook", "category": "Staff Handbook", "description": "Professional services staff handbook", "is_mandatory": True, "version": "3.5"},
-        {"id": "off_rg_001", "title": "ICO GDPR Guide", "category": "Regulatory Guidance", "description": "Information Commissioner's Office guidance", "is_mandatory": True, "version": "2.5"},
-        {"id": "off_wfh_001", "title": "Remote Working Policy", "category": "Health & Safety", "description": "Home working health and safety", "is_mandatory": True, "version": "2.0"},
-    ],
-    "salon": [
-        {"id": "salon_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Salon H&S policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "salon_gdpr_001", "title": "Client Data Protection Policy", "category": "GDPR & Data Protection", "description": "GDPR for client records and photos", "is_mandatory": True, "version": "2.0"},
-        {"id": "salon_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Client complaints handling", "is_mandatory": True, "version": "1.5"},
-        {"id": "salon_ic_001", "title": "Hygiene & Infection Control", "category": "Infection Control", "description": "Tool sterilisation and hygiene protocols", "is_mandatory": True, "version": "2.5"},
-        {"id": "salon_ra_001", "title": "Treatment Risk Assessments", "category": "Risk Assessments", "description": "Risk assessments for salon treatments", "is_mandatory": True, "version": "2.0"},
-        {"id": "salon_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Salon employee handbook", "is_mandatory": True, "version": "2.5"},
-        {"id": "salon_coshh_001", "title": "COSHH Assessment", "category": "Health & Safety", "description": "Chemical product risk assessment", "is_mandatory": True, "version": "2.0"},
-    ],
-    "cleaning": [
-        {"id": "clean_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Cleaning services H&S policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "clean_gdpr_001", "title": "Data Protection Policy", "category": "GDPR & Data Protection", "description": "Client premises access and data handling", "is_mandatory": True, "version": "1.5"},
-        {"id": "clean_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Client complaints handling", "is_mandatory": True, "version": "1.5"},
-        {"id": "clean_coshh_001", "title": "COSHH Assessment", "category": "Health & Safety", "description": "Cleaning chemicals risk assessment", "is_mandatory": True, "version": "2.5"},
-        {"id": "clean_mh_001", "title": "Manual Handling Policy", "category": "Health & Safety", "description": "Safe lifting and equipment use", "is_mandatory": True, "version": "2.0"},
-        {"id": "clean_sh_001", "title": "Staff Handbook", "category": "Staff Handbook", "description": "Cleaning staff handbook", "is_mandatory": True, "version": "2.0"},
-    ],
-    "security": [
-        {"id": "sec_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "Security services H&S policy", "is_mandatory": True, "version": "2.5"},
-        {"id": "sec_gdpr_001", "title": "Data Protection & CCTV Policy", "category": "GDPR & Data Protection", "description": "GDPR and surveillance camera code compliance", "is_mandatory": True, "version": "2.5"},
-        {"id": "sec_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Non-discriminatory security practices", "is_mandatory": True, "version": "2.0"},
-        {"id": "sec_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Public complaints handling", "is_mandatory": True, "version": "1.5"},
-        {"id": "sec_ra_001", "title": "Violence & Aggression Risk Assessment", "category": "Risk Assessments", "description": "Lone working and conflict situations", "is_mandatory": True, "version": "2.5"},
-        {"id": "sec_sh_001", "title": "Security Officer Handbook", "category": "Staff Handbook", "description": "SIA licence holder handbook", "is_mandatory": True, "version": "2.5"},
-        {"id": "sec_rg_001", "title": "SIA Compliance Guide", "category": "Regulatory Guidance", "description": "Security Industry Authority requirements", "is_mandatory": True, "version": "2.0"},
-    ],
-}
-
-# Default documents for sectors not specifically defined
-DEFAULT_COMPLIANCE_DOCUMENTS = [
-    {"id": "gen_hs_001", "title": "Health & Safety Policy", "category": "Health & Safety", "description": "General workplace health and safety policy", "is_mandatory": True, "version": "2.0"},
-    {"id": "gen_gdpr_001", "title": "Data Protection Policy", "category": "GDPR & Data Protection", "description": "UK GDPR compliance policy", "is_mandatory": True, "version": "2.0"},
-    {"id": "gen_eq_001", "title": "Equality & Diversity Policy", "category": "Equality & Diversity", "description": "Equal opportunities policy", "is_mandatory": True, "version": "1.5"},
-    {"id": "gen_cp_001", "title": "Complaints Procedure", "category": "Complaints Procedures", "description": "Customer and employee complaints handling", "is_mandatory": True, "version": "1.5"},
-    {"id": "gen_ra_001", "title": "Workplace Risk Assessment", "category": "Risk Assessments", "description": "General workplace risk assessment template", "is_mandatory": True, "version": "2.0"},
-    {"id": "gen_fire_001", "title": "Fire Safety Policy", "category": "Fire Safety", "description": "Fire risk assessment and evacuation", "is_mandatory": True, "version": "2.0"},
-    {"id": "gen_sh_001", "title": "Employee Handbook", "category": "Staff Handbook", "description": "General employee handbook", "is_mandatory": True, "version": "2.5"},
-    {"id": "gen_mp_001", "title": "Health & Safety Law Poster", "category": "Mandatory Posters", "description": "HSE approved poster", "is_mandatory": True, "version": "1.0"},
-]
-
 # ======================= AUTH ROUTES =======================
 
 @api_router.post("/auth/signup", response_model=TokenResponse)
@@ -735,7 +405,7 @@ async def signup(user_data: UserCreate):
     user = {
         "id": user_id,
         "email": user_data.email,
-        "password_hash": hash_password(user_data.password),
+        "password_hash": await hash_password(user_data.password),
         "full_name": user_data.full_name,
         "role": "business_owner",
         "created_at": datetime.now(timezone.utc).isoformat()
@@ -759,7 +429,7 @@ async def signup(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=TokenResponse)
 async def login(credentials: UserLogin):
     user = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user or not verify_password(credentials.password, user["password_hash"]):
+    if not user or not await verify_password(credentials.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     token = create_token(user["id"], user["email"], user["role"])
@@ -789,8 +459,11 @@ async def get_me(current_user: dict = Depends(get_current_user)):
 # ======================= BUSINESS ROUTES =======================
 
 @api_router.post("/business", response_model=BusinessResponse)
-async def create_business(business_data: BusinessCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.businesses.find_one({"user_id": current_user["id"]})
+async def create_business(
+    business_data: BusinessCreate,
+    current_user: dict = Depends(get_current_user),
+    existing: Optional[dict] = Depends(get_optional_business)
+):
     if existing:
         raise HTTPException(status_code=400, detail="Business already exists for this user")
     
@@ -810,6 +483,7 @@ async def create_business(business_data: BusinessCreate, current_user: dict = De
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     await db.businesses.insert_one(business)
+    invalidate_business(current_user["id"])
     
     await generate_compliance_checklist(business_id, business_data.sector)
     
@@ -819,18 +493,20 @@ async def create_business(business_data: BusinessCreate, current_user: dict = De
     return BusinessResponse(**{k: v for k, v in business.items() if k != "_id"})
 
 @api_router.get("/business", response_model=Optional[BusinessResponse])
-async def get_business(current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
+async def get_business(business: Optional[dict] = Depends(get_optional_business)):
     if not business:
         return None
     return BusinessResponse(**business)
 
 @api_router.put("/business", response_model=BusinessResponse)
-async def update_business(business_data: BusinessCreate, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
+async def update_business(
+    business_data: BusinessCreate,
+    wait_for_score: bool = False,
+    current_user: dict = Depends(get_current_user),
+    business: dict = Depends(get_current_business)
+):
+    """Update the business. A sector change queues a score recount; pass wait_for_score=true
+    to have it finished before the response."""
     update_data = {
         "name": business_data.name,
         "industry": business_data.industry,
@@ -841,63 +517,75 @@ async def update_business(business_data: BusinessCreate, current_user: dict = De
         "phone": business_data.phone
     }
     
-    if business["sector"] != business_data.sector:
-        # Delete old checklist items
-        await db.checklists.delete_many({"business_id": business["id"]})
-        await generate_compliance_checklist(business["id"], business_data.sector)
-        
-        # Archive old compliance items (don't delete - keep history)
-        await db.compliance_items.update_many(
-            {"business_id": business["id"]},
-            {"$set": {"archived": True, "archived_at": datetime.now(timezone.utc).isoformat()}}
+    # The cached business can be stale (another worker changed it), so whether the sector
+    # changes is decided from Mongo, and the write only applies if the sector is still that
+    invalidate_business(current_user["id"])
+    current = await db.businesses.find_one({"id": business["id"]}, {"_id": 0})
+    sector_changed = current["sector"] != business_data.sector
+    if sector_changed:
+        # Carries over matching checklist rows and compliance items, in one transaction
+        await migrate_business_sector(current, update_data)
+    else:
+        result = await db.businesses.update_one(
+            {"id": business["id"], "sector": current["sector"]}, {"$set": update_data}
         )
-        # Generate new compliance items for new industry
-        await generate_business_compliance_items(business["id"], business_data.sector)
-        # Recalculate score
-        await calculate_compliance_score(business["id"])
-    
-    await db.businesses.update_one({"id": business["id"]}, {"$set": update_data})
+        if not result.matched_count:
+            raise HTTPException(status_code=409, detail="The business was changed by another request; please retry")
+    invalidate_business(current_user["id"])
+    if sector_changed:
+        # After the update, so the recount records the new sector
+        await recalculate_compliance_score(business["id"], wait=wait_for_score)
     updated = await db.businesses.find_one({"id": business["id"]}, {"_id": 0})
     return BusinessResponse(**updated)
 
 # ======================= COMPLIANCE CHECKLIST ROUTES =======================
 
+def checklist_template_fields(doc: Mapping) -> dict:
+    """The fields of a checklist row that come from its catalog document"""
+    return {
+        "document_id": doc["id"],
+        "title": doc["title"],
+        "category": doc["category"],
+        "description": doc["description"],
+        "is_mandatory": doc["is_mandatory"],
+        "version": doc["version"]
+    }
+
+def checklist_match_key(row: Mapping) -> tuple:
+    """What identifies the same document across sector libraries, whose ids all differ"""
+    return (row.get("category"), row.get("title"))
+
+def new_checklist_item(business_id: str, doc: Mapping, now: datetime) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "business_id": business_id,
+        **checklist_template_fields(doc),
+        "status": "not_started",
+        "last_reviewed": None,
+        "next_review_due": now + timedelta(days=365),
+        "created_at": now
+    }
+
 async def generate_compliance_checklist(business_id: str, sector: str):
-    documents = COMPLIANCE_DOCUMENTS.get(sector, DEFAULT_COMPLIANCE_DOCUMENTS)
+    documents = get_catalog().sector(sector).documents
     now = datetime.now(timezone.utc)
-    
-    for doc in documents:
-        checklist_item = {
-            "id": str(uuid.uuid4()),
-            "business_id": business_id,
-            "document_id": doc["id"],
-            "title": doc["title"],
-            "category": doc["category"],
-            "description": doc["description"],
-            "status": "not_started",
-            "is_mandatory": doc["is_mandatory"],
-            "version": doc["version"],
-            "last_reviewed": None,
-            "next_review_due": (now + timedelta(days=365)).isoformat(),
-            "created_at": now.isoformat()
-        }
-        await db.checklists.insert_one(checklist_item)
+    if documents:
+        await db.checklists.insert_many([new_checklist_item(business_id, doc, now) for doc in documents])
+    await checklist_counts.adjust(business_id, len(documents))
 
 @api_router.get("/checklist", response_model=List[ChecklistItemResponse])
-async def get_checklist(current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
-    
-    items = await db.checklists.find({"business_id": business["id"]}, {"_id": 0}).to_list(1000)
+async def get_checklist(
+    response: Response,
+    limit: int = Query(1000, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    business: dict = Depends(get_current_business)
+):
+    items, next_cursor = await fetch_page(db.checklists, {"business_id": business["id"]}, limit, after)
+    set_page_headers(response, next_cursor, await checklist_counts.get(business["id"]))
     return [ChecklistItemResponse(**item) for item in items]
 
 @api_router.put("/checklist/{item_id}/status")
-async def update_checklist_status(item_id: str, status: str, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
+async def update_checklist_status(item_id: str, status: str, business: dict = Depends(get_current_business)):
     item = await db.checklists.find_one({"id": item_id, "business_id": business["id"]})
     if not item:
         raise HTTPException(status_code=404, detail="Checklist item not found")
@@ -909,69 +597,242 @@ async def update_checklist_status(item_id: str, status: str, current_user: dict
     update_data = {"status": status}
     
     if status == "complete":
-        update_data["last_reviewed"] = now.isoformat()
-        update_data["next_review_due"] = (now + timedelta(days=365)).isoformat()
+        update_data["last_reviewed"] = now
+        update_data["next_review_due"] = now + timedelta(days=365)
     
     await db.checklists.update_one({"id": item_id}, {"$set": update_data})
     return {"message": "Status updated successfully"}
 
 # ======================= DOCUMENTS ROUTES =======================
 
+# Sector libraries only change with the catalog, so each is validated and rendered once per
+# catalog version. Keyed by the business's sector as stored: unknown sectors share the default
+# library but echo their own id, so the cache is bounded.
+DOCUMENT_CACHE_SECTORS = int(os.environ.get("DOCUMENT_CACHE_SECTORS", "64"))
+# Revalidate every time: the library a business sees changes when it switches sector
+DOCUMENT_CACHE_CONTROL = "private, no-cache"
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SECTORS)
+def rendered_document_library(sector: str, catalog_version: str) -> Tuple[PrerenderedJSON, Dict[str, PrerenderedJSON]]:
+    """A sector's document list and each of its documents, rendered once per catalog version"""
+    documents = [
+        DocumentResponse(**doc, sector=sector, file_url=None).model_dump(mode="json")
+        for doc in get_catalog().sector(sector).documents
+    ]
+    return PrerenderedJSON(documents), {doc["id"]: PrerenderedJSON(doc) for doc in documents}
+
 @api_router.get("/documents", response_model=List[DocumentResponse])
-async def get_documents(current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
-    
-    sector = business["sector"]
-    documents = COMPLIANCE_DOCUMENTS.get(sector, DEFAULT_COMPLIANCE_DOCUMENTS)
-    
-    return [DocumentResponse(
-        id=doc["id"],
-        title=doc["title"],
-        category=doc["category"],
-        description=doc["description"],
-        sector=sector,
-        file_url=None,
-        version=doc["version"],
-        last_updated=datetime.now(timezone.utc).isoformat(),
-        is_mandatory=doc["is_mandatory"]
-    ) for doc in documents]
+async def get_documents(request: Request, business: dict = Depends(get_current_business)):
+    documents, _ = rendered_document_library(business["sector"], get_catalog().version)
+    return documents.response(request, DOCUMENT_CACHE_CONTROL)
 
 @api_router.get("/documents/{document_id}", response_model=DocumentResponse)
-async def get_document(document_id: str, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
-    sector = business["sector"]
-    documents = COMPLIANCE_DOCUMENTS.get(sector, DEFAULT_COMPLIANCE_DOCUMENTS)
-    
-    doc = next((d for d in documents if d["id"] == document_id), None)
-    if not doc:
+async def get_document(document_id: str, request: Request, business: dict = Depends(get_current_business)):
+    _, documents_by_id = rendered_document_library(business["sector"], get_catalog().version)
+    document = documents_by_id.get(document_id)
+    if not document:
         raise HTTPException(status_code=404, detail="Document not found")
-    
-    return DocumentResponse(
-        id=doc["id"],
-        title=doc["title"],
-        category=doc["category"],
-        description=doc["description"],
-        sector=sector,
-        file_url=None,
-        version=doc["version"],
-        last_updated=datetime.now(timezone.utc).isoformat(),
-        is_mandatory=doc["is_mandatory"]
+    return document.response(request, DOCUMENT_CACHE_CONTROL)
+
+# ======================= EMPLOYEE COMPLIANCE ROLLUP =======================
+
+# One document per business in db.employee_compliance_rollups holding requirement counts by
+# stored status for active employees, plus the most overdue / soonest expiring requirements.
+# Writes keep it current with $inc; the lists are re-read only when a listed status is touched.
+ROLLUP_LIST_SIZE = 10
+ROLLUP_LISTED_STATUSES = ("expired", "expiring_soon")
+
+async def _rollup_item_lists(business_id: str) -> dict:
+    employees = await db.employees.find(
+        {"business_id": business_id, "is_active": True},
+        {"_id": 0, "id": 1, "first_name": 1, "last_name": 1}
+    ).to_list(None)
+    names = {emp["id"]: f"{emp['first_name']} {emp['last_name']}" for emp in employees}
+    
+    lists = {}
+    for status in ROLLUP_LISTED_STATUSES:
+        requirements = await db.employee_requirements.find(
+            {"employee_id": {"$in": list(names)}, "status": status},
+            {"_id": 0, "id": 1, "employee_id": 1, "title": 1, "expiry_date": 1}
+        ).sort("expiry_date", 1).to_list(ROLLUP_LIST_SIZE)
+        lists[f"{status}_items"] = [{
+            "employee_name": names[req["employee_id"]],
+            "employee_id": req["employee_id"],
+            "requirement": req["title"],
+            "requirement_id": req["id"],
+            "expiry_date": req.get("expiry_date")
+        } for req in requirements]
+    return lists
+
+async def rebuild_employee_compliance_rollup(business_id: str) -> dict:
+    """Recount the rollup from employee_requirements and store it"""
+    employee_ids = await db.employees.distinct("id", {"business_id": business_id, "is_active": True})
+    counts = {"valid": 0, "expired": 0, "expiring_soon": 0, "pending": 0}
+    async for row in db.employee_requirements.aggregate([
+        {"$match": {"employee_id": {"$in": employee_ids}}},
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+    ]):
+        counts[row["_id"]] = counts.get(row["_id"], 0) + row["count"]
+    
+    rollup = {
+        "business_id": business_id,
+        "total_employees": len(employee_ids),
+        "counts": counts,
+        **await _rollup_item_lists(business_id),
+        "updated_at": datetime.now(timezone.utc).isoformat()
+    }
+    await db.employee_compliance_rollups.replace_one({"business_id": business_id}, rollup, upsert=True)
+    return rollup
+
+async def get_employee_compliance_rollup(business_id: str) -> dict:
+    """Read the rollup, building it on first use"""
+    rollup = await db.employee_compliance_rollups.find_one({"business_id": business_id}, {"_id": 0})
+    if not rollup:
+        rollup = await rebuild_employee_compliance_rollup(business_id)
+    return rollup
+
+async def update_employee_compliance_rollup(
+    business_id: str,
+    status_deltas: Optional[Dict[str, int]] = None,
+    employees_delta: int = 0,
+    refresh_lists: bool = False
+):
+    """Apply count changes to a business rollup, re-reading the item lists if a listed status moved"""
+    status_deltas = {status: n for status, n in (status_deltas or {}).items() if n}
+    inc = {f"counts.{status}": n for status, n in status_deltas.items()}
+    if employees_delta:
+        inc["total_employees"] = employees_delta
+    refresh_lists = refresh_lists or any(status in ROLLUP_LISTED_STATUSES for status in status_deltas)
+    if not inc and not refresh_lists:
+        return
+    
+    update = {"$set": {"updated_at": datetime.now(timezone.utc).isoformat()}}
+    if inc:
+        update["$inc"] = inc
+    if refresh_lists:
+        update["$set"].update(await _rollup_item_lists(business_id))
+    # No upsert: a business without a rollup gets one built on first read
+    await db.employee_compliance_rollups.update_one({"business_id": business_id}, update)
+
+# ======================= REQUIREMENT EXPIRY SWEEPER =======================
+
+# Stored requirement statuses only move on writes, so time passing is handled here: each run
+# range-queries the expiry_date index for requirements that crossed the 0-day (expired) or
+# 31-day (expiring_soon, matching calculate_requirement_status) boundary since the previous
+# run and flips them in bulk. Reads can then trust the stored status.
+EXPIRY_SWEEP_INTERVAL_SECONDS = int(os.environ.get("EXPIRY_SWEEP_INTERVAL_SECONDS", "3600"))
+EXPIRY_SWEEP_JOB_ID = "requirement_expiry_sweep"
+EXPIRING_SOON_WINDOW = timedelta(days=31)
+
+async def claim_job_run(job_id: str, now: datetime, min_interval: Optional[timedelta] = None) -> tuple:
+    """Move a background job's last_run_at to now. Returns (claimed, previous last_run_at).
+
+    The compare-and-set means concurrent workers never claim the same run twice. With
+    min_interval, a job that last ran more recently than that is not claimed.
+    """
+    state = await db.job_state.find_one({"_id": job_id})
+    last_run_at = state.get("last_run_at") if state else None
+    if min_interval and last_run_at and now - as_utc(last_run_at) < min_interval:
+        return False, last_run_at
+    try:
+        result = await db.job_state.update_one(
+            {"_id": job_id, "last_run_at": last_run_at},
+            {"$set": {"last_run_at": now}},
+            upsert=state is None
+        )
+    except DuplicateKeyError:
+        return False, last_run_at
+    claimed = result.modified_count == 1 or result.upserted_id is not None
+    return claimed, last_run_at
+
+async def release_job_run(job_id: str, claimed_at: datetime, last_run_at: Optional[datetime]) -> None:
+    """Undo claim_job_run after a failed run, so the next run covers its window again.
+
+    Only if nothing has claimed the job since, so a later successful run is never rolled back.
+    """
+    await db.job_state.update_one({"_id": job_id, "last_run_at": claimed_at}, {"$set": {"last_run_at": last_run_at}})
+
+async def sweep_requirement_expiry(now: Optional[datetime] = None) -> dict:
+    """Flip requirements whose expiry boundary passed since the last sweep and update rollups"""
+    now = now or datetime.now(timezone.utc)
+    claimed, last_run_at = await claim_job_run(EXPIRY_SWEEP_JOB_ID, now)
+    if not claimed:
+        return {"skipped": True, "expired": 0, "expiring_soon": 0}
+    try:
+        changes = await _sweep_expiry_windows(as_utc(last_run_at), now)
+    except Exception:
+        # The window since last_run_at is only swept once; leave it for the next run
+        await release_job_run(EXPIRY_SWEEP_JOB_ID, now, last_run_at)
+        raise
+    
+    summary = {
+        "skipped": False,
+        "expired": sum(1 for *_, new in changes if new == "expired"),
+        "expiring_soon": sum(1 for *_, new in changes if new == "expiring_soon"),
+    }
+    logger.info(f"Requirement expiry sweep: {summary['expired']} expired, {summary['expiring_soon']} expiring soon")
+    return summary
+
+async def _sweep_expiry_windows(since: Optional[datetime], now: datetime) -> list:
+    """Flip the requirements that crossed a boundary in (since, now]; returns the changes made"""
+    # The first run has no lower bound, so it also catches anything stale from before the sweeper
+    windows = (
+        ("expired", since, now, ["expired"]),
+        # Anything already past now is in the expired window instead
+        ("expiring_soon", max(since + EXPIRING_SOON_WINDOW, now) if since else now, now + EXPIRING_SOON_WINDOW, ["expiring_soon", "expired"]),
     )
+    changes = []
+    for new_status, start, end, skip_statuses in windows:
+        expiry_range = {"$lt": end}
+        if start:
+            expiry_range["$gte"] = start
+        async for req in db.employee_requirements.find(
+            {"expiry_date": expiry_range, "status": {"$nin": skip_statuses}},
+            {"_id": 0, "id": 1, "employee_id": 1, "status": 1}
+        ):
+            changes.append((req["id"], req["employee_id"], req.get("status"), new_status))
+    
+    if changes:
+        await db.employee_requirements.bulk_write(
+            [UpdateOne({"id": req_id}, {"$set": {"status": new}}) for req_id, _, _, new in changes],
+            ordered=False
+        )
+        
+        # Only active employees are counted in the rollups
+        employees = await db.employees.find(
+            {"id": {"$in": list({employee_id for _, employee_id, _, _ in changes})}, "is_active": True},
+            {"_id": 0, "id": 1, "business_id": 1}
+        ).to_list(None)
+        business_of = {emp["id"]: emp["business_id"] for emp in employees}
+        deltas: Dict[str, Dict[str, int]] = {}
+        for _, employee_id, old, new in changes:
+            if employee_id in business_of:
+                business_deltas = deltas.setdefault(business_of[employee_id], {})
+                business_deltas[old] = business_deltas.get(old, 0) - 1
+                business_deltas[new] = business_deltas.get(new, 0) + 1
+        for business_id, status_deltas in deltas.items():
+            await update_employee_compliance_rollup(business_id, status_deltas)
+    return changes
+
+async def run_expiry_sweeper(interval_seconds: int):
+    while True:
+        try:
+            await sweep_requirement_expiry()
+        except Exception as e:
+            logger.error(f"Requirement expiry sweep failed: {e}")
+        await asyncio.sleep(interval_seconds)
 
 # ======================= EMPLOYEE ROUTES =======================
 
-@api_router.post("/employees", response_model=EmployeeResponse)
-async def create_employee(employee_data: EmployeeCreate, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
-    
+EMPLOYEE_IMPORT_BATCH_SIZE = 500
+EMPLOYEE_IMPORT_MAX_ROWS = 10000
+EMPLOYEE_IMPORT_MAX_REPORTED_ERRORS = 500
+EMPLOYEE_IMPORT_COLUMNS = tuple(EmployeeCreate.model_fields)
+
+def build_employee_documents(business: dict, employee_data: EmployeeCreate) -> tuple:
+    """The employee document and its sector's generated requirement documents"""
     employee_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
     employee = {
         "id": employee_id,
         "business_id": business["id"],
@@ -984,99 +845,155 @@ async def create_employee(employee_data: EmployeeCreate, current_user: dict = De
         "phone": employee_data.phone,
         "emergency_contact": employee_data.emergency_contact,
         "is_active": True,
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": now.isoformat()
     }
-    await db.employees.insert_one(employee)
     
     # Auto-generate required compliance items for the employee based on sector
     sector = business["sector"]
-    requirements = EMPLOYEE_REQUIREMENTS.get(sector, DEFAULT_EMPLOYEE_REQUIREMENTS)
-    
-    for req in requirements:
-        requirement = {
-            "id": str(uuid.uuid4()),
-            "employee_id": employee_id,
-            "requirement_type": req["type"],
-            "title": req["title"],
-            "description": req["description"],
-            "issue_date": None,
-            "expiry_date": None,
-            "reference_number": None,
-            "status": "pending",
-            "is_mandatory": req["mandatory"],
-            "renewal_months": req["renewal_months"],
-            "created_at": datetime.now(timezone.utc).isoformat()
-        }
-        await db.employee_requirements.insert_one(requirement)
+    requirements = [{
+        "id": str(uuid.uuid4()),
+        "employee_id": employee_id,
+        "requirement_type": req["type"],
+        "title": req["title"],
+        "description": req["description"],
+        "issue_date": None,
+        "expiry_date": None,
+        "reference_number": None,
+        "status": "pending",
+        "is_mandatory": req["mandatory"],
+        "renewal_months": req["renewal_months"],
+        "created_at": now
+    } for req in get_catalog().sector(sector).employee_requirements]
+    
+    return employee, requirements
+
+async def insert_employees(business_id: str, employees: List[dict], requirements: List[dict]):
+    await db.employees.insert_many(employees, ordered=False)
+    await employee_counts.adjust(business_id, len(employees))
+    if requirements:
+        await db.employee_requirements.insert_many(requirements, ordered=False)
+    await update_employee_compliance_rollup(business_id, {"pending": len(requirements)}, employees_delta=len(employees))
+
+@api_router.post("/employees", response_model=EmployeeResponse)
+async def create_employee(employee_data: EmployeeCreate, business: dict = Depends(get_current_business)):
+    employee, requirements = build_employee_documents(business, employee_data)
+    await insert_employees(business["id"], [employee], requirements)
     
     return EmployeeResponse(**{k: v for k, v in employee.items() if k != "_id"})
 
-@api_router.get("/employees", response_model=List[EmployeeResponse])
-async def get_employees(current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
+def read_employee_import_batch(rows, business: dict, row_number: int) -> tuple:
+    """Parse and validate CSV rows until a batch of valid employees is ready or the file ends.
     
-    employees = await db.employees.find({"business_id": business["id"]}, {"_id": 0}).to_list(1000)
+    Blocking: the upload is decoded from its spooled file as rows are read, so the import
+    handler runs this in a worker thread. Returns (employees, requirements, failures,
+    row_number, finished), where failures are (row number, messages, fatal) tuples and a
+    fatal failure ends the import.
+    """
+    employees, requirements, failures = [], [], []
+    try:
+        for row_number, row in rows:
+            if row_number - 1 > EMPLOYEE_IMPORT_MAX_ROWS:
+                failures.append((row_number, [f"Import stopped at this row: files are limited to {EMPLOYEE_IMPORT_MAX_ROWS} rows"], True))
+                return employees, requirements, failures, row_number, True
+            
+            # Blank cells mean "not provided"
+            values = {col: (row.get(col) or "").strip() for col in EMPLOYEE_IMPORT_COLUMNS}
+            values = {col: value for col, value in values.items() if value}
+            try:
+                employee_data = EmployeeCreate(**values)
+                as_utc(employee_data.start_date)
+            except ValidationError as e:
+                failures.append((row_number, [f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()], False))
+                continue
+            except ValueError:
+                failures.append((row_number, ["start_date: expected an ISO 8601 date"], False))
+                continue
+            
+            employee, employee_requirements = build_employee_documents(business, employee_data)
+            employees.append(employee)
+            requirements.extend(employee_requirements)
+            if len(employees) >= EMPLOYEE_IMPORT_BATCH_SIZE:
+                return employees, requirements, failures, row_number, False
+    except (UnicodeDecodeError, csv.Error) as e:
+        # The file is decoded in chunks, so the bad bytes may be a few rows further on
+        failures.append((row_number, [f"Import stopped after this row: the rest of the file could not be read ({e})"], True))
+    return employees, requirements, failures, row_number, True
+
+@api_router.post("/employees/import")
+async def import_employees(file: UploadFile = File(...), business: dict = Depends(get_current_business)):
+    """Bulk-create employees from a CSV with a header row of EmployeeCreate fields.
+    
+    Rows are read and validated a batch at a time off the event loop, and each batch is
+    written before the next is read, so memory stays flat however long the file is. Valid
+    rows are imported even when others fail; failures are reported by row.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8-sig", newline=""))
+    try:
+        columns = await asyncio.to_thread(lambda: reader.fieldnames or [])
+    except (UnicodeDecodeError, csv.Error):
+        raise HTTPException(status_code=400, detail="File must be a UTF-8 encoded CSV")
+    missing = [col for col in ("first_name", "last_name", "job_title", "start_date") if col not in columns]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"CSV is missing required columns: {', '.join(missing)}")
+    
+    imported = 0
+    failed = 0
+    errors = []
+    rows = enumerate(reader, start=2)
+    row_number = 1  # the header
+    finished = False
+    while not finished:
+        employees, requirements, failures, row_number, finished = await asyncio.to_thread(
+            read_employee_import_batch, rows, business, row_number
+        )
+        for failed_row, messages, fatal in failures:
+            failed += 1
+            # Always report why the import stopped, even past the error cap
+            if fatal or len(errors) < EMPLOYEE_IMPORT_MAX_REPORTED_ERRORS:
+                errors.append({"row": failed_row, "errors": messages})
+        if employees:
+            await insert_employees(business["id"], employees, requirements)
+            imported += len(employees)
+    
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors)
+    }
+
+@api_router.get("/employees", response_model=List[EmployeeResponse])
+async def get_employees(
+    response: Response,
+    limit: int = Query(1000, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    business: dict = Depends(get_current_business)
+):
+    employees, next_cursor = await fetch_page(db.employees, {"business_id": business["id"]}, limit, after)
+    set_page_headers(response, next_cursor, await employee_counts.get(business["id"]))
     
     # Add compliance summary for each employee
+    status_counts = await get_requirement_status_counts([emp["id"] for emp in employees])
     result = []
     for emp in employees:
-        requirements = await db.employee_requirements.find({"employee_id": emp["id"]}, {"_id": 0}).to_list(100)
-        
-        total = len(requirements)
-        valid = sum(1 for r in requirements if r["status"] == "valid")
-        expired = sum(1 for r in requirements if r["status"] == "expired")
-        expiring = sum(1 for r in requirements if r["status"] == "expiring_soon")
-        pending = sum(1 for r in requirements if r["status"] == "pending")
-        
-        emp["compliance_summary"] = {
-            "total": total,
-            "valid": valid,
-            "expired": expired,
-            "expiring_soon": expiring,
-            "pending": pending,
-            "compliance_rate": round((valid / total * 100) if total > 0 else 0)
-        }
+        emp["compliance_summary"] = summarise_requirement_statuses(status_counts[emp["id"]])
         result.append(EmployeeResponse(**emp))
     
     return result
 
 @api_router.get("/employees/{employee_id}", response_model=EmployeeResponse)
-async def get_employee(employee_id: str, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
+async def get_employee(employee_id: str, business: dict = Depends(get_current_business)):
     employee = await db.employees.find_one({"id": employee_id, "business_id": business["id"]}, {"_id": 0})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    requirements = await db.employee_requirements.find({"employee_id": employee_id}, {"_id": 0}).to_list(100)
-    
-    total = len(requirements)
-    valid = sum(1 for r in requirements if r["status"] == "valid")
-    expired = sum(1 for r in requirements if r["status"] == "expired")
-    expiring = sum(1 for r in requirements if r["status"] == "expiring_soon")
-    pending = sum(1 for r in requirements if r["status"] == "pending")
-    
-    employee["compliance_summary"] = {
-        "total": total,
-        "valid": valid,
-        "expired": expired,
-        "expiring_soon": expiring,
-        "pending": pending,
-        "compliance_rate": round((valid / total * 100) if total > 0 else 0)
-    }
+    status_counts = await get_requirement_status_counts([employee_id])
+    employee["compliance_summary"] = summarise_requirement_statuses(status_counts[employee_id])
     
     return EmployeeResponse(**employee)
 
 @api_router.put("/employees/{employee_id}", response_model=EmployeeResponse)
-async def update_employee(employee_id: str, employee_data: EmployeeUpdate, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
+async def update_employee(employee_id: str, employee_data: EmployeeUpdate, business: dict = Depends(get_current_business)):
     employee = await db.employees.find_one({"id": employee_id, "business_id": business["id"]})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
@@ -1086,33 +1003,50 @@ async def update_employee(employee_id: str, employee_data: EmployeeUpdate, curre
     if update_data:
         await db.employees.update_one({"id": employee_id}, {"$set": update_data})
     
+    was_active = employee.get("is_active", True)
+    is_active = update_data.get("is_active", was_active)
+    if was_active != is_active:
+        # (De)activating moves all of this employee's requirements in or out of the rollup
+        sign = 1 if is_active else -1
+        status_counts = (await get_requirement_status_counts([employee_id]))[employee_id]
+        await update_employee_compliance_rollup(
+            business["id"],
+            {status: sign * n for status, n in status_counts.items()},
+            employees_delta=sign
+        )
+    elif is_active and ("first_name" in update_data or "last_name" in update_data):
+        await update_employee_compliance_rollup(business["id"], refresh_lists=True)
+    
     updated = await db.employees.find_one({"id": employee_id}, {"_id": 0})
     return EmployeeResponse(**updated)
 
 @api_router.delete("/employees/{employee_id}")
-async def delete_employee(employee_id: str, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
+async def delete_employee(employee_id: str, business: dict = Depends(get_current_business)):
     employee = await db.employees.find_one({"id": employee_id, "business_id": business["id"]})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
+    if employee.get("is_active", True):
+        status_counts = (await get_requirement_status_counts([employee_id]))[employee_id]
+    
     # Delete employee requirements first
     await db.employee_requirements.delete_many({"employee_id": employee_id})
     await db.employees.delete_one({"id": employee_id})
+    await employee_counts.adjust(business["id"], -1)
+    
+    if employee.get("is_active", True):
+        await update_employee_compliance_rollup(
+            business["id"],
+            {status: -n for status, n in status_counts.items()},
+            employees_delta=-1
+        )
     
     return {"message": "Employee deleted successfully"}
 
 # ======================= EMPLOYEE REQUIREMENTS ROUTES =======================
 
 @api_router.get("/employees/{employee_id}/requirements", response_model=List[EmployeeRequirementResponse])
-async def get_employee_requirements(employee_id: str, current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
+async def get_employee_requirements(employee_id: str, business: dict = Depends(get_current_business)):
     employee = await db.employees.find_one({"id": employee_id, "business_id": business["id"]})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
@@ -1133,12 +1067,8 @@ async def update_employee_requirement(
     employee_id: str, 
     requirement_id: str, 
     requirement_data: EmployeeRequirementUpdate,
-    current_user: dict = Depends(get_current_user)
+    business: dict = Depends(get_current_business)
 ):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
     employee = await db.employees.find_one({"id": employee_id, "business_id": business["id"]})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
@@ -1148,6 +1078,9 @@ async def update_employee_requirement(
         raise HTTPException(status_code=404, detail="Requirement not found")
     
     update_data = {k: v for k, v in requirement_data.model_dump().items() if v is not None}
+    for field in ("issue_date", "expiry_date"):
+        if field in update_data:
+            update_data[field] = parse_date_input(update_data[field], field)
     
     # Auto-calculate status based on expiry date
     if "expiry_date" in update_data:
@@ -1158,6 +1091,15 @@ async def update_employee_requirement(
         await db.employee_requirements.update_one({"id": requirement_id}, {"$set": update_data})
     
     updated = await db.employee_requirements.find_one({"id": requirement_id}, {"_id": 0})
+    
+    if employee.get("is_active", True):
+        old_status, new_status = requirement.get("status"), updated.get("status")
+        await update_employee_compliance_rollup(
+            business["id"],
+            {old_status: -1, new_status: 1} if old_status != new_status else None,
+            refresh_lists=new_status in ROLLUP_LISTED_STATUSES
+        )
+    
     status, days_until = calculate_requirement_status(updated.get("expiry_date"))
     updated["status"] = status
     updated["days_until_expiry"] = days_until
@@ -1168,17 +1110,15 @@ async def update_employee_requirement(
 async def add_employee_requirement(
     employee_id: str,
     requirement_data: EmployeeRequirementCreate,
-    current_user: dict = Depends(get_current_user)
+    business: dict = Depends(get_current_business)
 ):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
     employee = await db.employees.find_one({"id": employee_id, "business_id": business["id"]})
     if not employee:
         raise HTTPException(status_code=404, detail="Employee not found")
     
-    status, days_until = calculate_requirement_status(requirement_data.expiry_date)
+    issue_date = parse_date_input(requirement_data.issue_date, "issue_date")
+    expiry_date = parse_date_input(requirement_data.expiry_date, "expiry_date")
+    status, days_until = calculate_requirement_status(expiry_date)
     
     requirement = {
         "id": str(uuid.uuid4()),
@@ -1186,104 +1126,207 @@ async def add_employee_requirement(
         "requirement_type": requirement_data.requirement_type,
         "title": requirement_data.title,
         "description": requirement_data.description,
-        "issue_date": requirement_data.issue_date,
-        "expiry_date": requirement_data.expiry_date,
+        "issue_date": issue_date,
+        "expiry_date": expiry_date,
         "reference_number": requirement_data.reference_number,
         "status": status,
         "is_mandatory": False,
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": datetime.now(timezone.utc)
     }
     await db.employee_requirements.insert_one(requirement)
     
+    if employee.get("is_active", True):
+        await update_employee_compliance_rollup(business["id"], {status: 1})
+    
     requirement["days_until_expiry"] = days_until
     return EmployeeRequirementResponse(**{k: v for k, v in requirement.items() if k != "_id"})
 
+@api_router.put("/employees/requirements/bulk")
+async def bulk_update_employee_requirements(
+    update: EmployeeRequirementBulkUpdate,
+    business: dict = Depends(get_current_business)
+):
+    """Set the same issue/expiry dates on one requirement type for many employees at once"""
+    update_data = {}
+    if update.issue_date is not None:
+        update_data["issue_date"] = parse_date_input(update.issue_date, "issue_date")
+    if update.expiry_date is not None:
+        update_data["expiry_date"] = parse_date_input(update.expiry_date, "expiry_date")
+    if not update_data:
+        raise HTTPException(status_code=400, detail="Provide an issue_date and/or expiry_date")
+    
+    # Every requirement gets the same expiry, so the status is worked out once
+    status, days_until = calculate_requirement_status(update_data.get("expiry_date"))
+    if "expiry_date" in update_data:
+        update_data["status"] = status
+    
+    employee_ids = list(dict.fromkeys(update.employee_ids))
+    employees = await db.employees.find(
+        {"id": {"$in": employee_ids}, "business_id": business["id"]},
+        {"_id": 0, "id": 1, "is_active": 1}
+    ).to_list(None)
+    active = {emp["id"]: emp.get("is_active", True) for emp in employees}
+    not_found = [emp_id for emp_id in employee_ids if emp_id not in active]
+    if not_found:
+        # Ids from another business look the same as ids that don't exist
+        raise HTTPException(status_code=404, detail=f"Employees not found: {', '.join(not_found)}")
+    
+    requirements = await db.employee_requirements.find(
+        {"employee_id": {"$in": list(active)}, "requirement_type": update.requirement_type},
+        {"_id": 0, "id": 1, "employee_id": 1, "status": 1}
+    ).to_list(None)
+    
+    if requirements:
+        await db.employee_requirements.update_many(
+            {"id": {"$in": [req["id"] for req in requirements]}},
+            {"$set": update_data}
+        )
+        
+        if "status" in update_data:
+            status_deltas: Dict[str, int] = {}
+            for req in requirements:
+                if active[req["employee_id"]] and req.get("status") != status:
+                    status_deltas[req.get("status")] = status_deltas.get(req.get("status"), 0) - 1
+                    status_deltas[status] = status_deltas.get(status, 0) + 1
+            await update_employee_compliance_rollup(
+                business["id"], status_deltas, refresh_lists=status in ROLLUP_LISTED_STATUSES
+            )
+    
+    updated_employees = {req["employee_id"] for req in requirements}
+    return {
+        "updated": len(requirements),
+        "status": update_data.get("status"),
+        "days_until_expiry": days_until,
+        "employees_without_requirement": [emp_id for emp_id in active if emp_id not in updated_employees]
+    }
+
 # ======================= EMPLOYEE COMPLIANCE OVERVIEW =======================
 
 @api_router.get("/employees/compliance/overview")
-async def get_employee_compliance_overview(current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
-    employees = await db.employees.find({"business_id": business["id"], "is_active": True}, {"_id": 0}).to_list(1000)
-    
-    total_employees = len(employees)
-    total_requirements = 0
-    valid_requirements = 0
-    expired_requirements = 0
-    expiring_requirements = 0
-    pending_requirements = 0
+async def get_employee_compliance_overview(business: dict = Depends(get_current_business)):
+    rollup = await get_employee_compliance_rollup(business["id"])
+    counts = rollup["counts"]
+    total_requirements = sum(counts.values())
+    valid_requirements = counts.get("valid", 0)
+    compliance_rate = round((valid_requirements / total_requirements * 100) if total_requirements > 0 else 0)
     
     overdue_items = []
-    expiring_soon_items = []
+    for item in rollup["expired_items"]:
+        _, days_until = calculate_requirement_status(item.get("expiry_date"))
+        overdue_items.append({**item, "days_overdue": abs(days_until) if days_until else None})
     
-    for emp in employees:
-        requirements = await db.employee_requirements.find({"employee_id": emp["id"]}, {"_id": 0}).to_list(100)
-        
-        for req in requirements:
-            total_requirements += 1
-            status, days_until = calculate_requirement_status(req.get("expiry_date"))
-            
-            if status == "valid":
-                valid_requirements += 1
-            elif status == "expired":
-                expired_requirements += 1
-                overdue_items.append({
-                    "employee_name": f"{emp['first_name']} {emp['last_name']}",
-                    "employee_id": emp["id"],
-                    "requirement": req["title"],
-                    "requirement_id": req["id"],
-                    "expiry_date": req.get("expiry_date"),
-                    "days_overdue": abs(days_until) if days_until else None
-                })
-            elif status == "expiring_soon":
-                expiring_requirements += 1
-                expiring_soon_items.append({
-                    "employee_name": f"{emp['first_name']} {emp['last_name']}",
-                    "employee_id": emp["id"],
-                    "requirement": req["title"],
-                    "requirement_id": req["id"],
-                    "expiry_date": req.get("expiry_date"),
-                    "days_until_expiry": days_until
-                })
-            else:
-                pending_requirements += 1
-    
-    compliance_rate = round((valid_requirements / total_requirements * 100) if total_requirements > 0 else 0)
+    expiring_soon_items = []
+    for item in rollup["expiring_soon_items"]:
+        _, days_until = calculate_requirement_status(item.get("expiry_date"))
+        expiring_soon_items.append({**item, "days_until_expiry": days_until})
     
     return {
-        "total_employees": total_employees,
+        "total_employees": rollup["total_employees"],
         "total_requirements": total_requirements,
         "valid_requirements": valid_requirements,
-        "expired_requirements": expired_requirements,
-        "expiring_soon_requirements": expiring_requirements,
-        "pending_requirements": pending_requirements,
+        "expired_requirements": counts.get("expired", 0),
+        "expiring_soon_requirements": counts.get("expiring_soon", 0),
+        "pending_requirements": total_requirements - valid_requirements - counts.get("expired", 0) - counts.get("expiring_soon", 0),
         "overall_compliance_rate": compliance_rate,
-        "overdue_items": sorted(overdue_items, key=lambda x: x.get("days_overdue") or 0, reverse=True)[:10],
-        "expiring_soon_items": sorted(expiring_soon_items, key=lambda x: x.get("days_until_expiry") or 999)[:10]
+        "overdue_items": overdue_items,
+        "expiring_soon_items": expiring_soon_items
     }
 
+EMPLOYEE_REGISTER_COLUMNS = (
+    "employee_id", "employee_name", "job_title", "department", "is_active",
+    "requirement_id", "requirement_type", "requirement", "is_mandatory", "status",
+    "issue_date", "expiry_date", "days_until_expiry", "reference_number"
+)
+
+async def employee_register_rows(business_id: str, include_inactive: bool):
+    """Yield one row per employee requirement, straight off a $lookup aggregation cursor"""
+    match = {"business_id": business_id}
+    if not include_inactive:
+        match["is_active"] = True
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"_id": 1}},
+        {"$lookup": {
+            "from": "employee_requirements",
+            "localField": "id",
+            "foreignField": "employee_id",
+            "as": "requirement"
+        }},
+        # Employees with no requirements still get a row
+        {"$unwind": {"path": "$requirement", "preserveNullAndEmptyArrays": True}}
+    ]
+    async for doc in db.employees.aggregate(pipeline):
+        req = doc.get("requirement") or {}
+        _, days_until = calculate_requirement_status(req.get("expiry_date"))
+        yield {
+            "employee_id": doc["id"],
+            "employee_name": f"{doc['first_name']} {doc['last_name']}",
+            "job_title": doc.get("job_title"),
+            "department": doc.get("department"),
+            "is_active": doc.get("is_active", True),
+            "requirement_id": req.get("id"),
+            "requirement_type": req.get("requirement_type"),
+            "requirement": req.get("title"),
+            "is_mandatory": req.get("is_mandatory"),
+            "status": req.get("status"),
+            "issue_date": to_iso(req.get("issue_date")),
+            "expiry_date": to_iso(req.get("expiry_date")),
+            "days_until_expiry": days_until,
+            "reference_number": req.get("reference_number")
+        }
+
+@api_router.get("/employees/requirements/export")
+async def export_employee_register(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    include_inactive: bool = False,
+    business: dict = Depends(get_current_business)
+):
+    """Stream the staff training/requirement register as CSV or NDJSON for inspections"""
+    rows = employee_register_rows(business["id"], include_inactive)
+    
+    if export_format == "ndjson":
+        async def body():
+            async for row in rows:
+                yield json.dumps(row) + "\n"
+        media_type = "application/x-ndjson"
+    else:
+        async def body():
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=EMPLOYEE_REGISTER_COLUMNS)
+            writer.writeheader()
+            async for row in rows:
+                writer.writerow(row)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            yield buffer.getvalue()
+        media_type = "text/csv"
+    
+    filename = f"staff-register-{datetime.now(timezone.utc).date().isoformat()}.{export_format}"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @api_router.get("/employees/requirements/types")
-async def get_requirement_types(current_user: dict = Depends(get_current_user)):
+async def get_requirement_types(business: dict = Depends(get_current_business)):
     """Get available requirement types for the business sector"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
-    sector = business["sector"]
-    requirements = EMPLOYEE_REQUIREMENTS.get(sector, DEFAULT_EMPLOYEE_REQUIREMENTS)
-    
-    return [{"type": req["type"], "title": req["title"], "description": req["description"]} for req in requirements]
+    return [dict(req) for req in get_catalog().sector(business["sector"]).requirement_types]
 
 # ======================= NOTIFICATIONS ROUTES =======================
 
 @api_router.get("/notifications", response_model=List[NotificationResponse])
-async def get_notifications(current_user: dict = Depends(get_current_user)):
-    notifications = await db.notifications.find(
-        {"user_id": current_user["id"]},
-        {"_id": 0}
-    ).sort("created_at", -1).to_list(50)
+async def get_notifications(
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    notifications, next_cursor = await fetch_page(
+        db.notifications, {"user_id": current_user["id"]}, limit, after, newest_first=True
+    )
+    set_page_headers(response, next_cursor, await notification_counts.get(current_user["id"]))
     
     return [NotificationResponse(**n) for n in notifications]
 
@@ -1379,6 +1422,7 @@ async def get_checkout_status(session_id: str, request: Request, current_user: d
             {"user_id": current_user["id"]},
             {"$set": {"subscription_status": "active", "subscription_plan": plan}}
         )
+        invalidate_business(current_user["id"])
         
         notification = {
             "id": str(uuid.uuid4()),
@@ -1390,6 +1434,7 @@ async def get_checkout_status(session_id: str, request: Request, current_user: d
             "created_at": datetime.now(timezone.utc).isoformat()
         }
         await db.notifications.insert_one(notification)
+        await notification_counts.adjust(current_user["id"], 1)
     
     return {
         "status": status.status,
@@ -1429,6 +1474,7 @@ async def stripe_webhook(request: Request):
                         {"user_id": user_id},
                         {"$set": {"subscription_status": "active", "subscription_plan": plan}}
                     )
+                    invalidate_business(user_id)
         
         return {"status": "success"}
     except Exception as e:
@@ -1437,27 +1483,70 @@ async def stripe_webhook(request: Request):
 
 # ======================= REFERENCE DATA ROUTES =======================
 
+# Static per catalog version, so each list is rendered to JSON once and revalidated by ETag
+REFERENCE_CACHE_MAX_AGE_SECONDS = int(os.environ.get("REFERENCE_CACHE_MAX_AGE_SECONDS", "3600"))
+REFERENCE_CACHE_CONTROL = f"public, max-age={REFERENCE_CACHE_MAX_AGE_SECONDS}"
+
+@lru_cache(maxsize=None)
+def rendered_reference(name: str, catalog_version: str) -> PrerenderedJSON:
+    """One catalog reference list, rendered once per catalog version"""
+    catalog = get_catalog()
+    if name == "catalog_version":
+        return PrerenderedJSON({"version": catalog.version})
+    rows = catalog.uk_sectors if name == "uk_sectors" else catalog.reference[name]
+    return PrerenderedJSON([dict(row) if isinstance(row, Mapping) else row for row in rows])
+
+def reference_response(request: Request, name: str, cache_control: str = REFERENCE_CACHE_CONTROL) -> Response:
+    return rendered_reference(name, get_catalog().version).response(request, cache_control)
+
 @api_router.get("/reference/sectors")
-async def get_sectors():
-    return UK_SECTORS
+async def get_sectors(request: Request):
+    return reference_response(request, "uk_sectors")
 
 @api_router.get("/reference/nations")
-async def get_nations():
-    return UK_NATIONS
+async def get_nations(request: Request):
+    return reference_response(request, "nations")
 
 @api_router.get("/reference/business-sizes")
-async def get_business_sizes():
-    return BUSINESS_SIZES
+async def get_business_sizes(request: Request):
+    return reference_response(request, "business_sizes")
 
 @api_router.get("/reference/categories")
-async def get_categories():
-    return COMPLIANCE_CATEGORIES
+async def get_categories(request: Request):
+    return reference_response(request, "document_categories")
+
+@api_router.get("/reference/catalog-version")
+async def get_catalog_version(request: Request):
+    return reference_response(request, "catalog_version")
 
 # ======================= DASHBOARD STATS ROUTES =======================
 
+UPCOMING_REVIEW_DAYS = 30
+UPCOMING_REVIEW_LIMIT = 5
+
+async def get_checklist_dashboard_facets(business_id: str) -> dict:
+    """Checklist status counts and the next reviews due within 30 days, in one aggregation"""
+    now = datetime.now(timezone.utc)
+    window_end = now + timedelta(days=UPCOMING_REVIEW_DAYS)
+    pipeline = [
+        {"$match": {"business_id": business_id}},
+        {"$facet": {
+            "status_counts": [
+                {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+            ],
+            "upcoming_reviews": [
+                {"$match": {"next_review_due": {"$gte": now, "$lte": window_end}}},
+                {"$sort": {"next_review_due": 1}},
+                {"$limit": UPCOMING_REVIEW_LIMIT},
+                {"$project": {"_id": 0, "id": 1, "title": 1, "due_date": "$next_review_due"}}
+            ]
+        }}
+    ]
+    result = await db.checklists.aggregate(pipeline).to_list(1)
+    return result[0] if result else {"status_counts": [], "upcoming_reviews": []}
+
 @api_router.get("/dashboard/stats")
-async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
+async def get_dashboard_stats(business: Optional[dict] = Depends(get_optional_business)):
     if not business:
         return {
             "has_business": False,
@@ -1470,45 +1559,17 @@ async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
             "employee_stats": None
         }
     
-    checklist_items = await db.checklists.find({"business_id": business["id"]}, {"_id": 0}).to_list(1000)
-    
-    total = len(checklist_items)
-    completed = sum(1 for item in checklist_items if item["status"] == "complete")
-    needs_review = sum(1 for item in checklist_items if item["status"] == "needs_review")
-    not_started = sum(1 for item in checklist_items if item["status"] == "not_started")
-    
-    now = datetime.now(timezone.utc)
-    thirty_days = now + timedelta(days=30)
-    upcoming = []
-    
-    for item in checklist_items:
-        if item.get("next_review_due"):
-            try:
-                review_date = datetime.fromisoformat(item["next_review_due"].replace('Z', '+00:00'))
-                if now <= review_date <= thirty_days:
-                    upcoming.append({
-                        "id": item["id"],
-                        "title": item["title"],
-                        "due_date": item["next_review_due"]
-                    })
-            except:
-                pass
-    
-    # Get employee compliance stats
-    employees = await db.employees.find({"business_id": business["id"], "is_active": True}, {"_id": 0}).to_list(1000)
-    total_employees = len(employees)
-    
-    employee_expired = 0
-    employee_expiring = 0
+    # The checklist facet and the employee rollup are independent, so fetch them concurrently
+    checklist_stats, employee_rollup = await asyncio.gather(
+        get_checklist_dashboard_facets(business["id"]),
+        get_employee_compliance_rollup(business["id"])
+    )
     
-    for emp in employees:
-        requirements = await db.employee_requirements.find({"employee_id": emp["id"]}, {"_id": 0}).to_list(100)
-        for req in requirements:
-            status, _ = calculate_requirement_status(req.get("expiry_date"))
-            if status == "expired":
-                employee_expired += 1
-            elif status == "expiring_soon":
-                employee_expiring += 1
+    status_counts = {row["_id"]: row["count"] for row in checklist_stats["status_counts"]}
+    total = sum(status_counts.values())
+    completed = status_counts.get("complete", 0)
+    needs_review = status_counts.get("needs_review", 0)
+    not_started = status_counts.get("not_started", 0)
     
     return {
         "has_business": True,
@@ -1518,237 +1579,37 @@ async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
         "needs_review": needs_review,
         "not_started": not_started,
         "completion_percentage": round((completed / total * 100) if total > 0 else 0),
-        "upcoming_reviews": sorted(upcoming, key=lambda x: x["due_date"])[:5],
+        "upcoming_reviews": checklist_stats["upcoming_reviews"],
         "employee_stats": {
-            "total_employees": total_employees,
-            "expired_requirements": employee_expired,
-            "expiring_soon": employee_expiring
+            "total_employees": employee_rollup["total_employees"],
+            "expired_requirements": employee_rollup["counts"].get("expired", 0),
+            "expiring_soon": employee_rollup["counts"].get("expiring_soon", 0)
         }
     }
 
 # ======================= COMPLIANCE ITEMS & SCORE SYSTEM =======================
 
-# Industry-specific compliance requirements structure
-# This maps to the frontend industries.js and serves as the single source of truth for backend
-INDUSTRY_COMPLIANCE_MODEL = {
-    # Personal & Body Art Services
-    "tattoo_studio": {
-        "name": "Tattoo Artist / Studio",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Prevention & Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "client_consent_form", "title": "Client Consultation & Consent Form", "type": "template", "category": "Client Care", "required": True},
-            {"key": "aftercare_sheet", "title": "Aftercare Advice Sheet", "type": "template", "category": "Client Care", "required": True},
-            {"key": "medical_questionnaire", "title": "Medical History Questionnaire", "type": "template", "category": "Client Care", "required": True},
-            {"key": "coshh_assessment", "title": "COSHH Assessment (Inks, Cleaning Agents)", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "sharps_procedure", "title": "Sharps & Clinical Waste Disposal Procedure", "type": "procedure", "category": "Infection Control", "required": True},
-            {"key": "autoclave_log", "title": "Autoclave Maintenance & Testing Log", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "sterilisation_records", "title": "Sterilisation Records", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "cleaning_checklist", "title": "Equipment Cleaning Checklist", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "Client Privacy Notice (GDPR)", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "staff_training_records", "title": "Staff Training Records", "type": "audit", "category": "Staff Management", "required": True},
-            {"key": "accident_report_form", "title": "Accident & Incident Report Form", "type": "template", "category": "Health & Safety", "required": True},
-            {"key": "age_verification_policy", "title": "Age Verification Policy", "type": "policy", "category": "Client Care", "required": True},
-            {"key": "allergy_screening_form", "title": "Allergy & Sensitivity Screening Form", "type": "template", "category": "Client Care", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "general_hs_risk_assessment", "title": "General Health & Safety Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_risk_assessment", "title": "Infection Control Risk Assessment", "type": "risk_assessment", "category": "Infection Control", "required": True},
-            {"key": "lone_working_risk_assessment", "title": "Lone Working Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": False},
-            {"key": "annual_policy_review", "title": "Annual Policy Review", "type": "audit", "category": "Compliance", "required": True},
-            {"key": "hs_law_poster", "title": "Health & Safety Law Poster", "type": "poster", "category": "Mandatory Posters", "required": True},
-            {"key": "insurance_certificate", "title": "Public Liability Insurance Certificate", "type": "operational", "category": "Insurance", "required": True},
-            {"key": "local_authority_registration", "title": "Local Authority Registration", "type": "operational", "category": "Licensing", "required": True},
-        ]
-    },
-    "piercing_studio": {
-        "name": "Piercing Studio",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Prevention & Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "client_consent_form", "title": "Client Consultation & Consent Form", "type": "template", "category": "Client Care", "required": True},
-            {"key": "parental_consent_form", "title": "Parental Consent Form (for minors)", "type": "template", "category": "Client Care", "required": True},
-            {"key": "aftercare_instructions", "title": "Aftercare Instructions", "type": "template", "category": "Client Care", "required": True},
-            {"key": "medical_questionnaire", "title": "Medical History Questionnaire", "type": "template", "category": "Client Care", "required": True},
-            {"key": "coshh_assessment", "title": "COSHH Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "sharps_procedure", "title": "Sharps & Clinical Waste Procedure", "type": "procedure", "category": "Infection Control", "required": True},
-            {"key": "sterilisation_records", "title": "Sterilisation Records & Autoclave Log", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "cleaning_checklist", "title": "Equipment Cleaning Checklist", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "Client Privacy Notice (GDPR)", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "staff_training_records", "title": "Staff Training Records", "type": "audit", "category": "Staff Management", "required": True},
-            {"key": "accident_report_form", "title": "Accident & Incident Report Form", "type": "template", "category": "Health & Safety", "required": True},
-            {"key": "age_verification_policy", "title": "Age Verification Policy", "type": "policy", "category": "Client Care", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "general_hs_risk_assessment", "title": "General Health & Safety Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-        ]
-    },
-    "microblading_pmu": {
-        "name": "Microblading / PMU",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Prevention & Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "client_consent_form", "title": "Client Consultation & Consent Form", "type": "template", "category": "Client Care", "required": True},
-            {"key": "patch_test_record", "title": "Patch Test Record & Policy", "type": "template", "category": "Client Care", "required": True},
-            {"key": "contraindications_checklist", "title": "Contraindications Checklist", "type": "template", "category": "Client Care", "required": True},
-            {"key": "aftercare_instructions", "title": "Aftercare Instructions", "type": "template", "category": "Client Care", "required": True},
-            {"key": "medical_questionnaire", "title": "Medical History Questionnaire", "type": "template", "category": "Client Care", "required": True},
-            {"key": "coshh_assessment", "title": "COSHH Assessment (Pigments, Numbing)", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "sharps_procedure", "title": "Sharps & Clinical Waste Procedure", "type": "procedure", "category": "Infection Control", "required": True},
-            {"key": "sterilisation_records", "title": "Sterilisation Records", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "cleaning_checklist", "title": "Equipment Cleaning Checklist", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "Client Privacy Notice (GDPR)", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "photo_consent", "title": "Before & After Photo Consent", "type": "template", "category": "GDPR & Data Protection", "required": True},
-            {"key": "colour_expectations_record", "title": "Colour Selection & Expectations Record", "type": "template", "category": "Client Care", "required": True},
-            {"key": "touchup_policy", "title": "Touch-Up & Aftercare Policy", "type": "policy", "category": "Client Care", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "general_hs_risk_assessment", "title": "General Health & Safety Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-        ]
-    },
-    "aesthetics_clinic": {
-        "name": "Aesthetics Clinic",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Prevention & Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "client_assessment_form", "title": "Client Consultation & Assessment Form", "type": "template", "category": "Client Care", "required": True},
-            {"key": "treatment_consent_form", "title": "Treatment Consent Form", "type": "template", "category": "Client Care", "required": True},
-            {"key": "medical_questionnaire", "title": "Medical History Questionnaire", "type": "template", "category": "Client Care", "required": True},
-            {"key": "contraindications_checklist", "title": "Contraindications & Screening Checklist", "type": "template", "category": "Client Care", "required": True},
-            {"key": "aftercare_instructions", "title": "Aftercare Instructions (per treatment)", "type": "template", "category": "Client Care", "required": True},
-            {"key": "coshh_assessment", "title": "COSHH Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "sharps_procedure", "title": "Sharps & Clinical Waste Procedure", "type": "procedure", "category": "Infection Control", "required": True},
-            {"key": "equipment_maintenance_log", "title": "Equipment Maintenance Log", "type": "audit", "category": "Equipment", "required": True},
-            {"key": "product_batch_records", "title": "Product Batch & Traceability Records", "type": "audit", "category": "Equipment", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "Client Privacy Notice (GDPR)", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints & Complications Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "emergency_protocol", "title": "Emergency & Adverse Reaction Protocol", "type": "procedure", "category": "Health & Safety", "required": True},
-            {"key": "photo_consent", "title": "Before & After Photo Consent", "type": "template", "category": "GDPR & Data Protection", "required": True},
-            {"key": "cooling_off_policy", "title": "Cooling-Off Period Policy", "type": "policy", "category": "Client Care", "required": True},
-            {"key": "staff_qualifications_records", "title": "Staff Qualifications & Insurance Records", "type": "audit", "category": "Staff Management", "required": True},
-            {"key": "prescriber_documentation", "title": "Prescriber Arrangement Documentation", "type": "operational", "category": "Regulatory", "required": False},
-            {"key": "clinical_procedures_risk_assessment", "title": "Clinical Procedures Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-        ]
-    },
-    "barber_hairdresser": {
-        "name": "Barber / Hairdresser",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "hygiene_policy", "title": "Hygiene & Infection Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "client_consultation_card", "title": "Client Consultation Card", "type": "template", "category": "Client Care", "required": True},
-            {"key": "allergy_test_record", "title": "Allergy Alert Test Record (colours)", "type": "template", "category": "Client Care", "required": True},
-            {"key": "coshh_assessment", "title": "COSHH Assessment (Hair Products)", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "sharps_procedure", "title": "Sharps Procedure (razors)", "type": "procedure", "category": "Infection Control", "required": True},
-            {"key": "cleaning_checklist", "title": "Equipment Cleaning & Sterilisation Checklist", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "Client Privacy Notice (GDPR)", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "staff_handbook", "title": "Staff Handbook", "type": "policy", "category": "Staff Management", "required": True},
-            {"key": "accident_report_form", "title": "Accident & Incident Report Form", "type": "template", "category": "Health & Safety", "required": True},
-            {"key": "first_aid_procedures", "title": "First Aid Procedures", "type": "procedure", "category": "Health & Safety", "required": True},
-            {"key": "fire_safety_procedures", "title": "Fire Safety Procedures", "type": "procedure", "category": "Fire Safety", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "general_hs_risk_assessment", "title": "General Health & Safety Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-        ]
-    },
-    # Healthcare
-    "dental": {
-        "name": "Dental Practice",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Control Policy (Decontamination)", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "safeguarding_policy", "title": "Safeguarding Adults & Children Policy", "type": "policy", "category": "Safeguarding", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "GDPR Patient Privacy Notice", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Handling Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "sharps_protocol", "title": "Sharps & Needlestick Protocol", "type": "procedure", "category": "Infection Control", "required": True},
-            {"key": "radiation_protection_policy", "title": "Radiation Protection Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "medical_emergency_procedures", "title": "Medical Emergency Procedures", "type": "procedure", "category": "Health & Safety", "required": True},
-            {"key": "staff_induction_checklist", "title": "Staff Induction Checklist", "type": "template", "category": "Staff Management", "required": True},
-            {"key": "cqc_statement_of_purpose", "title": "CQC Statement of Purpose", "type": "operational", "category": "Regulatory", "required": True},
-            {"key": "clinical_risk_assessment", "title": "Clinical Risk Assessment", "type": "risk_assessment", "category": "Risk Assessments", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "coshh_assessment", "title": "COSHH Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-            {"key": "staff_handbook", "title": "Staff Handbook", "type": "policy", "category": "Staff Management", "required": True},
-            {"key": "hs_law_poster", "title": "Health & Safety Law Poster", "type": "poster", "category": "Mandatory Posters", "required": True},
-            {"key": "cqc_rating_display", "title": "CQC Registration Certificate Display", "type": "poster", "category": "Mandatory Posters", "required": True},
-            {"key": "sterilisation_log", "title": "Sterilisation & Autoclave Log", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "waste_disposal_log", "title": "Clinical Waste Disposal Log", "type": "audit", "category": "Infection Control", "required": True},
-            {"key": "annual_policy_review", "title": "Annual Policy Review", "type": "audit", "category": "Compliance", "required": True},
-        ]
-    },
-    "healthcare": {
-        "name": "Healthcare Provider",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "safeguarding_policy", "title": "Safeguarding Policy (Adults & Children)", "type": "policy", "category": "Safeguarding", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Prevention & Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "medicines_management_policy", "title": "Medicines Management Policy", "type": "policy", "category": "Medication", "required": True},
-            {"key": "information_governance_policy", "title": "Information Governance Policy", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "clinical_risk_assessment", "title": "Clinical Risk Assessment", "type": "risk_assessment", "category": "Risk Assessments", "required": True},
-            {"key": "consent_policy", "title": "Consent Policy", "type": "policy", "category": "Client Care", "required": True},
-            {"key": "duty_of_candour_policy", "title": "Duty of Candour Policy", "type": "policy", "category": "Regulatory", "required": True},
-            {"key": "staff_training_matrix", "title": "Staff Training Matrix", "type": "audit", "category": "Staff Management", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "cqc_statement_of_purpose", "title": "CQC Statement of Purpose", "type": "operational", "category": "Regulatory", "required": True},
-        ]
-    },
-    "care_home": {
-        "name": "Care Home",
-        "items": [
-            {"key": "safeguarding_adults_policy", "title": "Safeguarding Adults Policy", "type": "policy", "category": "Safeguarding", "required": True},
-            {"key": "mental_capacity_policy", "title": "Mental Capacity & Best Interests Policy", "type": "policy", "category": "Regulatory", "required": True},
-            {"key": "medication_administration_policy", "title": "Medication Administration Policy", "type": "policy", "category": "Medication", "required": True},
-            {"key": "falls_prevention_policy", "title": "Falls Prevention Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "moving_handling_policy", "title": "Moving & Handling Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "infection_control_policy", "title": "Infection Control Policy", "type": "policy", "category": "Infection Control", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "care_plan_templates", "title": "Care Plan Templates", "type": "template", "category": "Client Care", "required": True},
-            {"key": "staff_supervision_policy", "title": "Staff Supervision Policy", "type": "policy", "category": "Staff Management", "required": True},
-            {"key": "resident_privacy_notice", "title": "Resident Privacy Notice", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "manual_handling_risk_assessment", "title": "Manual Handling Risk Assessment", "type": "risk_assessment", "category": "Health & Safety", "required": True},
-        ]
-    },
-    # Default items for industries not specifically defined
-    "_default": {
-        "name": "Default",
-        "items": [
-            {"key": "health_safety_policy", "title": "Health & Safety Policy", "type": "policy", "category": "Health & Safety", "required": True},
-            {"key": "gdpr_privacy_notice", "title": "Data Protection Policy", "type": "policy", "category": "GDPR & Data Protection", "required": True},
-            {"key": "equality_diversity_policy", "title": "Equality & Diversity Policy", "type": "policy", "category": "Equality & Diversity", "required": True},
-            {"key": "complaints_procedure", "title": "Complaints Procedure", "type": "procedure", "category": "Complaints", "required": True},
-            {"key": "workplace_risk_assessment", "title": "Workplace Risk Assessment", "type": "risk_assessment", "category": "Risk Assessments", "required": True},
-            {"key": "fire_risk_assessment", "title": "Fire Risk Assessment", "type": "risk_assessment", "category": "Fire Safety", "required": True},
-            {"key": "staff_handbook", "title": "Employee Handbook", "type": "policy", "category": "Staff Management", "required": True},
-            {"key": "hs_law_poster", "title": "Health & Safety Law Poster", "type": "poster", "category": "Mandatory Posters", "required": True},
-            {"key": "accident_report_form", "title": "Accident Report Form", "type": "template", "category": "Health & Safety", "required": True},
-            {"key": "annual_policy_review", "title": "Annual Policy Review", "type": "audit", "category": "Compliance", "required": True},
-        ]
+def compliance_item_template_fields(industry_id: str, item: Mapping) -> dict:
+    """The fields of a compliance item that come from its industry template"""
+    return {
+        "industry_id": industry_id,
+        "item_type": item["type"],
+        "item_key": item["key"],
+        "title": item["title"],
+        "description": item.get("description", ""),
+        "category": item["category"],
+        "is_required": item["required"],
+        "contributes_to_score": item["required"]
     }
-}
-
-def get_industry_compliance_items(industry_id: str) -> List[dict]:
-    """Get compliance items for an industry, falling back to default"""
-    industry_data = INDUSTRY_COMPLIANCE_MODEL.get(industry_id, INDUSTRY_COMPLIANCE_MODEL["_default"])
-    return industry_data["items"]
 
-async def generate_business_compliance_items(business_id: str, industry_id: str):
-    """Generate compliance items for a business based on industry"""
-    items = get_industry_compliance_items(industry_id)
-    now = datetime.now(timezone.utc)
-    
-    for item in items:
-        compliance_item = {
+def compliance_item_upsert(business_id: str, industry_id: str, item: Mapping, now: datetime) -> UpdateOne:
+    """Creates a business's item for one template entry, unless a live item already has its key"""
+    return UpdateOne(
+        {"business_id": business_id, "item_key": item["key"], "archived": {"$ne": True}},
+        {"$setOnInsert": {
             "id": str(uuid.uuid4()),
             "business_id": business_id,
-            "industry_id": industry_id,
-            "item_type": item["type"],
-            "item_key": item["key"],
-            "title": item["title"],
-            "description": item.get("description", ""),
-            "category": item["category"],
-            "is_required": item["required"],
+            **compliance_item_template_fields(industry_id, item),
             "status": "missing",
             "is_acknowledged": False,
             "acknowledged_at": None,
@@ -1758,141 +1619,580 @@ async def generate_business_compliance_items(business_id: str, industry_id: str)
             "file_name": None,
             "version": "1.0",
             "last_reviewed": None,
-            "next_review_due": (now + timedelta(days=365)).isoformat(),
+            "next_review_due": now + timedelta(days=365),
             "notes": None,
-            "created_at": now.isoformat(),
+            "created_at": now,
             "updated_at": None,
-            "contributes_to_score": item["required"]
-        }
-        await db.compliance_items.insert_one(compliance_item)
+            "archived": False
+        }},
+        upsert=True
+    )
 
-async def calculate_compliance_score(business_id: str) -> dict:
-    """Calculate compliance readiness score for a business"""
-    business = await db.businesses.find_one({"id": business_id}, {"_id": 0})
-    if not business:
-        return None
-    
-    industry_id = business.get("sector", "_default")
-    
-    items = await db.compliance_items.find({"business_id": business_id}, {"_id": 0}).to_list(500)
+async def generate_business_compliance_items(business_id: str, industry_id: str) -> int:
+    """Create any missing compliance items for a business's industry; returns how many were created.
     
+    One bulk upsert keyed on (business_id, item_key) over live items, backed by a unique index,
+    so repeated or concurrent calls never duplicate. Items from an old sector live in
+    compliance_items_archive and are never matched.
+    """
+    items = get_catalog().industry(industry_id).items
     now = datetime.now(timezone.utc)
+    operations = [compliance_item_upsert(business_id, industry_id, item, now) for item in items]
     
-    # Count required items only for score
-    required_items = [i for i in items if i.get("is_required", True)]
-    required_total = len(required_items)
-    
-    completed_statuses = ["uploaded", "acknowledged", "approved"]
-    completed_items = [i for i in required_items if i["status"] in completed_statuses]
-    completed_total = len(completed_items)
-    
-    missing_count = sum(1 for i in required_items if i["status"] == "missing")
-    overdue_count = 0
-    needs_review_count = 0
-    
-    # Check for overdue reviews
-    for item in required_items:
-        if item.get("next_review_due"):
-            try:
-                review_date = datetime.fromisoformat(item["next_review_due"].replace('Z', '+00:00'))
-                if review_date < now:
-                    overdue_count += 1
-                elif (review_date - now).days <= 30:
-                    needs_review_count += 1
-            except:
-                pass
-        if item["status"] == "needs_review":
-            needs_review_count += 1
-    
-    # Calculate percentage
-    score_percent = round((completed_total / required_total * 100) if required_total > 0 else 0)
-    
-    # Determine status label
-    if overdue_count > 0:
+    try:
+        result = await db.compliance_items.bulk_write(operations, ordered=False)
+        created = result.upserted_count
+    except BulkWriteError as e:
+        # Another request generated some of the same keys first
+        if any(error["code"] != 11000 for error in e.details["writeErrors"]):
+            raise
+        created = e.details["nUpserted"]
+    
+    await compliance_item_counts.adjust(business_id, created)
+    await db.businesses.update_one({"id": business_id}, {"$set": {"compliance_items_industry": industry_id}})
+    return created
+
+async def archive_compliance_items(items: List[dict], now: datetime, session=None) -> int:
+    """Move these compliance items to compliance_items_archive; returns how many left the live collection.
+    
+    Items are copied (keyed on their id) before they are deleted, so a retry after a failure
+    part way through neither loses nor duplicates any.
+    """
+    if not items:
+        return 0
+    await db.compliance_items_archive.bulk_write([UpdateOne(
+        {"id": item["id"]},
+        {"$setOnInsert": {**item, "archived": True, "archived_at": item.get("archived_at") or now}},
+        upsert=True
+    ) for item in items], ordered=False, session=session)
+    result = await db.compliance_items.delete_many({"id": {"$in": [item["id"] for item in items]}}, session=session)
+    return result.deleted_count
+
+async def migrate_business_sector(business: dict, update_data: dict) -> Dict[str, int]:
+    """Apply update_data, which moves the business to another sector, keeping the work that carries over.
+    
+    The old and new templates are diffed: checklist rows by category and title (document ids
+    are sector-specific, so a shared "Health & Safety Policy" has a different id in each) and
+    compliance items by item_key. Rows in both keep their status, files, acknowledgements and
+    review dates and take the new template's document id and wording. Only new rows are
+    inserted; dropped checklist rows are deleted and dropped items moved to
+    compliance_items_archive. All of it, the business update included, commits as one
+    transaction, which raises 409 if the stored sector is no longer business["sector"].
+    Returns how many rows were kept, added and removed.
+    """
+    business_id = business["id"]
+    sector = update_data["sector"]
+    documents = {checklist_match_key(doc): doc for doc in get_catalog().sector(sector).documents}
+    items = {item["key"]: item for item in get_catalog().industry(sector).items}
+
+    async def migrate(session) -> Dict[str, int]:
+        now = datetime.now(timezone.utc)
+        # First, so a concurrent sector change is caught before anything else is written
+        result = await db.businesses.update_one(
+            {"id": business_id, "sector": business["sector"]},
+            {"$set": {**update_data, "compliance_items_industry": sector}},
+            session=session
+        )
+        if not result.matched_count:
+            raise HTTPException(status_code=409, detail="The business was changed by another request; please retry")
+        
+        rows = await db.checklists.find(
+            {"business_id": business_id}, {"_id": 0, "id": 1, "category": 1, "title": 1}, session=session
+        ).to_list(None)
+        existing = {checklist_match_key(row) for row in rows}
+        kept_documents = existing & documents.keys()
+        checklist_operations = [UpdateMany(
+            {"business_id": business_id, "category": category, "title": title},
+            {"$set": checklist_template_fields(documents[(category, title)])}
+        ) for category, title in kept_documents]
+        checklist_operations += [
+            InsertOne(new_checklist_item(business_id, doc, now)) for key, doc in documents.items() if key not in existing
+        ]
+        dropped_rows = [row["id"] for row in rows if checklist_match_key(row) not in documents]
+        if dropped_rows:
+            checklist_operations.append(DeleteMany({"business_id": business_id, "id": {"$in": dropped_rows}}))
+        checklist = await db.checklists.bulk_write(checklist_operations, session=session)
+
+        live_items = await db.compliance_items.find(
+            {"business_id": business_id, "archived": {"$ne": True}}, {"_id": 0}, session=session
+        ).to_list(None)
+        kept = [item for item in live_items if item.get("item_key") in items]
+        dropped = [item for item in live_items if item.get("item_key") not in items]
+        kept_keys = {item["item_key"] for item in kept}
+        item_operations = [UpdateOne(
+            {"id": item["id"]}, {"$set": compliance_item_template_fields(sector, items[item["item_key"]])}
+        ) for item in kept]
+        item_operations += [
+            compliance_item_upsert(business_id, sector, item, now) for key, item in items.items() if key not in kept_keys
+        ]
+        added = 0
+        if item_operations:
+            added = (await db.compliance_items.bulk_write(item_operations, session=session)).upserted_count
+        archived = await archive_compliance_items(dropped, now, session)
+        return {
+            "checklist_kept": len(kept_documents),
+            "checklist_added": checklist.inserted_count,
+            "checklist_removed": checklist.deleted_count,
+            "items_kept": len(kept),
+            "items_added": added,
+            "items_archived": archived
+        }
+
+    changes = await run_in_transaction(migrate)
+    await checklist_counts.adjust(business_id, changes["checklist_added"] - changes["checklist_removed"])
+    await compliance_item_counts.adjust(business_id, changes["items_added"] - changes["items_archived"])
+    logger.info(f"Business {business_id} moved from {business['sector']} to {sector}: {changes}")
+    return changes
+
+async def ensure_compliance_items(business: dict):
+    """Generate a business's compliance items the first time they are needed for its sector"""
+    if business.get("compliance_items_industry") == business.get("sector", "_default"):
+        return
+    # The cached business may predate a sector change; only generate for the stored sector
+    invalidate_business(business["user_id"])
+    business = await db.businesses.find_one({"id": business["id"]}, {"_id": 0})
+    industry_id = business.get("sector", "_default")
+    if business.get("compliance_items_industry") != industry_id:
+        if await generate_business_compliance_items(business["id"], industry_id):
+            await recalculate_compliance_score(business["id"], wait=True)
+        invalidate_business(business["user_id"])
+
+# The score document in db.compliance_scores holds counters (plus a per-category breakdown) that
+# are the sum of every item's contribution. Item writes apply the before/after difference with
+# $inc and bump its version in the same update; calculate_compliance_score recounts from scratch.
+# Overdue / review-soon counts also move with time, so the document records the next moment one
+# of them would change (next_boundary_at) and reads recount once it has passed. The periodic
+# reconciliation job only has to correct drift from concurrent writes.
+COMPLETED_STATUSES = ("uploaded", "acknowledged", "approved")
+SCORE_COUNTERS = ("required_total", "completed_total", "missing_count", "overdue_count", "needs_review_count")
+REVIEW_SOON_WINDOW = timedelta(days=31)
+COMPLIANCE_SCORE_RECONCILE_INTERVAL_SECONDS = int(os.environ.get("COMPLIANCE_SCORE_RECONCILE_INTERVAL_SECONDS", "3600"))
+COMPLIANCE_SCORE_RECONCILE_JOB_ID = "compliance_score_reconcile"
+# "aggregation" counts inside Mongo; "python" loads the items and sums their contributions
+COMPLIANCE_SCORE_ENGINE = os.environ.get("COMPLIANCE_SCORE_ENGINE", "aggregation")
+SCORE_ITEM_FIELDS = {"_id": 0, "status": 1, "category": 1, "is_required": 1, "next_review_due": 1}
+# Score history is one document per business in db.compliance_score_series, holding the last
+# score of each day for SCORE_HISTORY_DAILY_DAYS and of each ISO week back to the retention
+# period, so a year of history is a single read. Older days are compacted away as history is
+# written; their week already holds its last score.
+SCORE_HISTORY_FIELDS = ("score_percent", *SCORE_COUNTERS)
+SCORE_HISTORY_DAILY_DAYS = int(os.environ.get("SCORE_HISTORY_DAILY_DAYS", "92"))
+COMPLIANCE_SCORE_HISTORY_RETENTION_DAYS = int(os.environ.get("COMPLIANCE_SCORE_HISTORY_RETENTION_DAYS", "760"))
+
+def item_is_required(item: dict) -> bool:
+    """Only an explicit False makes an item optional; missing or null counts as required, as in the aggregation"""
+    return item.get("is_required") is not False
+
+def compliance_score_contribution(item: dict, now: datetime) -> Dict[str, int]:
+    """What one item adds to its business's score counters, keyed by score document path"""
+    completed = item["status"] in COMPLETED_STATUSES
+    required = item_is_required(item)
+    category = f"breakdown.{item['category']}"
+    contribution = {
+        f"{category}.total": 1,
+        f"{category}.completed": int(completed),
+        f"{category}.required_total": int(required),
+        f"{category}.required_completed": int(required and completed)
+    }
+    if required:
+        contribution["required_total"] = 1
+        contribution["completed_total"] = int(completed)
+        contribution["missing_count"] = int(item["status"] == "missing")
+        review_date = as_utc(item.get("next_review_due"))
+        overdue = bool(review_date and review_date < now)
+        review_soon = bool(review_date and not overdue and (review_date - now).days <= 30)
+        contribution["overdue_count"] = int(overdue)
+        contribution["needs_review_count"] = int(review_soon) + int(item["status"] == "needs_review")
+    return contribution
+
+def review_boundaries(item: dict, now: datetime) -> List[datetime]:
+    """Future moments at which this item's overdue / review-soon contribution changes"""
+    review_date = as_utc(item.get("next_review_due"))
+    if not review_date or not item_is_required(item):
+        return []
+    return [boundary for boundary in (review_date - REVIEW_SOON_WINDOW, review_date) if boundary > now]
+
+def finalise_compliance_score(score: dict) -> dict:
+    """Derive the percentage and label from a score document's counters"""
+    required_total = score.get("required_total", 0)
+    score_percent = round((score.get("completed_total", 0) / required_total * 100) if required_total > 0 else 0)
+    
+    if score.get("overdue_count", 0) > 0:
         status_label = "overdue"
-    elif missing_count > required_total * 0.3 or score_percent < 50:
+    elif score.get("missing_count", 0) > required_total * 0.3 or score_percent < 50:
         status_label = "needs_attention"
     else:
         status_label = "on_track"
     
-    # Calculate breakdown by category
+    return {**score, "score_percent": score_percent, "status_label": status_label}
+
+async def count_compliance_score_python(business_id: str, now: datetime) -> dict:
+    """Score counters, breakdown and review dates summed item by item in Python"""
+    items = await db.compliance_items.find({"business_id": business_id}, SCORE_ITEM_FIELDS).to_list(None)
+    
+    counts = {counter: 0 for counter in SCORE_COUNTERS}
     categories = {}
-    for item in items:
-        cat = item["category"]
-        if cat not in categories:
-            categories[cat] = {"total": 0, "completed": 0, "required_total": 0, "required_completed": 0}
-        categories[cat]["total"] += 1
-        if item["status"] in completed_statuses:
-            categories[cat]["completed"] += 1
-        if item.get("is_required"):
-            categories[cat]["required_total"] += 1
-            if item["status"] in completed_statuses:
-                categories[cat]["required_completed"] += 1
-    
-    # Find next review due
     next_review_due = None
+    next_boundary = None
     for item in items:
-        if item.get("next_review_due") and item["status"] in completed_statuses:
-            if not next_review_due or item["next_review_due"] < next_review_due:
-                next_review_due = item["next_review_due"]
+        for path, n in compliance_score_contribution(item, now).items():
+            if path.startswith("breakdown."):
+                _, category, field = path.split(".", 2)
+                totals = categories.setdefault(
+                    category, {"total": 0, "completed": 0, "required_total": 0, "required_completed": 0}
+                )
+                totals[field] += n
+            else:
+                counts[path] += n
+        
+        if item.get("next_review_due") and item["status"] in COMPLETED_STATUSES:
+            review_date = as_utc(item["next_review_due"])
+            if not next_review_due or review_date < next_review_due:
+                next_review_due = review_date
+        
+        for boundary in review_boundaries(item, now):
+            if not next_boundary or boundary < next_boundary:
+                next_boundary = boundary
+    
+    return {**counts, "breakdown": categories, "next_review_due_at": next_review_due, "next_boundary_at": next_boundary}
+
+async def count_compliance_score_aggregation(business_id: str, now: datetime) -> dict:
+    """The same counts as count_compliance_score_python, from one $facet aggregation.
+    
+    Only documents with a BSON date in next_review_due count towards review dates, so
+    legacy string dates need migrate_dates.py first.
+    """
+    def count_if(condition):
+        return {"$sum": {"$cond": [condition, 1, 0]}}
+    
+    review = "$next_review_due"
+    soon_start = {"$subtract": [review, int(REVIEW_SOON_WINDOW.total_seconds() * 1000)]}
+    pipeline = [
+        {"$match": {"business_id": business_id}},
+        {"$project": {
+            "_id": 0,
+            "category": 1,
+            "status": 1,
+            "next_review_due": 1,
+            "required": {"$ne": [{"$ifNull": ["$is_required", True]}, False]},
+            "completed": {"$in": ["$status", list(COMPLETED_STATUSES)]},
+            # Dates sort above null, numbers and strings, so this holds only for BSON dates
+            "has_review": {"$gte": [review, datetime.min.replace(tzinfo=timezone.utc)]}
+        }},
+        {"$facet": {
+            "totals": [
+                {"$group": {
+                    "_id": None,
+                    "required_total": count_if("$required"),
+                    "completed_total": count_if({"$and": ["$required", "$completed"]}),
+                    "missing_count": count_if({"$and": ["$required", {"$eq": ["$status", "missing"]}]}),
+                    "overdue_count": count_if({"$and": ["$required", "$has_review", {"$lt": [review, now]}]}),
+                    "review_soon_count": count_if({"$and": [
+                        "$required", "$has_review", {"$gte": [review, now]}, {"$lt": [review, now + REVIEW_SOON_WINDOW]}
+                    ]}),
+                    "flagged_count": count_if({"$and": ["$required", {"$eq": ["$status", "needs_review"]}]}),
+                    "next_review_due_at": {"$min": {"$cond": [{"$and": ["$completed", "$has_review"]}, review, None]}},
+                    # Same boundaries as review_boundaries(): the start of the review-soon window, then the due date
+                    "next_boundary_at": {"$min": {"$cond": [
+                        {"$and": ["$required", "$has_review"]},
+                        {"$cond": [
+                            {"$gt": [soon_start, now]}, soon_start, {"$cond": [{"$gt": [review, now]}, review, None]}
+                        ]},
+                        None
+                    ]}}
+                }}
+            ],
+            "breakdown": [
+                {"$group": {
+                    "_id": "$category",
+                    "total": {"$sum": 1},
+                    "completed": count_if("$completed"),
+                    "required_total": count_if("$required"),
+                    "required_completed": count_if({"$and": ["$required", "$completed"]})
+                }}
+            ]
+        }}
+    ]
+    result = (await db.compliance_items.aggregate(pipeline).to_list(1))[0]
+    
+    totals = result["totals"][0] if result["totals"] else {}
+    counts = {counter: totals.get(counter, 0) for counter in SCORE_COUNTERS if counter != "needs_review_count"}
+    counts["needs_review_count"] = totals.get("review_soon_count", 0) + totals.get("flagged_count", 0)
+    categories = {group.pop("_id"): group for group in result["breakdown"]}
+    return {
+        **counts,
+        "breakdown": categories,
+        "next_review_due_at": as_utc(totals.get("next_review_due_at")),
+        "next_boundary_at": as_utc(totals.get("next_boundary_at"))
+    }
+
+SCORE_ENGINES = {"python": count_compliance_score_python, "aggregation": count_compliance_score_aggregation}
+
+async def calculate_compliance_score(business_id: str) -> dict:
+    """Recount a business's compliance score from all of its items and store it"""
+    business = await db.businesses.find_one({"id": business_id}, {"_id": 0, "sector": 1})
+    if not business:
+        return None
     
-    score_data = {
+    now = datetime.now(timezone.utc)
+    counts = await SCORE_ENGINES[COMPLIANCE_SCORE_ENGINE](business_id, now)
+    return await store_compliance_score(business_id, business.get("sector", "_default"), counts, now)
+
+async def store_compliance_score(business_id: str, industry_id: str, counts: dict, now: datetime) -> dict:
+    """Store freshly counted counters as the business's score, bumping its version and recording history"""
+    counts = dict(counts)
+    next_review_due = counts.pop("next_review_due_at")
+    next_boundary = counts.pop("next_boundary_at")
+    
+    score_data = finalise_compliance_score({
         "business_id": business_id,
         "industry_id": industry_id,
-        "score_percent": score_percent,
-        "required_total": required_total,
-        "completed_total": completed_total,
-        "missing_count": missing_count,
-        "overdue_count": overdue_count,
-        "needs_review_count": needs_review_count,
-        "status_label": status_label,
-        "last_calculated_at": now.isoformat(),
-        "next_review_due_at": next_review_due,
-        "breakdown": categories
-    }
+        **counts,
+        "last_calculated_at": now
+    })
+    update = {"$set": score_data, "$inc": {"version": 1}}
+    # Dates are left out rather than null when there are none, so update_compliance_score's $min can set them
+    for field, value in (("next_review_due_at", next_review_due), ("next_boundary_at", next_boundary)):
+        if value:
+            score_data[field] = value
+        else:
+            update.setdefault("$unset", {})[field] = ""
     
-    # Cache the score
-    await db.compliance_scores.update_one(
-        {"business_id": business_id},
-        {"$set": score_data},
-        upsert=True
+    score = await db.compliance_scores.find_one_and_update(
+        {"business_id": business_id}, update, {"_id": 0}, upsert=True, return_document=ReturnDocument.AFTER
     )
-    
-    return score_data
+    await record_compliance_score_history(score)
+    return score
+
+async def recalculate_compliance_score(business_id: str, wait: bool = False) -> Optional[dict]:
+    """Queue a full recount of a business's score; with wait, return the recounted score.
+    
+    Recounts requested while one is already waiting for the same business share it.
+    """
+    future = score_recalculation_queue.submit(business_id, calculate_compliance_score, business_id)
+    if wait:
+        # Shielded so a caller that goes away does not cancel a recount other requests share
+        return await asyncio.shield(future)
+    return None
+
+async def get_stored_compliance_score(business: dict) -> dict:
+    """The maintained score document, recounting it only if stale or a review boundary has passed"""
+    score = await db.compliance_scores.find_one({"business_id": business["id"]}, {"_id": 0})
+    next_boundary = as_utc(score.get("next_boundary_at")) if score else None
+    if (
+        not score
+        or "version" not in score
+        or score.get("industry_id") != business.get("sector", "_default")
+        or (next_boundary and next_boundary <= datetime.now(timezone.utc))
+    ):
+        return await recalculate_compliance_score(business["id"], wait=True)
+    return finalise_compliance_score(score)
+
+def compliance_score_etag(score: dict) -> str:
+    return f'"{score["business_id"]}-{score["version"]}"'
+
+async def update_compliance_score(business_id: str, before: dict, after: dict):
+    """Apply one item's change to the stored score with a single $inc"""
+    await update_compliance_score_batch(business_id, [(before, after)])
+
+async def update_compliance_score_batch(business_id: str, changes: List[tuple]):
+    """Apply many items' (before, after) changes to the stored score with a single $inc"""
+    now = datetime.now(timezone.utc)
+    delta = {}
+    earliest = {}
+    for before, after in changes:
+        for path, n in compliance_score_contribution(after, now).items():
+            delta[path] = delta.get(path, 0) + n
+        for path, n in compliance_score_contribution(before, now).items():
+            delta[path] = delta.get(path, 0) - n
+        
+        candidates = {"next_boundary_at": min(review_boundaries(after, now), default=None)}
+        if after["status"] in COMPLETED_STATUSES and after.get("next_review_due"):
+            candidates["next_review_due_at"] = as_utc(after["next_review_due"])
+        for field, value in candidates.items():
+            if value and (field not in earliest or value < earliest[field]):
+                earliest[field] = value
+    
+    update = {
+        "$set": {"last_calculated_at": now},
+        "$inc": {"version": 1, **{path: n for path, n in delta.items() if n}}
+    }
+    if earliest:
+        update["$min"] = earliest
+    # No upsert: a business without a score document gets one counted on first read
+    score = await db.compliance_scores.find_one_and_update(
+        {"business_id": business_id}, update, {"_id": 0}, return_document=ReturnDocument.AFTER
+    )
+    if score:
+        await record_compliance_score_history(finalise_compliance_score(score))
+
+def score_history_week(moment: datetime) -> str:
+    """ISO week key, e.g. 2026-W42; zero-padded so keys sort in time order"""
+    year, week, _ = moment.isocalendar()
+    return f"{year}-W{week:02d}"
+
+async def record_compliance_score_history(score: dict):
+    """Store a score as the latest point of its day and of its week in the business's history.
+    
+    Later scores overwrite earlier ones, so history is downsampled as it is written. The first
+    score of each day also compacts the document (see compact_score_history). The document
+    expires once no score has been recorded for the retention period.
+    """
+    recorded_at = as_utc(score["last_calculated_at"])
+    day = recorded_at.date().isoformat()
+    point = {field: score.get(field, 0) for field in SCORE_HISTORY_FIELDS}
+    point["recorded_at"] = recorded_at
+    before = await db.compliance_score_series.find_one_and_update(
+        {"business_id": score["business_id"]},
+        {"$set": {
+            f"days.{day}": point,
+            f"weeks.{score_history_week(recorded_at)}": point,
+            "expires_at": recorded_at + timedelta(days=COMPLIANCE_SCORE_HISTORY_RETENTION_DAYS)
+        }},
+        {"_id": 0, f"days.{day}": 1},
+        upsert=True,
+        return_document=ReturnDocument.BEFORE
+    )
+    if before and day not in before.get("days", {}):
+        await compact_score_history(score["business_id"], recorded_at)
+
+async def compact_score_history(business_id: str, now: datetime) -> int:
+    """Drop daily points older than the daily window and weekly points older than retention; returns how many"""
+    series = await db.compliance_score_series.find_one({"business_id": business_id}, {"_id": 0, "days": 1, "weeks": 1})
+    if not series:
+        return 0
+    oldest_day = (now - timedelta(days=SCORE_HISTORY_DAILY_DAYS)).date().isoformat()
+    oldest_week = score_history_week(now - timedelta(days=COMPLIANCE_SCORE_HISTORY_RETENTION_DAYS))
+    stale = [f"days.{day}" for day in series.get("days", {}) if day < oldest_day]
+    stale += [f"weeks.{week}" for week in series.get("weeks", {}) if week < oldest_week]
+    if stale:
+        await db.compliance_score_series.update_one({"business_id": business_id}, {"$unset": dict.fromkeys(stale, "")})
+    return len(stale)
+
+def score_history_points(series: dict) -> List[dict]:
+    """A history document's points in time order: weekly ones up to where the daily ones begin"""
+    days = [{**point, "recorded_at": as_utc(point["recorded_at"])} for _, point in sorted(series.get("days", {}).items())]
+    weeks = [{**point, "recorded_at": as_utc(point["recorded_at"])} for _, point in sorted(series.get("weeks", {}).items())]
+    if days:
+        # The week the daily points begin in is covered by them
+        weeks = [point for point in weeks if point["recorded_at"].date() < days[0]["recorded_at"].date()]
+    return weeks + days
+
+def downsample_score_history(points: List[dict], resolution: str) -> List[dict]:
+    """Keep the last daily point of each ISO week or calendar month"""
+    if resolution == "day":
+        return points
+    periods = {}
+    for point in points:
+        recorded_at = point["recorded_at"]
+        period = recorded_at.isocalendar()[:2] if resolution == "week" else (recorded_at.year, recorded_at.month)
+        periods[period] = point
+    return list(periods.values())
+
+def compliance_score_drifted(stored: Optional[dict], industry_id: str, counts: dict) -> bool:
+    """Whether a stored score differs from a fresh count of the business's items"""
+    if not stored or stored.get("industry_id") != industry_id:
+        return True
+    if any(stored.get(key, 0) != counts[key] for key in SCORE_COUNTERS) or stored.get("breakdown", {}) != counts["breakdown"]:
+        return True
+    return any(as_utc(stored.get(field)) != counts[field] for field in ("next_review_due_at", "next_boundary_at"))
+
+async def reconcile_compliance_scores() -> dict:
+    """Recount every business's score and rewrite only those that drifted; returns how many were checked and drifted.
+    
+    Rewriting bumps the score's version (so its ETag) and records a history point, so a score
+    whose counters are still right is left alone.
+    """
+    checked = drifted = 0
+    async for business in db.businesses.find({}, {"_id": 0, "id": 1, "sector": 1}):
+        industry_id = business.get("sector", "_default")
+        stored = await db.compliance_scores.find_one({"business_id": business["id"]}, {"_id": 0})
+        now = datetime.now(timezone.utc)
+        counts = await SCORE_ENGINES[COMPLIANCE_SCORE_ENGINE](business["id"], now)
+        checked += 1
+        if compliance_score_drifted(stored, industry_id, counts):
+            await store_compliance_score(business["id"], industry_id, counts, now)
+            drifted += 1
+    logger.info(f"Compliance score reconciliation: {drifted} of {checked} businesses corrected")
+    return {"checked": checked, "drifted": drifted}
+
+async def run_compliance_score_reconciler(interval_seconds: int):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            # With several workers, only the first to wake in each interval does the work
+            claimed, _ = await claim_job_run(
+                COMPLIANCE_SCORE_RECONCILE_JOB_ID, datetime.now(timezone.utc), min_interval=timedelta(seconds=interval_seconds / 2)
+            )
+            if claimed:
+                await reconcile_compliance_scores()
+                # List totals drift the same way: adjustments lost while a counter was seeded
+                corrected = await reconcile_collection_counts()
+                logger.info(f"Collection count reconciliation: {corrected}")
+        except Exception as e:
+            logger.error(f"Compliance score reconciliation failed: {e}")
 
 # ======================= COMPLIANCE SCORE API ROUTES =======================
 
 @api_router.get("/compliance/score", response_model=ComplianceScoreResponse)
-async def get_compliance_score(current_user: dict = Depends(get_current_user)):
-    """Get compliance readiness score for current business"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
-    
-    # Check if compliance items exist, if not generate them
-    items_count = await db.compliance_items.count_documents({"business_id": business["id"]})
-    if items_count == 0:
-        await generate_business_compliance_items(business["id"], business.get("sector", "_default"))
-    
-    score = await calculate_compliance_score(business["id"])
+async def get_compliance_score(request: Request, response: Response, business: dict = Depends(get_current_business)):
+    """Get compliance readiness score for current business.
+    
+    Served from the maintained score document. The ETag changes with every item change, so
+    clients polling with If-None-Match get a 304 until something moves.
+    """
+    await ensure_compliance_items(business)
+    
+    score = await get_stored_compliance_score(business)
+    headers = {"ETag": compliance_score_etag(score), "Cache-Control": "private, no-cache"}
+    if if_none_match(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return ComplianceScoreResponse(**score)
 
+@api_router.get("/compliance/score/history", response_model=ComplianceScoreHistoryResponse)
+async def get_compliance_score_history(
+    months: int = Query(12, ge=1, le=24),
+    resolution: str = Query("day", pattern="^(day|week|month)$"),
+    business: dict = Depends(get_current_business)
+):
+    """Readiness score trend over the last `months` months, from the business's history document.
+    
+    Daily points only go back SCORE_HISTORY_DAILY_DAYS; before that "day" returns one point per week.
+    """
+    now = datetime.now(timezone.utc)
+    start_month = now.year * 12 + now.month - 1 - (months - 1)
+    since = datetime(start_month // 12, start_month % 12 + 1, 1, tzinfo=timezone.utc)
+    
+    series = await db.compliance_score_series.find_one(
+        {"business_id": business["id"]}, {"_id": 0, "days": 1, "weeks": 1}
+    ) or {}
+    points = [point for point in score_history_points(series) if point["recorded_at"] >= since]
+    
+    return ComplianceScoreHistoryResponse(
+        business_id=business["id"],
+        resolution=resolution,
+        points=[
+            ComplianceScoreHistoryPoint(date=point["recorded_at"].date().isoformat(), **point)
+            for point in downsample_score_history(points, resolution)
+        ]
+    )
+
 @api_router.get("/compliance/items", response_model=List[ComplianceItemResponse])
 async def get_compliance_items(
+    response: Response,
     category: Optional[str] = None,
     item_type: Optional[str] = None,
     status: Optional[str] = None,
-    current_user: dict = Depends(get_current_user)
+    limit: int = Query(500, ge=1, le=MAX_PAGE_SIZE),
+    after: Optional[str] = None,
+    business: dict = Depends(get_current_business)
 ):
-    """Get all compliance items for the current business"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found. Please complete onboarding.")
+    """Get compliance items for the current business, a page at a time.
     
-    # Check if compliance items exist, if not generate them
-    items_count = await db.compliance_items.count_documents({"business_id": business["id"]})
-    if items_count == 0:
-        await generate_business_compliance_items(business["id"], business.get("sector", "_default"))
+    X-Total-Count is only sent for the unfiltered list, which has a maintained counter.
+    """
+    await ensure_compliance_items(business)
     
     # Build query
     query = {"business_id": business["id"]}
@@ -1903,49 +2203,33 @@ async def get_compliance_items(
     if status:
         query["status"] = status
     
-    items = await db.compliance_items.find(query, {"_id": 0}).to_list(500)
+    items, next_cursor = await fetch_page(db.compliance_items, query, limit, after)
+    total = await compliance_item_counts.get(business["id"]) if len(query) == 1 else None
+    set_page_headers(response, next_cursor, total)
     return [ComplianceItemResponse(**item) for item in items]
 
 @api_router.get("/compliance/items/{item_id}", response_model=ComplianceItemResponse)
-async def get_compliance_item(item_id: str, current_user: dict = Depends(get_current_user)):
+async def get_compliance_item(item_id: str, business: dict = Depends(get_current_business)):
     """Get a single compliance item"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
     item = await db.compliance_items.find_one({"id": item_id, "business_id": business["id"]}, {"_id": 0})
     if not item:
         raise HTTPException(status_code=404, detail="Compliance item not found")
     
     return ComplianceItemResponse(**item)
 
-@api_router.put("/compliance/items/{item_id}", response_model=ComplianceItemResponse)
-async def update_compliance_item(
-    item_id: str,
-    update_data: ComplianceItemUpdate,
-    current_user: dict = Depends(get_current_user)
-):
-    """Update a compliance item (acknowledge, upload, customise)"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
-    item = await db.compliance_items.find_one({"id": item_id, "business_id": business["id"]})
-    if not item:
-        raise HTTPException(status_code=404, detail="Compliance item not found")
-    
-    now = datetime.now(timezone.utc)
-    updates = {"updated_at": now.isoformat()}
+def compliance_item_updates(item: dict, update_data: ComplianceItemUpdate, now: datetime) -> dict:
+    """The $set for applying one ComplianceItemUpdate to an item"""
+    updates = {"updated_at": now}
     
     # Handle acknowledgement
     if update_data.is_acknowledged is not None:
         updates["is_acknowledged"] = update_data.is_acknowledged
         if update_data.is_acknowledged:
-            updates["acknowledged_at"] = now.isoformat()
+            updates["acknowledged_at"] = now
             if item["status"] == "missing":
                 updates["status"] = "acknowledged"
-                updates["last_reviewed"] = now.isoformat()
-                updates["next_review_due"] = (now + timedelta(days=365)).isoformat()
+                updates["last_reviewed"] = now
+                updates["next_review_due"] = now + timedelta(days=365)
     
     # Handle customisation
     if update_data.is_customised is not None:
@@ -1961,23 +2245,42 @@ async def update_compliance_item(
         updates["file_url"] = update_data.file_url
         updates["file_name"] = update_data.file_name
         updates["status"] = "uploaded"
-        updates["last_reviewed"] = now.isoformat()
-        updates["next_review_due"] = (now + timedelta(days=365)).isoformat()
+        updates["last_reviewed"] = now
+        updates["next_review_due"] = now + timedelta(days=365)
     
     # Handle direct status update
     if update_data.status is not None:
         updates["status"] = update_data.status
         if update_data.status in ["uploaded", "acknowledged", "approved"]:
-            updates["last_reviewed"] = now.isoformat()
-            updates["next_review_due"] = (now + timedelta(days=365)).isoformat()
+            updates["last_reviewed"] = now
+            updates["next_review_due"] = now + timedelta(days=365)
     
     if update_data.notes is not None:
         updates["notes"] = update_data.notes
     
-    await db.compliance_items.update_one({"id": item_id}, {"$set": updates})
+    return updates
+
+@api_router.put("/compliance/items/{item_id}", response_model=ComplianceItemResponse)
+async def update_compliance_item(
+    item_id: str,
+    update_data: ComplianceItemUpdate,
+    current_user: dict = Depends(get_current_user),
+    business: dict = Depends(get_current_business)
+):
+    """Update a compliance item (acknowledge, upload, customise)"""
+    item = await db.compliance_items.find_one({"id": item_id, "business_id": business["id"]})
+    if not item:
+        raise HTTPException(status_code=404, detail="Compliance item not found")
     
-    # Recalculate score after update
-    await calculate_compliance_score(business["id"])
+    now = datetime.now(timezone.utc)
+    updates = compliance_item_updates(item, update_data, now)
+    
+    # The pre-update document, read atomically with the write, gives an exact score delta
+    before = await db.compliance_items.find_one_and_update(
+        {"id": item_id}, {"$set": updates}, {"_id": 0}, return_document=ReturnDocument.BEFORE
+    )
+    updated = {**before, **updates}
+    await update_compliance_score(business["id"], before, updated)
     
     # Create notification for completion
     if updates.get("status") in ["uploaded", "acknowledged", "approved"]:
@@ -1991,62 +2294,102 @@ async def update_compliance_item(
             "created_at": now.isoformat()
         }
         await db.notifications.insert_one(notification)
+        await notification_counts.adjust(current_user["id"], 1)
     
-    updated = await db.compliance_items.find_one({"id": item_id}, {"_id": 0})
     return ComplianceItemResponse(**updated)
 
+@api_router.patch("/compliance/items", response_model=ComplianceItemBatchResponse)
+async def batch_update_compliance_items(
+    batch: ComplianceItemBatchUpdate,
+    current_user: dict = Depends(get_current_user),
+    business: dict = Depends(get_current_business)
+):
+    """Update many compliance items at once: one bulk write, one score update, one notification"""
+    item_ids = [entry.id for entry in batch.items]
+    if len(set(item_ids)) != len(item_ids):
+        raise HTTPException(status_code=400, detail="Each item may only appear once per batch")
+    
+    items = await db.compliance_items.find(
+        {"id": {"$in": item_ids}, "business_id": business["id"]}, {"_id": 0}
+    ).to_list(None)
+    items_by_id = {item["id"]: item for item in items}
+    
+    now = datetime.now(timezone.utc)
+    operations = []
+    changes = []
+    completed = []
+    for entry in batch.items:
+        item = items_by_id.get(entry.id)
+        if not item:
+            continue
+        updates = compliance_item_updates(item, entry, now)
+        operations.append(UpdateOne({"id": item["id"]}, {"$set": updates}))
+        changes.append((item, {**item, **updates}))
+        if updates.get("status") in COMPLETED_STATUSES:
+            completed.append(changes[-1][1])
+    
+    if operations:
+        await db.compliance_items.bulk_write(operations, ordered=False)
+        # Items are read before the bulk write, so a concurrent edit to the same item can skew
+        # the counters; the reconciliation job corrects that
+        await update_compliance_score_batch(business["id"], changes)
+    
+    if completed:
+        if len(completed) == 1:
+            message = f"'{completed[0]['title']}' has been marked as {completed[0]['status']}."
+        else:
+            message = f"{len(completed)} compliance items have been marked as complete."
+        notification = {
+            "id": str(uuid.uuid4()),
+            "user_id": current_user["id"],
+            "title": "Compliance Items Updated",
+            "message": message,
+            "type": "success",
+            "is_read": False,
+            "created_at": now.isoformat()
+        }
+        await db.notifications.insert_one(notification)
+        await notification_counts.adjust(current_user["id"], 1)
+    
+    return ComplianceItemBatchResponse(
+        updated=[ComplianceItemResponse(**after) for _, after in changes],
+        not_found=[item_id for item_id in item_ids if item_id not in items_by_id]
+    )
+
 @api_router.post("/compliance/items/{item_id}/acknowledge")
-async def acknowledge_compliance_item(item_id: str, current_user: dict = Depends(get_current_user)):
+async def acknowledge_compliance_item(item_id: str, business: dict = Depends(get_current_business)):
     """Quick acknowledge endpoint for a compliance item"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
     item = await db.compliance_items.find_one({"id": item_id, "business_id": business["id"]})
     if not item:
         raise HTTPException(status_code=404, detail="Compliance item not found")
     
     now = datetime.now(timezone.utc)
-    await db.compliance_items.update_one(
-        {"id": item_id},
-        {"$set": {
-            "is_acknowledged": True,
-            "acknowledged_at": now.isoformat(),
-            "status": "acknowledged",
-            "last_reviewed": now.isoformat(),
-            "next_review_due": (now + timedelta(days=365)).isoformat(),
-            "updated_at": now.isoformat()
-        }}
+    updates = {
+        "is_acknowledged": True,
+        "acknowledged_at": now,
+        "status": "acknowledged",
+        "last_reviewed": now,
+        "next_review_due": now + timedelta(days=365),
+        "updated_at": now
+    }
+    before = await db.compliance_items.find_one_and_update(
+        {"id": item_id}, {"$set": updates}, {"_id": 0}, return_document=ReturnDocument.BEFORE
     )
-    
-    # Recalculate score
-    await calculate_compliance_score(business["id"])
+    await update_compliance_score(business["id"], before, {**before, **updates})
     
     return {"message": "Item acknowledged", "item_id": item_id}
 
 @api_router.get("/compliance/categories")
-async def get_compliance_categories(current_user: dict = Depends(get_current_user)):
+async def get_compliance_categories(business: dict = Depends(get_current_business)):
     """Get list of compliance categories for the business"""
-    business = await db.businesses.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not business:
-        raise HTTPException(status_code=404, detail="Business not found")
-    
-    items = await db.compliance_items.find({"business_id": business["id"]}, {"category": 1, "_id": 0}).to_list(500)
-    categories = list(set(item["category"] for item in items))
-    return sorted(categories)
+    # Live items are always generated from the business's industry, so its category set is theirs
+    return list(get_catalog().industry(business.get("sector", "_default")).categories)
 
 @api_router.get("/compliance/types")
-async def get_compliance_types(current_user: dict = Depends(get_current_user)):
+async def get_compliance_types(request: Request, current_user: dict = Depends(get_current_user)):
     """Get list of compliance item types"""
-    return [
-        {"id": "policy", "name": "Policy"},
-        {"id": "procedure", "name": "Procedure"},
-        {"id": "risk_assessment", "name": "Risk Assessment"},
-        {"id": "audit", "name": "Audit / Check"},
-        {"id": "poster", "name": "Poster / Notice"},
-        {"id": "template", "name": "Template / Form"},
-        {"id": "operational", "name": "Operational Requirement"}
-    ]
+    # Same for every user, but behind auth, so shared caches must not keep it
+    return reference_response(request, "compliance_item_types", f"private, max-age={REFERENCE_CACHE_MAX_AGE_SECONDS}")
 
 # ======================= ROOT ROUTE =======================
 
@@ -2063,6 +2406,7 @@ app.add_middleware(
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag"],
 )
 
 # Configure logging
@@ -2072,6 +2416,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    await db.employees.create_index([("business_id", 1), ("_id", 1)])
+    await db.checklists.create_index([("business_id", 1), ("_id", 1)])
+    await db.checklists.create_index([("business_id", 1), ("next_review_due", 1)])
+    await db.compliance_items.create_index([("business_id", 1), ("_id", 1)])
+    await db.compliance_items.create_index(
+        [("business_id", 1), ("item_key", 1)],
+        unique=True,
+        partialFilterExpression={"archived": False}
+    )
+    await db.compliance_items_archive.create_index([("id", 1)], unique=True)
+    await db.compliance_items_archive.create_index([("business_id", 1), ("archived_at", -1)])
+    await db.notifications.create_index([("user_id", 1), ("_id", 1)])
+    await db.employee_requirements.create_index([("employee_id", 1), ("status", 1), ("expiry_date", 1)])
+    await db.employee_compliance_rollups.create_index([("business_id", 1)], unique=True)
+    await db.employee_requirements.create_index([("expiry_date", 1)])
+    await db.compliance_scores.create_index([("business_id", 1)], unique=True)
+    await db.compliance_score_series.create_index([("business_id", 1)], unique=True)
+    await db.compliance_score_series.create_index([("expires_at", 1)], expireAfterSeconds=0)
+
+@app.on_event("startup")
+async def start_expiry_sweeper():
+    # Set EXPIRY_SWEEP_INTERVAL_SECONDS=0 to disable and run sweep_expiry.py from cron instead
+    if EXPIRY_SWEEP_INTERVAL_SECONDS > 0:
+        app.state.expiry_sweeper = asyncio.create_task(run_expiry_sweeper(EXPIRY_SWEEP_INTERVAL_SECONDS))
+
+@app.on_event("startup")
+async def start_compliance_score_reconciler():
+    # Set COMPLIANCE_SCORE_RECONCILE_INTERVAL_SECONDS=0 to disable and run reconcile_scores.py from cron instead
+    if COMPLIANCE_SCORE_RECONCILE_INTERVAL_SECONDS > 0:
+        app.state.score_reconciler = asyncio.create_task(
+            run_compliance_score_reconciler(COMPLIANCE_SCORE_RECONCILE_INTERVAL_SECONDS)
+        )
+
+@app.on_event("startup")
+async def load_compliance_catalog():
+    # Not loaded at import, so scripts that never touch it skip the parse; loading here
+    # still fails fast on a malformed catalog before the worker takes traffic
+    logger.info(f"Compliance catalog {get_catalog().version} loaded")
+
+@app.on_event("startup")
+async def start_score_recalculation_queue():
+    score_recalculation_queue.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    score_recalculation_queue.stop()
+    for task_name in ("expiry_sweeper", "score_reconciler"):
+        task = getattr(app.state, task_name, None)
+        if task:
+            task.cancel()
     client.close()
+    password_hasher.shutdown()
@@ -0,0 +1,25 @@
+"""Run the employee requirement expiry sweep once.
+
+For deployments that schedule it externally (cron) rather than in-process:
+
+    cd backend && EXPIRY_SWEEP_INTERVAL_SECONDS=0 python sweep_expiry.py
+"""
+
+import asyncio
+
+from server import client, sweep_requirement_expiry
+
+
+async def main():
+    try:
+        summary = await sweep_requirement_expiry()
+    finally:
+        client.close()
+    if summary["skipped"]:
+        print("Another sweep claimed this window; nothing to do")
+    else:
+        print(f"Expired: {summary['expired']}, expiring soon: {summary['expiring_soon']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The backend is imported as top-level modules (server, app), as when run from backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
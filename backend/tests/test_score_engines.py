@@ -0,0 +1,115 @@
+"""The $facet aggregation score engine must count exactly what the Python engine counts.
+
+Each test seeds a throwaway tenant with compliance items in the configured database, runs
+every engine in server.SCORE_ENGINES over it and deletes the items again.
+
+    cd backend && python -m pytest tests/test_score_engines.py
+"""
+
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from server import REVIEW_SOON_WINDOW, SCORE_ENGINES, db
+
+STATUSES = ("missing", "draft", "uploaded", "acknowledged", "approved", "needs_review")
+CATEGORIES = ("policy", "risk_assessment", "training", "record", "certificate", "procedure")
+
+
+def generated_item(business_id: str, n: int, now: datetime, rng: random.Random) -> dict:
+    item = {
+        "id": str(uuid.uuid4()),
+        "business_id": business_id,
+        "item_key": f"check_{n}",
+        "category": rng.choice(CATEGORIES),
+        "status": rng.choice(STATUSES),
+        "archived": False,
+        # The engines should never need this, but real items carry it
+        "custom_content": "x" * rng.choice((0, 0, 200, 4000)),
+    }
+    # Explicitly null and missing must both count as required
+    required = rng.choice((True, True, False, None, "missing"))
+    if required != "missing":
+        item["is_required"] = required
+    # Past, inside and outside the review-soon window, and exactly on its edges
+    review = rng.choice((
+        None,
+        "missing",
+        now - timedelta(days=rng.randint(1, 400)),
+        now + timedelta(days=rng.randint(0, 30), hours=rng.randint(0, 23)),
+        now + timedelta(days=rng.randint(32, 400)),
+        now + REVIEW_SOON_WINDOW,
+        now + REVIEW_SOON_WINDOW + timedelta(seconds=1),
+    ))
+    if review != "missing":
+        item["next_review_due"] = review
+    return item
+
+
+def engine_results(items: list, business_id: str, now: datetime) -> dict:
+    """Each engine's counts for a tenant holding just ``items``"""
+    async def run():
+        if items:
+            await db.compliance_items.insert_many(items)
+        try:
+            return {name: await engine(business_id, now) for name, engine in SCORE_ENGINES.items()}
+        finally:
+            await db.compliance_items.delete_many({"business_id": business_id})
+    return asyncio.run(run())
+
+
+def differences(results: dict) -> list:
+    """Fields where an engine disagrees with the Python engine"""
+    expected = results["python"]
+    return [
+        f"{name}.{field}: {value!r} != {expected.get(field)!r}"
+        for name, result in results.items()
+        for field, value in result.items()
+        if value != expected.get(field)
+    ]
+
+
+def tenant() -> tuple:
+    # Truncate to Mongo's millisecond precision so boundary items stay on the boundary
+    return f"score-engine-test-{uuid.uuid4()}", datetime.now(timezone.utc).replace(microsecond=0)
+
+
+@pytest.mark.parametrize("size", (0, 1, 50, 500))
+def test_engines_agree_on_generated_items(size):
+    business_id, now = tenant()
+    rng = random.Random(size)
+    items = [generated_item(business_id, n, now, rng) for n in range(size)]
+
+    assert differences(engine_results(items, business_id, now)) == []
+
+
+def test_null_and_missing_is_required_count_as_required():
+    business_id, now = tenant()
+    overdue = now - timedelta(days=1)
+    items = []
+    for n, required in enumerate((True, None, "missing", False)):
+        item = {
+            "id": str(uuid.uuid4()),
+            "business_id": business_id,
+            "item_key": f"required_{n}",
+            "category": "policy",
+            "status": "missing",
+            "next_review_due": overdue,
+        }
+        if required != "missing":
+            item["is_required"] = required
+        items.append(item)
+
+    results = engine_results(items, business_id, now)
+
+    assert differences(results) == []
+    for result in results.values():
+        assert result["required_total"] == 3
+        assert result["missing_count"] == 3
+        assert result["overdue_count"] == 3
+        assert result["breakdown"]["policy"] == {
+            "total": 4, "completed": 0, "required_total": 3, "required_completed": 0
+        }
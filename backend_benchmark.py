@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Latency benchmarks for the SimplyComply API.
+
+Runs against a live backend, like backend_test.py. Each benchmark signs up a
+throwaway user, seeds what it needs through the public API and prints latency
+percentiles. Server-side counters come from GET /api/admin/metrics when
+BENCH_ADMIN_EMAIL / BENCH_ADMIN_PASSWORD are set.
+
+Usage:
+    python backend_benchmark.py [--base-url URL] [--requests N] [benchmark ...]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+
+class SimplyComplyBenchmark:
+    def __init__(self, base_url="http://localhost:8001/api", requests_per_endpoint=200):
+        self.base_url = base_url.rstrip("/")
+        self.requests_per_endpoint = requests_per_endpoint
+        self.session = requests.Session()
+        self.token = None
+        self.admin_token = None
+
+    def log(self, message):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+
+    def headers(self, token=None):
+        token = token or self.token
+        return {"Authorization": f"Bearer {token}"} if token else {}
+
+    def call(self, method, endpoint, token=None, **kwargs):
+        """Issue one request and return (response, elapsed seconds)"""
+        start = time.perf_counter()
+        response = self.session.request(
+            method, f"{self.base_url}/{endpoint}", headers=self.headers(token), timeout=30, **kwargs
+        )
+        return response, time.perf_counter() - start
+
+    @staticmethod
+    def percentile(samples, pct):
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summarise(self, label, samples):
+        ms = [s * 1000 for s in samples]
+        self.log(
+            f"   {label:<40} n={len(ms):<5} mean={statistics.mean(ms):7.2f}ms "
+            f"p50={self.percentile(ms, 50):7.2f}ms p95={self.percentile(ms, 95):7.2f}ms "
+            f"p99={self.percentile(ms, 99):7.2f}ms"
+        )
+
+    def sample(self, method, endpoint, count=None, **kwargs):
+        samples = []
+        for _ in range(count or self.requests_per_endpoint):
+            response, elapsed = self.call(method, endpoint, **kwargs)
+            response.raise_for_status()
+            samples.append(elapsed)
+        return samples
+
+    # ----------------------------------------------------------------- setup
+
+    def signup(self, sector="dental"):
+        """Create a fresh user and business and keep its token"""
+        email = f"bench_{datetime.now().strftime('%H%M%S%f')}@example.com"
+        response, _ = self.call(
+            "POST", "auth/signup", json={"email": email, "password": "BenchPass123!", "full_name": "Bench User"}
+        )
+        response.raise_for_status()
+        self.token = response.json()["access_token"]
+        response, _ = self.call(
+            "POST",
+            "business",
+            json={
+                "name": "Benchmark Practice",
+                "industry": "Healthcare",
+                "sector": sector,
+                "size": "small",
+                "uk_nation": "England",
+            },
+        )
+        response.raise_for_status()
+        return email
+
+    def admin_login(self):
+        email = os.environ.get("BENCH_ADMIN_EMAIL")
+        password = os.environ.get("BENCH_ADMIN_PASSWORD")
+        if not email or not password:
+            return False
+        response = self.session.post(
+            f"{self.base_url}/admin/login", data={"username": email, "password": password}, timeout=30
+        )
+        if response.status_code != 200:
+            self.log(f"   Admin login failed ({response.status_code}); server metrics unavailable")
+            return False
+        self.admin_token = response.json()["access_token"]
+        return True
+
+    def metrics(self):
+        if not self.admin_token:
+            return None
+        response, _ = self.call("GET", "admin/metrics", token=self.admin_token)
+        return response.json() if response.status_code == 200 else None
+
+    def query_count(self, method, endpoint, **kwargs):
+        """Mongo commands the server issued while handling one request"""
+        before = self.metrics()
+        if not before:
+            return None
+        response, _ = self.call(method, endpoint, **kwargs)
+        response.raise_for_status()
+        after = self.metrics()
+        return after["mongo_commands"]["total"] - before["mongo_commands"]["total"]
+
+    def create_employees(self, count, start=0):
+        for n in range(start, start + count):
+            response, _ = self.call(
+                "POST",
+                "employees",
+                json={
+                    "first_name": "Bench",
+                    "last_name": f"Employee {n}",
+                    "job_title": "Nurse",
+                    "start_date": "2024-01-15",
+                },
+            )
+            response.raise_for_status()
+
+    # ------------------------------------------------------------ benchmarks
+
+    def bench_auth_cache(self):
+        """Per-request latency of authenticated reads with the user cache warm.
+
+        Run once as-is and once against a server started with
+        USER_CACHE_TTL_SECONDS=0 to see the difference the cache makes.
+        """
+        self.log("🔐 Authenticated request latency (user cache)")
+        self.signup()
+        before = self.metrics()
+        for endpoint in ("dashboard/stats", "compliance/items"):
+            self.sample("GET", endpoint, count=5)  # warm-up
+            self.summarise(endpoint, self.sample("GET", endpoint))
+        after = self.metrics()
+        if before and after:
+            hits = after["user_cache"]["hits"] - before["user_cache"]["hits"]
+            misses = after["user_cache"]["misses"] - before["user_cache"]["misses"]
+            self.log(f"   user cache: {hits} hits / {misses} misses during run")
+
+    def bench_login_spike(self, concurrent_logins=50, endpoint="auth/me"):
+        """p99 of an unrelated endpoint, idle vs. with 50 logins in flight.
+
+        With bcrypt on the event loop the loaded p99 climbs to the cost of
+        several hashes; with the hashing pool it should stay close to idle.
+        """
+        self.log(f"⏱️  Unrelated endpoint latency during {concurrent_logins} concurrent logins")
+        email = self.signup()
+        self.sample("GET", endpoint, count=5)
+        self.summarise(f"{endpoint} (idle)", self.sample("GET", endpoint))
+
+        stop = threading.Event()
+        login_samples = []
+        login_errors = []
+
+        def login_loop():
+            while not stop.is_set():
+                start = time.perf_counter()
+                response = requests.post(
+                    f"{self.base_url}/auth/login",
+                    json={"email": email, "password": "BenchPass123!"},
+                    timeout=60,
+                )
+                elapsed = time.perf_counter() - start
+                (login_samples if response.status_code == 200 else login_errors).append(elapsed)
+
+        with ThreadPoolExecutor(max_workers=concurrent_logins) as pool:
+            for _ in range(concurrent_logins):
+                pool.submit(login_loop)
+            time.sleep(1)  # let the spike build up
+            peak = self.metrics()
+            try:
+                loaded = self.sample("GET", endpoint)
+            finally:
+                stop.set()
+
+        self.summarise(f"{endpoint} (during logins)", loaded)
+        if login_samples:
+            self.summarise("auth/login", login_samples)
+        if login_errors:
+            self.log(f"   {len(login_errors)} logins rejected (hashing queue full)")
+        if peak:
+            self.log(f"   hashing pool during spike: {peak['password_hashing']}")
+
+    def bench_employee_list(self, sizes=(10, 100, 1000)):
+        """GET /employees latency and Mongo query count as the team grows"""
+        self.log("👥 Employee list with compliance summaries")
+        self.signup()
+        seeded = 0
+        for size in sizes:
+            self.create_employees(size - seeded, start=seeded)
+            seeded = size
+            queries = self.query_count("GET", "employees")
+            if queries is not None:
+                self.log(f"   {size} employees: {queries} Mongo commands per request")
+            self.summarise(f"employees ({size} staff)", self.sample("GET", "employees", count=min(50, self.requests_per_endpoint)))
+
+    def bench_dashboard(self, employees=50):
+        """GET /dashboard/stats latency; the checklist facet and employee rollup run concurrently"""
+        self.log("📊 Dashboard stats")
+        self.signup()
+        self.create_employees(employees)
+        queries = self.query_count("GET", "dashboard/stats")
+        if queries is not None:
+            self.log(f"   {queries} Mongo commands per request")
+        self.sample("GET", "dashboard/stats", count=5)
+        self.summarise(f"dashboard/stats ({employees} staff)", self.sample("GET", "dashboard/stats"))
+
+    def bench_employee_import(self, rows=10000):
+        """POST /employees/import of a generated CSV, against the same rows via POST /employees"""
+        self.log(f"📥 Employee CSV import ({rows} rows)")
+        self.signup()
+        lines = ["first_name,last_name,job_title,start_date"]
+        lines += [f"Bench,Import {n},Nurse,2024-01-15" for n in range(rows)]
+        body = ("\n".join(lines) + "\n").encode()
+        response, elapsed = self.call("POST", "employees/import", files={"file": ("employees.csv", body, "text/csv")})
+        response.raise_for_status()
+        result = response.json()
+        self.log(f"   import: {result['imported']} imported, {result['failed']} failed in {elapsed:.2f}s "
+                 f"({rows / elapsed:.0f} rows/s)")
+
+        one_by_one = min(rows, 200)
+        start = time.perf_counter()
+        self.create_employees(one_by_one)
+        elapsed = time.perf_counter() - start
+        self.log(f"   POST /employees: {one_by_one} rows in {elapsed:.2f}s ({one_by_one / elapsed:.0f} rows/s)")
+
+    def bench_cold_start(self, runs=10):
+        """Worker cold start: importing server.py and loading the compliance catalog in a fresh interpreter.
+
+        Runs locally rather than against the API, with the environment the backend
+        needs. Works on older trees too, where there is no catalog to load.
+        """
+        self.log("🧊 Worker cold start (import server + load catalog)")
+        code = (
+            "import time; start = time.perf_counter(); import server; "
+            "getattr(server, 'get_catalog', lambda: None)(); print(time.perf_counter() - start)"
+        )
+        samples = []
+        for _ in range(runs):
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=Path(__file__).resolve().parent / "backend",
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+            if result.returncode != 0:
+                self.log(f"   ❌ Import failed: {(result.stderr.strip().splitlines() or ['?'])[-1]}")
+                return
+            samples.append(float(result.stdout.strip().splitlines()[-1]))
+        self.summarise("import server + catalog", samples)
+
+    def bench_reference(self, concurrency=8):
+        """Throughput of the reference endpoints and the document library: full GETs and If-None-Match revalidations.
+
+        Older trees send no ETag, so only the full GETs are measured there.
+        """
+        self.log(f"📚 Reference data throughput ({concurrency} concurrent clients)")
+        self.signup()
+        for endpoint in ("reference/sectors", "reference/business-sizes", "compliance/types", "documents"):
+            response, _ = self.call("GET", endpoint)
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            self.log(f"   {endpoint}: {len(response.content)} bytes, ETag {etag or '-'}, "
+                     f"Cache-Control {response.headers.get('Cache-Control', '-')}")
+            variants = [("full", {}, 200)]
+            if etag:
+                variants.append(("If-None-Match", {"If-None-Match": etag}, 304))
+            for label, extra, expected in variants:
+                headers = {**self.headers(), **extra}
+                local = threading.local()
+
+                def fetch(_):
+                    session = getattr(local, "session", None) or requests.Session()
+                    local.session = session
+                    start = time.perf_counter()
+                    response = session.get(f"{self.base_url}/{endpoint}", headers=headers, timeout=30)
+                    if response.status_code != expected:
+                        raise RuntimeError(f"{endpoint}: {response.status_code}")
+                    return time.perf_counter() - start
+
+                count = self.requests_per_endpoint * 5
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    list(pool.map(fetch, range(concurrency)))  # warm-up, one session per thread
+                    start = time.perf_counter()
+                    samples = list(pool.map(fetch, range(count)))
+                    elapsed = time.perf_counter() - start
+                self.summarise(f"{endpoint} ({label})", samples)
+                self.log(f"   {'':<40} {count / elapsed:.0f} req/s")
+
+    BENCHMARKS = {
+        "auth_cache": bench_auth_cache,
+        "login_spike": bench_login_spike,
+        "employee_list": bench_employee_list,
+        "dashboard": bench_dashboard,
+        "employee_import": bench_employee_import,
+        "cold_start": bench_cold_start,
+        "reference": bench_reference,
+    }
+
+    def run(self, names):
+        self.log("🚀 Starting SimplyComply API Benchmarks")
+        self.log(f"   Base URL: {self.base_url}")
+        self.admin_login()
+        for name in names or self.BENCHMARKS:
+            if name not in self.BENCHMARKS:
+                self.log(f"❌ Unknown benchmark: {name}")
+                return 1
+            self.BENCHMARKS[name](self)
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmarks", nargs="*", help=f"any of: {', '.join(SimplyComplyBenchmark.BENCHMARKS)}")
+    parser.add_argument("--base-url", default=os.environ.get("BENCH_BASE_URL", "http://localhost:8001/api"))
+    parser.add_argument("--requests", type=int, default=200, help="requests per measured endpoint")
+    args = parser.parse_args()
+    return SimplyComplyBenchmark(args.base_url, args.requests).run(args.benchmarks)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
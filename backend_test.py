@@ -2,8 +2,10 @@
 
 import requests
 import sys
+import csv
+import io
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 
 class SimplyComplyAPITester:
     def __init__(self, base_url="https://biz-compliance-2.preview.emergentagent.com/api"):
@@ -14,14 +16,17 @@ class SimplyComplyAPITester:
         self.tests_run = 0
         self.tests_passed = 0
         self.failed_tests = []
+        self.last_response = None
+        self.other_business = None
 
     def log(self, message):
         print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, files=None, params=None):
+        """Run a single API test; the raw response is kept in self.last_response"""
         url = f"{self.base_url}/{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
+        # requests sets the multipart Content-Type (with its boundary) for uploads
+        test_headers = {} if files else {'Content-Type': 'application/json'}
         
         if self.token:
             test_headers['Authorization'] = f'Bearer {self.token}'
@@ -34,13 +39,18 @@ class SimplyComplyAPITester:
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=10)
+                response = requests.get(url, headers=test_headers, params=params, timeout=10)
+            elif method == 'POST' and files:
+                response = requests.post(url, files=files, headers=test_headers, params=params, timeout=30)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=10)
+                response = requests.post(url, json=data, headers=test_headers, params=params, timeout=10)
             elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=10)
+                response = requests.put(url, json=data, headers=test_headers, params=params, timeout=10)
+            elif method == 'PATCH':
+                response = requests.patch(url, json=data, headers=test_headers, params=params, timeout=10)
             elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=10)
+                response = requests.delete(url, headers=test_headers, params=params, timeout=10)
+            self.last_response = response
 
             success = response.status_code == expected_status
             if success:
@@ -78,6 +88,23 @@ class SimplyComplyAPITester:
             })
             return False, {}
 
+    def check(self, name, condition, detail=""):
+        """Record a behaviour check on a response alongside the status-code tests"""
+        self.tests_run += 1
+        if condition:
+            self.tests_passed += 1
+            self.log(f"✅ {name}")
+        else:
+            self.log(f"❌ {name} - {detail}")
+            self.failed_tests.append({
+                "test": name,
+                "endpoint": "-",
+                "expected": "check to pass",
+                "actual": "failed",
+                "error": detail
+            })
+        return condition
+
     def test_root_endpoint(self):
         """Test API root endpoint"""
         return self.run_test("API Root", "GET", "", 200)
@@ -202,6 +229,66 @@ class SimplyComplyAPITester:
         
         return True, checklist
 
+    def test_compliance_item_batch(self):
+        """Test batch compliance item updates: foreign ids, one score update per batch and limits"""
+        success, items = self.run_test("Get Compliance Items", "GET", "compliance/items", 200)
+        if not success:
+            return False, "Failed to get compliance items"
+        targets = [item for item in items if item["status"] == "missing" and item["contributes_to_score"]][:3]
+        if len(targets) < 3:
+            return False, "Not enough missing items to update"
+        other = self.get_other_business()
+        foreign_id = other.get("compliance_item_id")
+        
+        # Items from another business are skipped and reported, the rest are updated
+        success, before = self.run_test("Get Score Before Batch", "GET", "compliance/score", 200)
+        entries = [{"id": item["id"], "status": "approved"} for item in targets]
+        if foreign_id:
+            entries.insert(1, {"id": foreign_id, "status": "approved"})
+        success, result = self.run_test("Batch Update Compliance Items", "PATCH", "compliance/items", 200,
+                                        data={"items": entries})
+        if success:
+            self.check("Batch updates the business's own items",
+                       [item["id"] for item in result["updated"]] == [item["id"] for item in targets]
+                       and all(item["status"] == "approved" for item in result["updated"]), str(result["updated"]))
+            self.check("Batch reports the other business's item as not found",
+                       result["not_found"] == ([foreign_id] if foreign_id else []), str(result["not_found"]))
+        
+        # The score is updated once for the whole batch
+        success, after = self.run_test("Get Score After Batch", "GET", "compliance/score", 200)
+        if success and before:
+            self.check("Batch bumps the score version once", after["version"] == before["version"] + 1,
+                       f"version {before['version']} -> {after['version']}")
+            required = sum(1 for item in targets if item["is_required"])
+            self.check("Batch score counts the completed items",
+                       after["completed_total"] == before["completed_total"] + required
+                       and after["missing_count"] == before["missing_count"] - required,
+                       f"{before['completed_total']}/{before['missing_count']} -> {after['completed_total']}/{after['missing_count']}")
+        
+        if foreign_id:
+            own_token, self.token = self.token, other["token"]
+            success, foreign = self.run_test("Get Other Business Item", "GET", f"compliance/items/{foreign_id}", 200)
+            self.token = own_token
+            self.check("Other business's item is unchanged", foreign.get("status") == "missing", str(foreign.get("status")))
+            
+            success, result = self.run_test("Batch Update Only Foreign Items", "PATCH", "compliance/items", 200,
+                                            data={"items": [{"id": foreign_id, "status": "approved"}]})
+            success, unchanged = self.run_test("Get Score After Empty Batch", "GET", "compliance/score", 200)
+            if result and after and unchanged:
+                self.check("A batch with nothing to update leaves the score alone",
+                           result["updated"] == [] and unchanged["version"] == after["version"], str(result))
+        
+        # Limits
+        self.run_test("Batch Update With Duplicate Ids", "PATCH", "compliance/items", 400, data={
+            "items": [{"id": targets[0]["id"], "notes": "first"}, {"id": targets[0]["id"], "notes": "second"}]
+        })
+        self.run_test("Batch Update With No Items", "PATCH", "compliance/items", 422, data={"items": []})
+        self.run_test("Batch Update Over Size Limit", "PATCH", "compliance/items", 422, data={
+            "items": [{"id": f"missing-{i}", "notes": "x"} for i in range(501)]
+        })
+        
+        return True, result
+
     def test_documents_operations(self):
         """Test documents operations"""
         # Get all documents
@@ -365,6 +452,328 @@ class SimplyComplyAPITester:
         
         return True, "All employee operations completed successfully"
 
+    def get_other_business(self):
+        """Sign up a second user with their own business and employee, for tenancy checks"""
+        if self.other_business:
+            return self.other_business
+        
+        own = (self.token, self.user_id, self.business_id)
+        self.token = None
+        other = {}
+        success, _ = self.test_user_signup(
+            f"other_{datetime.now().strftime('%H%M%S%f')}@example.com", "TestPass123!", "Other User"
+        )
+        if success and self.test_create_business()[0]:
+            success, employee = self.run_test("Create Other Business Employee", "POST", "employees", 200, data={
+                "first_name": "Olive", "last_name": "Other", "job_title": "Vet", "start_date": "2024-01-15"
+            })
+            success, items = self.run_test("Get Other Business Compliance Items", "GET", "compliance/items", 200)
+            other = {
+                "token": self.token,
+                "employee_id": employee.get("id"),
+                "compliance_item_id": items[0]["id"] if items else None
+            }
+        self.token, self.user_id, self.business_id = own
+        self.other_business = other
+        return other
+
+    def test_bulk_requirement_update(self):
+        """Test the bulk requirement update: tenancy, the id cap and the rollup refresh"""
+        self.log("\n📦 Testing Bulk Requirement Update...")
+        
+        employee_ids = []
+        for first_name in ("Ivy", "Jon"):
+            success, employee = self.run_test("Create Bulk Update Employee", "POST", "employees", 200, data={
+                "first_name": first_name, "last_name": "Bulk", "job_title": "Vet", "start_date": "2024-01-15"
+            })
+            if not success:
+                return False, "Failed to create employees"
+            employee_ids.append(employee["id"])
+        
+        success, requirements = self.run_test(
+            "Get Bulk Update Requirements", "GET", f"employees/{employee_ids[0]}/requirements", 200
+        )
+        if not success or not requirements:
+            return False, "No requirements to update"
+        requirement_type = requirements[0]["requirement_type"]
+        
+        # Another business's employee fails the whole batch and nothing is written
+        other = self.get_other_business()
+        if other.get("employee_id"):
+            self.run_test("Bulk Update With Other Business Employee", "PUT", "employees/requirements/bulk", 404, data={
+                "requirement_type": requirement_type,
+                "employee_ids": [employee_ids[0], other["employee_id"]],
+                "expiry_date": "2020-01-01"
+            })
+            success, after = self.run_test(
+                "Get Requirements After Rejected Bulk Update", "GET", f"employees/{employee_ids[0]}/requirements", 200
+            )
+            unchanged = [req for req in after if req["requirement_type"] == requirement_type]
+            self.check("Rejected bulk update writes nothing",
+                       all(req["expiry_date"] is None for req in unchanged), str(unchanged))
+        
+        self.run_test("Bulk Update With No Employees", "PUT", "employees/requirements/bulk", 422, data={
+            "requirement_type": requirement_type, "employee_ids": [], "expiry_date": "2020-01-01"
+        })
+        self.run_test("Bulk Update Over Employee Cap", "PUT", "employees/requirements/bulk", 422, data={
+            "requirement_type": requirement_type,
+            "employee_ids": [f"missing-{i}" for i in range(501)],
+            "expiry_date": "2020-01-01"
+        })
+        
+        # An expired date moves both requirements into the overview's expired count and list
+        success, before = self.run_test("Get Overview Before Bulk Update", "GET", "employees/compliance/overview", 200)
+        success, result = self.run_test("Bulk Update To Expired", "PUT", "employees/requirements/bulk", 200, data={
+            "requirement_type": requirement_type, "employee_ids": employee_ids, "expiry_date": "2020-01-01"
+        })
+        if success:
+            self.check("Bulk update reports each requirement",
+                       result["updated"] == 2 and result["status"] == "expired"
+                       and result["employees_without_requirement"] == [], str(result))
+        success, overview = self.run_test("Get Overview After Bulk Update", "GET", "employees/compliance/overview", 200)
+        if success and before:
+            self.check("Overview counts the expired requirements",
+                       overview["expired_requirements"] == before["expired_requirements"] + 2
+                       and overview["total_requirements"] == before["total_requirements"], str(overview))
+            overdue = {item["employee_id"] for item in overview["overdue_items"]}
+            self.check("Overview lists the expired requirements", set(employee_ids) <= overdue, str(overdue))
+        
+        # Renewing them takes them back out
+        renewed = (datetime.now() + timedelta(days=3 * 365)).strftime("%Y-%m-%d")
+        success, result = self.run_test("Bulk Update To Valid", "PUT", "employees/requirements/bulk", 200, data={
+            "requirement_type": requirement_type, "employee_ids": employee_ids,
+            "issue_date": datetime.now().strftime("%Y-%m-%d"), "expiry_date": renewed
+        })
+        success, overview = self.run_test("Get Overview After Renewal", "GET", "employees/compliance/overview", 200)
+        if success and before:
+            self.check("Renewal moves the requirements to valid",
+                       overview["expired_requirements"] == before["expired_requirements"]
+                       and overview["valid_requirements"] == before["valid_requirements"] + 2, str(overview))
+            overdue = {item["employee_id"] for item in overview["overdue_items"]}
+            self.check("Renewed requirements leave the overdue list", not set(employee_ids) & overdue, str(overdue))
+        
+        # Cleanup
+        for employee_id in employee_ids:
+            self.run_test("Delete Bulk Update Employee", "DELETE", f"employees/{employee_id}", 200)
+        
+        return True, "Bulk requirement update checks completed"
+
+    def test_employee_register_export(self):
+        """Test the staff register export: headers, date formatting and the format parameter"""
+        self.log("\n📤 Testing Employee Register Export...")
+        
+        success, employee = self.run_test("Create Export Employee", "POST", "employees", 200, data={
+            "first_name": "Kit", "last_name": "Export", "job_title": "Vet", "start_date": "2024-01-15"
+        })
+        if not success:
+            return False, "Failed to create employee"
+        employee_id = employee["id"]
+        success, requirements = self.run_test(
+            "Get Export Employee Requirements", "GET", f"employees/{employee_id}/requirements", 200
+        )
+        if not success or not requirements:
+            return False, "No requirements to export"
+        # Dates are stored as BSON datetimes and exported as ISO strings
+        requirement = requirements[0]
+        self.run_test("Set Export Requirement Dates", "PUT", f"employees/{employee_id}/requirements/{requirement['id']}", 200,
+                      data={"issue_date": "2023-06-30", "expiry_date": "2024-06-30T12:30:00Z", "reference_number": "REF-1"})
+        
+        success, _ = self.run_test("Export Register As CSV", "GET", "employees/requirements/export", 200)
+        response = self.last_response
+        if success:
+            self.check("CSV export content type", response.headers.get("Content-Type", "").startswith("text/csv"),
+                       response.headers.get("Content-Type"))
+            disposition = response.headers.get("Content-Disposition", "")
+            self.check("CSV export is an attachment",
+                       disposition.startswith("attachment;") and disposition.endswith('.csv"'), disposition)
+            rows = list(csv.DictReader(io.StringIO(response.text)))
+            self.check("CSV export header", response.text.splitlines()[0] == ",".join((
+                "employee_id", "employee_name", "job_title", "department", "is_active",
+                "requirement_id", "requirement_type", "requirement", "is_mandatory", "status",
+                "issue_date", "expiry_date", "days_until_expiry", "reference_number"
+            )), response.text.splitlines()[0])
+            exported = [row for row in rows if row["employee_id"] == employee_id]
+            self.check("CSV export has a row per requirement", len(exported) == len(requirements),
+                       f"{len(exported)} rows for {len(requirements)} requirements")
+            dated = next((row for row in exported if row["requirement_id"] == requirement["id"]), {})
+            self.check("CSV export formats dates as ISO 8601",
+                       dated.get("issue_date") == "2023-06-30T00:00:00+00:00"
+                       and dated.get("expiry_date") == "2024-06-30T12:30:00+00:00"
+                       and dated.get("status") == "expired" and int(dated.get("days_until_expiry") or 0) < 0
+                       and dated.get("employee_name") == "Kit Export", str(dated))
+        
+        success, _ = self.run_test("Export Register As NDJSON", "GET", "employees/requirements/export", 200,
+                                   params={"format": "ndjson"})
+        response = self.last_response
+        if success:
+            self.check("NDJSON export content type",
+                       response.headers.get("Content-Type", "").startswith("application/x-ndjson"),
+                       response.headers.get("Content-Type"))
+            self.check("NDJSON export is an attachment",
+                       response.headers.get("Content-Disposition", "").endswith('.ndjson"'),
+                       response.headers.get("Content-Disposition"))
+            rows = [json.loads(line) for line in response.text.splitlines()]
+            dated = next((row for row in rows if row["requirement_id"] == requirement["id"]), {})
+            self.check("NDJSON export formats dates as ISO 8601",
+                       dated.get("issue_date") == "2023-06-30T00:00:00+00:00"
+                       and dated.get("expiry_date") == "2024-06-30T12:30:00+00:00"
+                       and dated.get("is_active") is True and isinstance(dated.get("days_until_expiry"), int), str(dated))
+        
+        self.run_test("Export Register As Unknown Format", "GET", "employees/requirements/export", 422,
+                      params={"format": "xlsx"})
+        
+        # Inactive employees are left out unless asked for
+        self.run_test("Deactivate Export Employee", "PUT", f"employees/{employee_id}", 200, data={"is_active": False})
+        success, _ = self.run_test("Export Register Without Inactive", "GET", "employees/requirements/export", 200,
+                                   params={"format": "ndjson"})
+        if success:
+            self.check("Export skips inactive employees", employee_id not in self.last_response.text,
+                       "inactive employee exported")
+        success, _ = self.run_test("Export Register With Inactive", "GET", "employees/requirements/export", 200,
+                                   params={"format": "ndjson", "include_inactive": "true"})
+        if success:
+            self.check("Export includes inactive employees on request", employee_id in self.last_response.text,
+                       "inactive employee missing")
+        
+        # Cleanup
+        self.run_test("Delete Export Employee", "DELETE", f"employees/{employee_id}", 200)
+        
+        return True, "Employee register export checks completed"
+
+    def test_employee_pagination(self):
+        """Test keyset pagination: cursor round-trips, bad cursors and totals after deletes"""
+        self.log("\n📄 Testing Employee Pagination...")
+        
+        for i in range(5):
+            self.run_test("Create Paged Employee", "POST", "employees", 200, data={
+                "first_name": f"Page{i}", "last_name": "Paged", "job_title": "Vet", "start_date": "2024-01-15"
+            })
+        success, everyone = self.run_test("Get All Employees", "GET", "employees", 200)
+        if not success:
+            return False, "Failed to list employees"
+        all_ids = [emp["id"] for emp in everyone]
+        total = int(self.last_response.headers.get("X-Total-Count", -1))
+        self.check("Total count matches the full list", total == len(all_ids), f"{total} != {len(all_ids)}")
+        self.check("Last page has no next cursor", "X-Next-Cursor" not in self.last_response.headers,
+                   self.last_response.headers.get("X-Next-Cursor", ""))
+        
+        # Following X-Next-Cursor visits every employee once, in the same order
+        paged_ids, cursor, first_cursor = [], None, None
+        for _ in range(len(all_ids)):
+            success, page = self.run_test("Get Employees Page", "GET", "employees", 200,
+                                          params={"limit": 2, **({"after": cursor} if cursor else {})})
+            if not success:
+                break
+            paged_ids.extend(emp["id"] for emp in page)
+            self.check("Every page reports the total", self.last_response.headers.get("X-Total-Count") == str(total),
+                       self.last_response.headers.get("X-Total-Count"))
+            cursor = self.last_response.headers.get("X-Next-Cursor")
+            first_cursor = first_cursor or cursor
+            if not cursor:
+                break
+        self.check("Cursors round-trip through every employee", paged_ids == all_ids, f"{paged_ids} != {all_ids}")
+        
+        invalid_cursors = [("Not Base64", "not*base64!"), ("Wrong Length", "YWJj"), ("Empty Padding", "=")]
+        if first_cursor:
+            invalid_cursors.append(("Stray Character", first_cursor[:4] + "*" + first_cursor[4:]))
+        for name, cursor_value in invalid_cursors:
+            self.run_test(f"Get Employees With Invalid Cursor ({name})", "GET", "employees", 400,
+                          params={"after": cursor_value})
+        self.run_test("Get Employees Over Page Size Limit", "GET", "employees", 422, params={"limit": 1001})
+        
+        # Deleting employees keeps the total accurate, and a cursor whose employee was deleted still resumes
+        paged = [emp["id"] for emp in everyone if emp["last_name"] == "Paged"]
+        deleted = [all_ids[1]] if all_ids[1] in paged else []
+        deleted += [emp_id for emp_id in paged if emp_id not in deleted][:2 - len(deleted)]
+        for employee_id in deleted:
+            self.run_test("Delete Paged Employee", "DELETE", f"employees/{employee_id}", 200)
+        success, remaining = self.run_test("Get Employees After Deletes", "GET", "employees", 200)
+        if success:
+            self.check("Total count drops with deletes",
+                       self.last_response.headers.get("X-Total-Count") == str(total - len(deleted))
+                       and len(remaining) == total - len(deleted), self.last_response.headers.get("X-Total-Count"))
+        if first_cursor:
+            success, page = self.run_test("Resume From Deleted Employee's Cursor", "GET", "employees", 200,
+                                          params={"limit": 2, "after": first_cursor})
+            expected = [emp_id for emp_id in all_ids[2:] if emp_id not in deleted][:2]
+            self.check("Cursor resumes after the deleted employee", [emp["id"] for emp in page] == expected,
+                       f"{[emp['id'] for emp in page]} != {expected}")
+        
+        # Cleanup
+        for employee_id in paged:
+            if employee_id not in deleted:
+                self.run_test("Delete Paged Employee", "DELETE", f"employees/{employee_id}", 200)
+        
+        return True, "Employee pagination checks completed"
+
+    def test_employee_import(self):
+        """Test the CSV employee import: valid rows, per-row failures and the row cap"""
+        self.log("\n📥 Testing Employee CSV Import...")
+        header = "first_name,last_name,email,job_title,department,start_date\n"
+        
+        def upload(name, content, expected_status=200):
+            return self.run_test(name, "POST", "employees/import", expected_status,
+                                 files={"file": ("employees.csv", content.encode("utf-8"), "text/csv")})
+        
+        # A valid file creates every employee along with their sector requirements
+        success, report = upload("Import Valid CSV", header + (
+            "Ada,Import,ada.import@testvet.com,Veterinary Nurse,Clinical,2024-02-01\n"
+            "Ben,Import,,Receptionist,,2024-03-15\n"
+        ))
+        if not success:
+            return False, "Failed to import a valid CSV"
+        self.check("Valid CSV imports every row",
+                   report == {"imported": 2, "failed": 0, "errors": [], "errors_truncated": False}, str(report))
+        
+        success, employees = self.run_test("Get Imported Employees", "GET", "employees", 200)
+        imported = [emp for emp in employees if emp["last_name"] == "Import"]
+        self.check("Imported employees are listed", sorted(emp["first_name"] for emp in imported) == ["Ada", "Ben"],
+                   str([emp["first_name"] for emp in imported]))
+        if imported:
+            success, requirements = self.run_test(
+                "Get Imported Employee Requirements", "GET", f"employees/{imported[0]['id']}/requirements", 200
+            )
+            self.check("Imported employees get their sector requirements", len(requirements) > 0, str(requirements))
+        
+        # Invalid rows are reported by row number while the valid rows around them still import
+        success, report = upload("Import CSV With Invalid Rows", header + (
+            "Cara,Import,,Practice Manager,,2024-04-01\n"
+            "Dan,Partial,,Vet,,15/01/2024\n"
+            "Eve,Partial,,,,2024-01-15\n"
+            "Fay,Partial,not-an-email,Vet,,2024-01-15\n"
+        ))
+        if success:
+            self.check("Partial import counts", (report["imported"], report["failed"]) == (1, 3), str(report))
+            self.check("Partial import reports failing rows", [err["row"] for err in report["errors"]] == [3, 4, 5],
+                       str(report["errors"]))
+            messages = [" ".join(err["errors"]) for err in report["errors"]]
+            self.check("Bad start_date is reported", len(messages) == 3 and "start_date" in messages[0], str(messages))
+            self.check("Missing job_title is reported", len(messages) == 3 and "job_title" in messages[1], str(messages))
+            self.check("Bad email is reported", len(messages) == 3 and "email" in messages[2], str(messages))
+        
+        upload("Import CSV Missing Columns", "first_name,last_name\nGus,Import\n", 400)
+        self.run_test("Import Non-UTF-8 File", "POST", "employees/import", 400,
+                      files={"file": ("employees.csv", "first_name\xff\n".encode("latin-1"), "text/csv")})
+        
+        # Rows past the cap are not read; rows without a job_title fail validation and write nothing
+        row_cap = 10000
+        success, report = upload("Import CSV Over Row Cap", header + "Hal,Capped,,,,2024-01-15\n" * (row_cap + 5))
+        if success:
+            self.check("Row cap stops the import", report["imported"] == 0 and report["failed"] == row_cap + 1,
+                       f"imported {report['imported']}, failed {report['failed']}")
+            last_error = report["errors"][-1] if report["errors"] else {}
+            self.check("Row cap is reported past the error limit",
+                       last_error.get("row") == row_cap + 2 and "limited" in " ".join(last_error.get("errors", []))
+                       and report["errors_truncated"], str(last_error))
+        
+        # Cleanup
+        success, employees = self.run_test("Get Employees After Import", "GET", "employees", 200)
+        for emp in employees:
+            if emp["last_name"] == "Import":
+                self.run_test("Delete Imported Employee", "DELETE", f"employees/{emp['id']}", 200)
+        
+        return True, "Employee import checks completed"
+
     def run_comprehensive_test(self):
         """Run all tests in sequence"""
         self.log("🚀 Starting SimplyComply API Tests")
@@ -404,11 +813,16 @@ class SimplyComplyAPITester:
         self.log("\n📊 Testing Dashboard & Data...")
         self.test_dashboard_stats()
         self.test_checklist_operations()
+        self.test_compliance_item_batch()
         self.test_documents_operations()
         self.test_notifications()
         
         # Test employee operations
         self.test_employee_operations()
+        self.test_employee_import()
+        self.test_bulk_requirement_update()
+        self.test_employee_register_export()
+        self.test_employee_pagination()
         
         return self.print_results()
 
@@ -428,7 +842,8 @@ class SimplyComplyAPITester:
         return 0 if len(self.failed_tests) == 0 else 1
 
 def main():
-    tester = SimplyComplyAPITester()
+    # An optional argument points the tests at another deployment, e.g. http://localhost:8001/api
+    tester = SimplyComplyAPITester(*sys.argv[1:2])
     return tester.run_comprehensive_test()
 
 if __name__ == "__main__":